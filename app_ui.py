@@ -1,18 +1,152 @@
+import os
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from backend.parsers import load_processes, load_resources, load_actions
+from backend.parsers import load_resources
+from backend.cache import WorkloadCache, DEFAULT_CACHE_DIR
 from backend.scheduling import fifo, sjf, srt, rr, priority_np
-from backend.sincronizacion import SincronizacionSimulator
-from backend.calendarizacion import CalendarizacionSimulator
-from backend.engine import SimulationEngine
-from backend.metrics import compute_metrics
-import threading
-import time
+from backend.jobs import SimulationPool
+from backend.eventlog import EventLog, write_event_log, log_path, LOG_SUFFIX
+from backend.async_engine import AsyncPlaybackEngine, AsyncPlayer, run_many
+from backend.gantt import GanttLayout, GanttIndex, FrameQueue, X_SCALE, ROW_HEIGHT
+
+# Render: la cola de eventos se vacía en el main loop de Tk cada FRAME_MS,
+# dibujando a lo sumo MAX_EVENTS_PER_FRAME por frame
+FRAME_MS = 16
+MAX_EVENTS_PER_FRAME = 2000
+SYNC_KEY = "sync"
+ALGORITHMS = ["FIFO", "SJF", "SRT", "Round Robin", "Priority"]
+# Cada cuánto se consulta si terminaron los cálculos del pool
+POLL_MS = 50
+# Zoom horizontal (píxeles por ciclo) y ancho mínimo para rotular un evento
+MIN_X_SCALE = 1e-4
+MAX_X_SCALE = 120
+MIN_LABEL_PX = 24
+
+class VirtualGantt:
+    """
+    Gantt virtualizado sobre un tk.Canvas. El scrollregion cubre todo lo
+    reproducido, pero solo existen los items de la ventana visible: se
+    rehacen (a lo sumo una vez por idle) al hacer scroll, zoom, resize o
+    cuando la animación revela eventos dentro de la ventana. Con poco zoom,
+    GanttIndex entrega barras resumen (una por píxel) en vez de eventos.
+    Ctrl + rueda del mouse hace zoom alrededor del puntero.
+
+    style(ev) -> (relleno, borde, color de texto) de cada evento.
+    """
+
+    def __init__(self, app, canvas, h_scroll, v_scroll, events, layout, style):
+        self.app = app
+        self.canvas = canvas
+        self.layout = layout
+        self.index = GanttIndex(events, layout)
+        self.style = style
+        self.pids = list(layout.rows)
+        self.x_scale = float(X_SCALE)
+        self.until = -1          # último ciclo reproducido
+        self.until_end = 0       # máximo end entre los eventos revelados
+        self.items = {}          # id de item → evento o barra
+        self.window = (0, float("inf"))  # ciclos visibles en el último redibujo
+        self._job = None
+
+        def on_x(*args):
+            h_scroll.set(*args)
+            self.schedule_redraw()
+        def on_y(*args):
+            v_scroll.set(*args)
+            self.schedule_redraw()
+        canvas.configure(xscrollcommand=on_x, yscrollcommand=on_y)
+        canvas.tag_bind("evento", "<Button-1>", self.on_click)
+        canvas.bind("<Control-MouseWheel>", lambda e: self.zoom(2 if e.delta > 0 else 0.5, e.x))
+        canvas.bind("<Control-Button-4>", lambda e: self.zoom(2, e.x))
+        canvas.bind("<Control-Button-5>", lambda e: self.zoom(0.5, e.x))
+        self.update_scrollregion()
+
+    def reveal(self, cycle, events=()):
+        """Avanza la animación hasta 'cycle' con los eventos que arrancaron."""
+        self.until = cycle
+        if events:
+            self.until_end = max(self.until_end, max(ev.end for ev in events))
+            self.update_scrollregion()
+            c0, c1 = self.window
+            if min(ev.start for ev in events) < c1 and self.until_end > c0:
+                self.schedule_redraw()
+
+    def update_scrollregion(self):
+        width = max(self.until_end * self.x_scale, 1)
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.pids) * ROW_HEIGHT))
+
+    def zoom(self, factor, x=0):
+        new = min(MAX_X_SCALE, max(MIN_X_SCALE, self.x_scale * factor))
+        if new == self.x_scale:
+            return
+        c = self.canvas
+        # Mantener fijo el ciclo bajo el puntero
+        cycle = c.canvasx(x) / self.x_scale
+        self.x_scale = new
+        self.update_scrollregion()
+        width = max(self.until_end * new, 1)
+        c.xview_moveto(max(0.0, (cycle * new - x) / width))
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        if self._job is None:
+            self._job = self.canvas.after_idle(self.redraw)
+
+    def redraw(self):
+        self._job = None
+        c = self.canvas
+        x0, x1 = c.canvasx(0), c.canvasx(c.winfo_width())
+        y0, y1 = c.canvasy(0), c.canvasy(c.winfo_height())
+        cycles_per_px = 1 / self.x_scale
+        c0, c1 = int(x0 * cycles_per_px), int(x1 * cycles_per_px) + 1
+        r0, r1 = int(y0 // ROW_HEIGHT), int(y1 // ROW_HEIGHT) + 1
+        self.window = (c0, c1)
+        events, bars = self.index.visible(c0, c1, r0, r1, cycles_per_px, self.until)
+
+        c.delete("all")
+        items = self.items = {}
+        for ev in events:
+            x1, y1, x2, y2 = self.layout.box(ev, self.x_scale)
+            fill, outline, text_color = self.style(ev)
+            rect = c.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, tags="evento")
+            items[rect] = ev
+            if x2 - x1 >= MIN_LABEL_PX:
+                text = c.create_text((x1 + x2) / 2, (y1 + y2) / 2,
+                                     text=ev.pid, fill=text_color, tags="evento")
+                items[text] = ev
+        for bar in bars:
+            y1 = bar.row * ROW_HEIGHT
+            # al menos un píxel de ancho para que la barra se vea
+            x1 = bar.start * self.x_scale
+            x2 = max(bar.end * self.x_scale, x1 + 1)
+            color = self.layout.colors[self.pids[bar.row]]
+            rect = c.create_rectangle(x1, y1, x2, y1 + ROW_HEIGHT - 5,
+                                      fill=color, outline="", tags="evento")
+            items[rect] = bar
+
+    def on_click(self, e):
+        current = self.canvas.find_withtag("current")
+        item = self.items.get(current[0]) if current else None
+        if item is None:
+            return
+        if hasattr(item, "pid"):
+            self.app.show_event_details(item)
+        else:
+            messagebox.showinfo(
+                "Resumen",
+                f"PID: {self.pids[item.row]}\n"
+                f"Ciclos: {item.start} → {item.end}\n"
+                f"Eventos: {item.count}\n"
+                "(Ctrl + rueda para acercar)"
+            )
 
-# Parámetros de dibujo
-X_SCALE = 30
-ROW_HEIGHT = 30
+    def clear(self):
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+        self.canvas.delete("all")
+        self.items = {}
 
 class SimulationApp(ctk.CTk):
     def __init__(self):
@@ -28,11 +162,22 @@ class SimulationApp(ctk.CTk):
         self.resources = []
         self.actions = []
         self.delay = 0.5
-
-        self.color_map = {}
+        # Workloads ya parseados se recargan desde la cache binaria
+        self.workload_cache = WorkloadCache()
+        # Las simulaciones se calculan en otros procesos (un worker por algoritmo);
+        # sus ScheduleCache reutilizan los timelines ya calculados
+        self.pool = SimulationPool(max_workers=len(ALGORITHMS), cache_dir=DEFAULT_CACHE_DIR)
+        self.pending = None
+        self._poll_job = None
+
+        self.views = {}
         self.last_metrics = {}
         self.sim_events = {}
-        self._pause_event = threading.Event()
+        # Animación: un engine por timeline, todos en el loop de asyncio del player
+        self.player = AsyncPlayer()
+        self.engines = []
+        self.frames = None
+        self._frame_job = None
         self._running = False
 
         # Layout principal
@@ -65,8 +210,7 @@ class SimulationApp(ctk.CTk):
         self.alg_vars = {}
         algo_frame = ctk.CTkFrame(cal)
         algo_frame.pack(padx=10, pady=5, anchor="w")
-        names = ["FIFO","SJF","SRT","Round Robin","Priority"]
-        for i,name in enumerate(names):
+        for i,name in enumerate(ALGORITHMS):
             var = tk.BooleanVar(value=(name=="FIFO"))
             var.trace_add('write', self.update_quantum_state)
             chk = ctk.CTkCheckBox(algo_frame, text=name, variable=var)
@@ -90,8 +234,16 @@ class SimulationApp(ctk.CTk):
         self.scroll_sync.pack(fill="both", padx=10, pady=(0,10))
         ctk.CTkLabel(sync, text="Modo de sincronización:")\
             .pack(padx=10, pady=(5,2), anchor="w")
-        self.mode_menu = ctk.CTkOptionMenu(sync, values=["mutex","semaphore"])
+        self.mode_menu = ctk.CTkOptionMenu(sync, values=["mutex","semaphore","rwlock","rwlock-writers"])
         self.mode_menu.set("mutex"); self.mode_menu.pack(padx=10, pady=2, anchor="w")
+        # Colas FIFO: quien espera reintenta; el recurso se retiene 'hold' ciclos
+        self.queued_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(sync, text="Colas de espera (FIFO)", variable=self.queued_var)\
+            .pack(padx=10, pady=(5,2), anchor="w")
+        ctk.CTkLabel(sync, text="Hold (ciclos):").pack(padx=10, pady=(5,2), anchor="w")
+        self.hold_entry = ctk.CTkEntry(sync, placeholder_text="1")
+        self.hold_entry.insert(0, "1")
+        self.hold_entry.pack(padx=10, pady=2, anchor="w")
 
         # --- Controles de ejecución ---
         execf = ctk.CTkFrame(ctrl)
@@ -109,6 +261,11 @@ class SimulationApp(ctk.CTk):
                                           command=self.on_delay_change)
         self.delay_slider.set(self.delay)
         self.delay_slider.grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky="we")
+        # Guardar lo calculado / reproducir lo guardado sin recalcular
+        ctk.CTkButton(execf, text="Guardar log", command=self.save_logs)\
+            .grid(row=2, column=0, padx=5, pady=5)
+        ctk.CTkButton(execf, text="Abrir log", command=self.open_logs)\
+            .grid(row=2, column=1, padx=5, pady=5)
 
         # --- Panel de consulta ---
         consulta = ctk.CTkFrame(ctrl)
@@ -139,11 +296,13 @@ class SimulationApp(ctk.CTk):
 
     def on_delay_change(self, v):
         self.delay = v
+        for engine in self.engines:
+            self.player.call(engine.set_delay, v)
 
     def load_processes_cal(self):
         path = filedialog.askopenfilename(filetypes=[("Txt","*.txt")])
         if not path: return
-        self.processes = load_processes(path)
+        self.processes = self.workload_cache.load_processes(path)
         self.clear_frame(self.scroll_proc)
         for p in self.processes:
             ctk.CTkLabel(self.scroll_proc,
@@ -153,7 +312,7 @@ class SimulationApp(ctk.CTk):
     def load_processes_sync(self):
         path = filedialog.askopenfilename(filetypes=[("Txt","*.txt")])
         if not path: return
-        self.processes = load_processes(path)
+        self.processes = self.workload_cache.load_processes(path)
         self.refresh_sync_display()
 
     def load_resources_sync(self):
@@ -165,7 +324,7 @@ class SimulationApp(ctk.CTk):
     def load_actions_sync(self):
         path = filedialog.askopenfilename(filetypes=[("Txt","*.txt")])
         if not path: return
-        self.actions = load_actions(path)
+        self.actions = self.workload_cache.load_actions(path)
         self.refresh_sync_display()
 
     def refresh_sync_display(self):
@@ -196,174 +355,259 @@ class SimulationApp(ctk.CTk):
             w.destroy()
 
     def execute_simulation(self):
-        if self._running:
+        if self._running or self.pending is not None:
             return
-        self._pause_event.clear()
         is_calendar = (self.tabview.get() == "Calendarización")
         selected = [alg for alg,var in self.alg_vars.items() if var.get()]
         if is_calendar:
             if not selected:
                 messagebox.showwarning("Atención", "Selecciona al menos un algoritmo")
                 return
-            self.sim_events.clear()
-            self.last_metrics.clear()
-            max_cycle = 0
             quantum = int(self.quantum_entry.get() or 0)
-            for alg in selected:
-                sim = CalendarizacionSimulator()
-                sim.processes = self.processes
-                sim.configure(alg, quantum if alg=="Round Robin" else None)
-                evs = sim.get_events()
-                self.sim_events[alg] = evs
-                m = compute_metrics(evs, self.processes)
-                self.last_metrics[alg] = m
-                max_cycle = max(max_cycle, max(e.end for e in evs))
-            texto = "\n".join(
-                f"{alg}: WT={self.last_metrics[alg]['avg_waiting_time']:.1f}, "
-                f"TA={self.last_metrics[alg]['avg_turnaround_time']:.1f}"
-                for alg in selected
-            )
-            messagebox.showinfo("Métricas por algoritmo", texto)
-            self.build_gantt_canvases(selected)
-            self.populate_pid_menu([p.pid for p in self.processes])
-            self._running = True
-            threading.Thread(target=lambda: self.run_multi(selected, max_cycle),
-                             daemon=True).start()
+            futures = self.pool.submit_schedules(self.processes, selected, quantum)
+            self.wait_results(futures, lambda results: self.show_schedules(selected, results))
         else:
-            # 1) Limpiar cualquier Gantt previo
-            for w in self.multi_gantt.winfo_children():
-                w.destroy()
-
-            # 2) Configurar simulador de sincronización
-            sim = SincronizacionSimulator()
-            sim.processes, sim.resources, sim.actions = (
-                self.processes, self.resources, self.actions
-            )
-            sim.configure(self.mode_menu.get())
-            evs      = sim.get_events()
-            max_c    = sim.get_max_cycle()
-            acc      = sum(1 for e in evs if e.status=="ACCESED")
-            waits    = sum(1 for e in evs if e.status!="ACCESED")
-            messagebox.showinfo("Métricas de Sincronización",
-                                f"Accesos: {acc}\nEsperas: {waits}")
-
-            # 3) Crear canvas exclusivo para sincronización
-            container = tk.Frame(self.multi_gantt)
-            container.pack(fill="both", expand=True)
-            self.sync_canvas = tk.Canvas(container, bg="white", height=ROW_HEIGHT* len(self.processes))
-            v_scroll = tk.Scrollbar(container, orient="vertical", command=self.sync_canvas.yview)
-            h_scroll = tk.Scrollbar(self.multi_gantt, orient="horizontal", command=self.sync_canvas.xview)
-            self.sync_canvas.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
-
-            self.sync_canvas.pack(side="left", fill="both", expand=True)
-            v_scroll.pack(side="right", fill="y")
-            h_scroll.pack(side="bottom", fill="x")
+            future = self.pool.submit_sync(
+                self.processes, self.resources, self.actions, self.mode_menu.get(),
+                queued=self.queued_var.get(), hold=int(self.hold_entry.get() or 1), top=3)
+            self.wait_results({SYNC_KEY: future}, lambda results: self.show_sync(results[SYNC_KEY]))
 
-            # 4) Lanzar animación de sincronización
-            self._running = True
-            self._pause_event.clear()
-            threading.Thread(target=lambda: self.run_sync(evs, max_c), daemon=True).start()
-    
-    def run_sync(self, events, max_cycle):
+    def wait_results(self, futures, on_done):
         """
-        Dibuja cada evento de sincronización en self.sync_canvas,
-        iterando ciclos por ev.start. Cada fila es un proceso (PID).
-        Eventos 'ACCESED' en verde, 'WAITING' en rojo.
+        Deja 'futures' en curso y los consulta con after() hasta que
+        terminen todos; recién ahí llama on_done({clave: resultado}) en el
+        main loop. Mientras tanto la ventana sigue respondiendo.
         """
-        # Índice de procesos → fila en el canvas
-        process_index = {p.pid: i for i, p in enumerate(self.processes)}
-
-        for cycle in range(max_cycle + 1):
-            # pausa/resume
-            while self._pause_event.is_set():
-                time.sleep(0.1)
-            if not self._running:
-                break
-
-            # etiqueta de ciclo
-            self.cycle_label.configure(text=f"Ciclo: {cycle}")
-
-            # dibuja los eventos que empiezan en este ciclo
-            for ev in events:
-                if ev.start == cycle:
-                    # cálculo de coordenadas
-                    x1 = cycle * X_SCALE
-                    x2 = ev.end * X_SCALE
-                    row = process_index[ev.pid]
-                    y1 = row * ROW_HEIGHT
-                    y2 = y1 + ROW_HEIGHT - 5
-
-                    # color según estado
-                    if ev.status == "ACCESED":
-                        color = "#4CAF50"   # verde
-                        text_color = "white"
-                    else:
-                        color = "#F44336"   # rojo
-                        text_color = "black"
-
-                    # rectángulo del evento
-                    rect = self.sync_canvas.create_rectangle(
-                        x1, y1, x2, y2,
-                        fill=color, outline="black"
-                    )
-                    # texto con el PID
-                    self.sync_canvas.create_text(
-                        (x1 + x2) / 2, (y1 + y2) / 2,
-                        text=ev.pid, fill=text_color
-                    )
-                    # bind para detalles
-                    self.sync_canvas.tag_bind(
-                        rect, "<Button-1>",
-                        lambda e, ev=ev: self.show_event_details(ev)
-                    )
-
-            # ajustar scrollregion al contenido
-            self.sync_canvas.configure(
-                scrollregion=self.sync_canvas.bbox("all")
-            )
+        self.pending = futures
+        self.cycle_label.configure(text="Calculando…")
+        self._poll_job = self.after(POLL_MS, self.poll_results, futures, on_done)
+
+    def poll_results(self, futures, on_done):
+        if futures is not self.pending:
+            return  # descartado por Reset
+        if not all(f.done() for f in futures.values()):
+            done = sum(self.pool.progress(f) for f in futures.values()) / len(futures)
+            self.cycle_label.configure(text=f"Calculando… {done:.0%}")
+            self._poll_job = self.after(POLL_MS, self.poll_results, futures, on_done)
+            return
+        self.pending = None
+        self._poll_job = None
+        self.cycle_label.configure(text="Ciclo: 0")
+        try:
+            results = {key: f.result() for key, f in futures.items()}
+        except Exception as e:
+            messagebox.showerror("Error en la simulación", str(e))
+            return
+        on_done(results)
+
+    def show_schedules(self, selected, results):
+        self.clear_gantts()
+        # El pool puede devolver un EventTable, que crea los Event al
+        # recorrerlo: se materializa una vez y la lista la comparten el
+        # layout, el índice del Gantt y el engine
+        self.sim_events = {alg: list(results[alg].events) for alg in selected}
+        self.last_metrics = {alg: results[alg].metrics for alg in selected}
+        max_cycle = max(results[alg].max_cycle for alg in selected)
+        texto = "\n".join(
+            f"{alg}: WT={self.last_metrics[alg]['avg_waiting_time']:.1f}, "
+            f"TA={self.last_metrics[alg]['avg_turnaround_time']:.1f}"
+            for alg in selected
+        )
+        messagebox.showinfo("Métricas por algoritmo", texto)
+        self.build_gantt_canvases(selected)
+        self.populate_pid_menu([p.pid for p in self.processes])
+        frames = FrameQueue()
+        self.start_playback(frames, [
+            AsyncPlaybackEngine(
+                self.sim_events[alg],
+                lambda c, evs, alg=alg: frames.push(alg, c, evs),
+                max_cycle, self.delay)
+            for alg in selected
+        ])
+
+    def show_sync(self, result):
+        # 1) Limpiar cualquier Gantt previo
+        self.clear_gantts()
+
+        # 2) Resultado de la simulación de sincronización
+        evs      = list(result.events)
+        self.sim_events = {SYNC_KEY: evs}
+        max_c    = result.max_cycle
+        m        = result.metrics
+        hot      = "\n".join(
+            f"  {name}: {m['per_resource'][name]['wait_total']} ciclos de espera, "
+            f"uso {m['per_resource'][name]['utilization']:.0%}"
+            for name in m["hot_resources"]
+        )
+        messagebox.showinfo("Métricas de Sincronización",
+                            f"Accesos: {m['acquisitions']}\nEsperas: {m['waits']}\n"
+                            f"Espera media/máx: {m['avg_wait']:.2f} / {m['max_wait']}\n"
+                            f"Recursos más disputados:\n{hot}")
+
+        # 3) Crear canvas exclusivo para sincronización (a lo sumo 20 filas a la vista)
+        container = tk.Frame(self.multi_gantt)
+        container.pack(fill="both", expand=True)
+        self.sync_canvas = tk.Canvas(container, bg="white",
+                                     height=ROW_HEIGHT * min(len(self.processes), 20))
+        v_scroll = tk.Scrollbar(container, orient="vertical", command=self.sync_canvas.yview)
+        h_scroll = tk.Scrollbar(self.multi_gantt, orient="horizontal", command=self.sync_canvas.xview)
+
+        self.sync_canvas.pack(side="left", fill="both", expand=True)
+        v_scroll.pack(side="right", fill="y")
+        h_scroll.pack(side="bottom", fill="x")
+
+        # 4) Lanzar animación de sincronización
+        layout = GanttLayout(evs, [p.pid for p in self.processes])
+        self.views[SYNC_KEY] = VirtualGantt(self, self.sync_canvas, h_scroll, v_scroll,
+                                            evs, layout, self.sync_style)
+        frames = FrameQueue()
+        self.start_playback(frames, [
+            AsyncPlaybackEngine(evs, lambda c, evs: frames.push(SYNC_KEY, c, evs),
+                                max_c, self.delay)
+        ])
+
+    def save_logs(self):
+        """Guarda cada timeline mostrado en un log binario (uno por algoritmo)."""
+        if not self.sim_events:
+            messagebox.showwarning("Atención", "No hay ninguna simulación para guardar")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=LOG_SUFFIX,
+                                            filetypes=[("Log de eventos", "*" + LOG_SUFFIX)])
+        if not path: return
+        for label, events in self.sim_events.items():
+            target = path if len(self.sim_events) == 1 else log_path(path, label)
+            write_event_log(events, target, label)
 
-            time.sleep(self.delay)
+    def open_logs(self):
+        """
+        Reproduce logs guardados, cada uno en su Gantt, sin recalcular. Cada
+        log se recorre una sola vez: la lista de eventos resultante la
+        comparten el Gantt y el engine, y el archivo se cierra enseguida.
+        """
+        if self._running or self.pending is not None:
+            return
+        paths = filedialog.askopenfilenames(filetypes=[("Log de eventos", "*" + LOG_SUFFIX)])
+        if not paths: return
+        self.reset_simulation()
+        timelines, actions, max_cycle = {}, set(), 0
+        try:
+            for path in paths:
+                with EventLog(path) as log:
+                    label = log.label or os.path.basename(path)
+                    timelines[label] = list(log)
+                    max_cycle = max(max_cycle, log.max_end())
+                    if log.actions:
+                        actions.add(label)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error al abrir el log", str(e))
+            return
+        self.sim_events = timelines
+        self.build_gantt_canvases(list(timelines))
+        for label in actions:
+            self.views[label].style = self.sync_style
+        frames = FrameQueue()
+        self.start_playback(frames, [
+            AsyncPlaybackEngine(events, lambda c, evs, label=label: frames.push(label, c, evs),
+                                max_cycle, self.delay)
+            for label, events in timelines.items()
+        ])
+
+    def start_playback(self, frames, engines):
+        """
+        Corre los engines en el loop del player. Los engines solo encolan
+        en 'frames'; todo lo que toca Tk ocurre en render_frame, en el main
+        loop. Al terminar todos los engines se cierra la cola.
+        """
+        self.engines = engines
+        self.frames = frames
+        self._running = True
+        future = self.player.submit(run_many(engines))
+        future.add_done_callback(lambda f: frames.close())
+        self._frame_job = self.after(FRAME_MS, self.render_frame, frames)
+
+    def render_frame(self, frames):
+        """
+        Un frame: junta todos los ciclos encolados desde el anterior y los
+        revela de una vez en cada Gantt, que redibuja solo si tocan su
+        ventana visible.
+        """
+        if frames is not self.frames:
+            return  # corrida descartada por Reset o por una nueva simulación
+        frame = frames.drain(MAX_EVENTS_PER_FRAME)
+        if frame.cycle is not None:
+            for key, view in self.views.items():
+                view.reveal(frame.cycle, frame.batches.get(key))
+            self.cycle_label.configure(text=f"Ciclo: {frame.cycle}")
+        if frame.closed:
+            self._frame_job = None
+            self._running = False
+            self.cycle_label.configure(text="¡Listo!")
+        else:
+            # Si quedó trabajo pendiente, el próximo frame va sin espera
+            self._frame_job = self.after(1 if frame.pending else FRAME_MS,
+                                         self.render_frame, frames)
 
-        self._running = False
-        self.cycle_label.configure(text="¡Listo!")
+    @staticmethod
+    def sync_style(ev):
+        """Eventos 'ACCESED' en verde, 'WAITING' en rojo."""
+        if ev.status == "ACCESED":
+            return "#4CAF50", "black", "white"
+        return "#F44336", "black", "black"
 
     def pause_simulation(self):
         if not self._running:
             return
-        if self._pause_event.is_set():
-            self._pause_event.clear()
-        else:
-            self._pause_event.set()
-
-    def reset_simulation(self):
-        # Detener cualquier animación en curso
+        for engine in self.engines:
+            self.player.call(engine.toggle_pause)
+
+    def stop_playback(self):
+        for engine in self.engines:
+            self.player.call(engine.stop)
+        self.engines = []
+        self.frames = None
+        if self._frame_job is not None:
+            self.after_cancel(self._frame_job)
+            self._frame_job = None
         self._running = False
-        self._pause_event.clear()
 
-        # 1) Limpiar todos los Gantt de calendarización
-        if hasattr(self, 'gantt_canvases'):
-            for canvas in self.gantt_canvases.values():
-                canvas.delete("all")
+    def cancel_pending(self):
+        """
+        Aborta los cálculos en curso: los que no empezaron no corren y los
+        que corren se detienen en su próxima revisión y sueltan su memoria.
+        """
+        if self.pending is not None:
+            self.pool.cancel()
+            self.pending = None
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
 
-        # 2) Limpiar Gantt de sincronización (si existe)
-        if hasattr(self, 'sync_canvas'):
-            self.sync_canvas.delete("all")
+    def reset_simulation(self):
+        # Detener cualquier cálculo o animación en curso
+        self.cancel_pending()
+        self.stop_playback()
 
-        # 3) Limpiar el contenedor principal de multi_gantt
-        for widget in self.multi_gantt.winfo_children():
-            widget.destroy()
+        # 1) Limpiar todos los Gantt (calendarización y sincronización)
+        self.clear_gantts()
 
-        # 4) Resetear los datos de color y métricas
-        self.color_map.clear()
+        # 2) Resetear los datos de métricas
         self.last_metrics.clear()
-        self.sim_events.clear()
+        self.sim_events = {}
 
-        # 5) Restaurar etiquetas y menús
+        # 3) Restaurar etiquetas y menús
         self.cycle_label.configure(text="Ciclo: 0")
         self.pid_menu.configure(values=[])
         self.pid_menu.set("")  # opcional: deseleccionar cualquier PID
         self.detail_label.configure(text="Seleccione un PID para ver métricas")
 
+    def clear_gantts(self):
+        """Suelta las vistas (y sus índices) y destruye sus widgets."""
+        for view in self.views.values():
+            view.clear()
+        self.views.clear()
+        for w in self.multi_gantt.winfo_children():
+            w.destroy()
+
     def build_gantt_canvases(self, algos):
         """
         Crea un block por algoritmo con:
@@ -373,10 +617,8 @@ class SimulationApp(ctk.CTk):
         Usamos PACK exclusivamente para no mezclar gestores.
         """
         # 1) limpia previos
-        for w in self.multi_gantt.winfo_children():
-            w.destroy()
+        self.clear_gantts()
 
-        self.gantt_canvases = {}
         for alg in algos:
             # contenedor principal
             frm = ctk.CTkFrame(self.multi_gantt)
@@ -392,52 +634,21 @@ class SimulationApp(ctk.CTk):
             # 2) crea el Canvas y el scroll vertical
             canvas = tk.Canvas(container, bg="white", height=150)
             v_scroll = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
-            canvas.configure(yscrollcommand=v_scroll.set)
 
             canvas.pack(side="left", fill="both", expand=True)
             v_scroll.pack(side="right", fill="y")
 
             # 3) crea el scroll horizontal **en el frame principal**, ocupando todo el ancho
             h_scroll = tk.Scrollbar(frm, orient="horizontal", command=canvas.xview)
-            canvas.configure(xscrollcommand=h_scroll.set)
 
             h_scroll.pack(side="bottom", fill="x")
 
-            # 4) guarda referencias para el run_multi
-            self.gantt_canvases[alg] = canvas
-            self.color_map[alg] = {}
-
-
-    def run_multi(self, algos, max_cycle):
-        for cycle in range(max_cycle+1):
-            while self._pause_event.is_set():
-                time.sleep(0.1)
-            if not self._running:
-                break
-            self.cycle_label.configure(text=f"Ciclo: {cycle}")
-            for alg in algos:
-                canvas = self.gantt_canvases[alg]
-                for ev in self.sim_events[alg]:
-                    if ev.start == cycle:
-                        pid = ev.pid
-                        cmap = self.color_map[alg]
-                        if pid not in cmap:
-                            import random
-                            r,g,b = [random.randint(100,255) for _ in range(3)]
-                            cmap[pid] = f"#{r:02X}{g:02X}{b:02X}"
-                        color = cmap[pid]
-                        x1, x2 = ev.start*X_SCALE, ev.end*X_SCALE
-                        idx = list(cmap).index(pid)
-                        y1, y2 = idx*ROW_HEIGHT, idx*ROW_HEIGHT+ROW_HEIGHT-5
-                        rect = canvas.create_rectangle(x1,y1,x2,y2,
-                                                       fill=color, outline=color)
-                        canvas.create_text((x1+x2)/2,(y1+y2)/2, text=pid, fill="white")
-                        canvas.tag_bind(rect, "<Button-1>",
-                                        lambda e, ev=ev: self.show_event_details(ev))
-                        canvas.configure(scrollregion=canvas.bbox("all"))
-            time.sleep(self.delay)
-        self._running = False
-        self.cycle_label.configure(text="¡Listo!")
+            # 4) vista virtualizada: filas y colores por PID, solo lo visible en el canvas
+            layout = GanttLayout(self.sim_events[alg])
+            self.views[alg] = VirtualGantt(
+                self, canvas, h_scroll, v_scroll, self.sim_events[alg], layout,
+                lambda ev, colors=layout.colors: (colors[ev.pid], colors[ev.pid], "white")
+            )
 
     def populate_pid_menu(self, pid_list):
         self.pid_menu.configure(values=pid_list)
@@ -465,6 +676,11 @@ class SimulationApp(ctk.CTk):
         )
         messagebox.showinfo("Detalle de Evento", text)
 
+    def destroy(self):
+        self.cancel_pending()
+        self.pool.shutdown()
+        super().destroy()
+
 if __name__ == "__main__":
     app = SimulationApp()
     app.mainloop()
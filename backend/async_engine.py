@@ -0,0 +1,167 @@
+"""
+Reproducción de timelines sobre asyncio.
+
+AsyncPlaybackEngine avanza los ciclos contra el reloj monotónico del loop:
+el tick k se programa en base + k·delay, así que el trabajo de cada ciclo
+no se acumula como deriva. Pausa, reanudación, seek y cambio de delay son
+eventos de asyncio (sin polling), y varios engines pueden correr a la vez
+en el mismo loop con run_many. AsyncPlayer mantiene ese loop en un hilo
+propio para usarlo desde la interfaz.
+"""
+import asyncio
+import bisect
+import threading
+from concurrent.futures import Future
+from typing import Callable, Coroutine, Iterable, List
+
+from backend.engine import SimulationEngine
+from backend.scheduling import Event
+
+class AsyncPlaybackEngine(SimulationEngine):
+    """
+    SimulationEngine con ritmo controlado por asyncio. Los métodos pause,
+    resume, toggle_pause, seek, set_delay y stop deben llamarse desde el
+    hilo del loop (desde otro hilo, vía AsyncPlayer.call).
+    """
+
+    def __init__(
+        self,
+        events: List[Event],
+        on_cycle: Callable[[int, List[Event]], None],
+        max_cycle: int,
+        delay: float = 0.5,
+        sparse: bool = False
+    ):
+        super().__init__(events, on_cycle, max_cycle, sparse)
+        self.delay = delay
+        self._loop = None
+        self._resumed = None   # asyncio.Event: set = corriendo
+        self._wake = None      # interrumpe la espera entre ticks
+        self._start_paused = False
+        self._base = 0.0
+        self._ticks = 0
+
+    # -- control (hilo del loop) --------------------------------------------
+
+    @property
+    def paused(self) -> bool:
+        if self._resumed is None:
+            return self._start_paused
+        return not self._resumed.is_set()
+
+    def pause(self):
+        if self._resumed is None:
+            self._start_paused = True
+        else:
+            self._resumed.clear()
+
+    def resume(self):
+        if self._resumed is None:
+            self._start_paused = False
+        else:
+            self._resumed.set()
+
+    def toggle_pause(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def stop(self):
+        self._running = False
+        self.resume()
+        self._interrupt(0.0)
+
+    def seek(self, cycle: int):
+        """Salta a 'cycle'; el siguiente tick se dispara de inmediato."""
+        if self.sparse:
+            self._pos = bisect.bisect_left(self._cycles, cycle)
+            self.current = (self._cycles[self._pos] if self._pos < len(self._cycles)
+                            else self.max_cycle + 1)
+        else:
+            self.current = cycle
+        self._interrupt(0.0)
+
+    def set_delay(self, delay: float):
+        """Cambia el ritmo; el próximo tick queda a 'delay' de ahora."""
+        self.delay = delay
+        self._interrupt(delay)
+
+    def _interrupt(self, next_in: float):
+        if self._wake is None:
+            return
+        self._base = self._loop.time() + next_in - self._ticks * self.delay
+        self._wake.set()
+
+    # -- loop --------------------------------------------------------------
+
+    async def run(self) -> float:
+        loop = self._loop = asyncio.get_running_loop()
+        # Los asyncio.Event se crean dentro del loop (en 3.8 se atan al loop actual)
+        self._resumed = asyncio.Event()
+        if not self._start_paused:
+            self._resumed.set()
+        self._wake = asyncio.Event()
+        self._running = True
+        self._base = loop.time()
+        self._ticks = 0
+        steps = 0
+        t0 = loop.time()
+
+        while self._running and self.current <= self.max_cycle:
+            if not self._resumed.is_set():
+                paused_at = loop.time()
+                await self._resumed.wait()
+                # Lo que duró la pausa no cuenta para el ritmo
+                self._base += loop.time() - paused_at
+                continue
+
+            self.step()
+            steps += 1
+            self._ticks += 1
+
+            now = loop.time()
+            deadline = self._base + self._ticks * self.delay
+            if now - deadline > self.delay:
+                # El callback tardó más que un delay: no recuperamos en ráfaga
+                self._base = now - self._ticks * self.delay
+                deadline = now
+            self._wake.clear()
+            while self._running and now < deadline:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), deadline - now)
+                except asyncio.TimeoutError:
+                    pass
+                if self._wake.is_set():
+                    # seek / set_delay / stop: recalcular contra la nueva base
+                    self._wake.clear()
+                    deadline = self._base + self._ticks * self.delay
+                now = loop.time()
+
+        elapsed = loop.time() - t0
+        self.cycles_per_sec = steps / elapsed if elapsed > 0 else 0.0
+        self._running = False
+        return self.cycles_per_sec
+
+async def run_many(engines: Iterable[AsyncPlaybackEngine]) -> List[float]:
+    """Corre varios timelines a la vez en el mismo loop."""
+    return await asyncio.gather(*(e.run() for e in engines))
+
+class AsyncPlayer:
+    """Loop de asyncio en un hilo daemon, para manejarlo desde otro hilo (p. ej. Tk)."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call(self, fn: Callable, *args):
+        self.loop.call_soon_threadsafe(fn, *args)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
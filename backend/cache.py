@@ -0,0 +1,491 @@
+"""
+Caches de cargas de trabajo parseadas y de calendarizaciones ya calculadas.
+
+Cada archivo .txt parseado con load_processes_table / load_actions_table se
+guarda como un binario columnar (tabla de strings + columnas crudas) cuyo
+nombre deriva de la ruta absoluta, el mtime y el tamaño del origen. Si el
+.txt no cambió, la siguiente carga lee el binario vía mmap en vez de volver
+a parsear: las columnas se copian enteras con frombytes, así que sigue
+siendo lineal en el tamaño del binario, pero sin convertir ni validar texto
+(benchmarks/run_benchmarks.py compara 'parse' con 'cache_hit'). Si el .txt
+cambió, la clave es otra y la entrada vieja queda obsoleta y se elimina en
+la siguiente pasada de evicción.
+
+ScheduleCache memoriza el timeline de cada algoritmo: la clave es un hash
+del contenido del conjunto de procesos más el algoritmo y sus parámetros,
+así que repetir una corrida (o alternar algoritmos en la interfaz) no
+recalcula nada. Vive en memoria con LRU bajo un presupuesto de bytes y,
+opcionalmente, persiste cada timeline en disco con el mismo formato de
+secciones que los workloads.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from backend.columnar import ProcessTable, ActionTable, EventTable, StringTable
+from backend.models import Event
+from backend.parsers import load_processes_table, load_actions_table, ParseStats
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sistos")
+DEFAULT_MAX_BYTES = 1024 ** 3  # 1 GiB
+
+_MAGIC = b"SSWC"
+_VERSION = 1
+# magic, versión, tipo ('P' procesos / 'A' acciones), mtime_ns, tamaño, nº secciones
+_HEADER = struct.Struct("<4sBcqqI")
+_SECTION = struct.Struct("<Q")
+_SUFFIX = ".bin"
+
+
+def _source_key(path: str) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def _fill(arr: array, raw) -> array:
+    arr.frombytes(raw)
+    return arr
+
+
+# Varios procesos (el pool de la interfaz, run_sweep) comparten el mismo
+# directorio: cualquier entrada puede desaparecer entre listarla y tocarla.
+
+def _remove(entry: str):
+    """Borra una entrada; si otro proceso ya la borró, no importa."""
+    try:
+        os.remove(entry)
+    except FileNotFoundError:
+        pass
+
+
+def _touch(entry: str):
+    """Marca de uso para la evicción LRU (la entrada pudo ser desalojada)."""
+    try:
+        os.utime(entry)
+    except FileNotFoundError:
+        pass
+
+
+def _tmp_path(entry: str) -> str:
+    # Propio del proceso: dos workers que guardan la misma clave no se pisan
+    return f"{entry}.{os.getpid()}.tmp"
+
+
+class WorkloadCache:
+    """
+    Cache de workloads parseados con presupuesto de disco.
+
+    directory: dónde guardar los binarios (por defecto ~/.cache/sistos).
+    max_bytes: tamaño máximo total; al superarlo se eliminan primero las
+    entradas obsoletas y luego las menos usadas recientemente.
+    """
+
+    def __init__(self, directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # -- API pública -------------------------------------------------------
+
+    def load_processes(self, path: str, stats: Optional[ParseStats] = None) -> ProcessTable:
+        return self._load(path, b"P", stats, load_processes_table,
+                          self._pack_processes, self._unpack_processes)
+
+    def load_actions(self, path: str, stats: Optional[ParseStats] = None) -> ActionTable:
+        return self._load(path, b"A", stats, load_actions_table,
+                          self._pack_actions, self._unpack_actions)
+
+    def clear(self):
+        for entry in self._entries():
+            _remove(entry)
+
+    # -- núcleo ------------------------------------------------------------
+
+    def _entry_path(self, kind: bytes, source: Tuple[str, int, int]) -> str:
+        digest = hashlib.sha1(repr((kind, source)).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + _SUFFIX)
+
+    def _load(self, path: str, kind: bytes, stats: Optional[ParseStats],
+              parse: Callable, pack: Callable, unpack: Callable):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"'{path}' no existe")
+        source = _source_key(path)
+        entry = self._entry_path(kind, source)
+
+        table = self._read(entry, kind, source, unpack)
+        if table is not None:
+            self.hits += 1
+            _touch(entry)
+            return table
+
+        self.misses += 1
+        table = parse(path, stats)
+        self._write(entry, kind, source, pack(table))
+        self.evict()
+        return table
+
+    def _read(self, entry: str, kind: bytes, source: Tuple[str, int, int],
+              unpack: Callable):
+        """
+        Reconstruye la tabla desde el binario mapeado en memoria (las
+        columnas se copian de una vez con frombytes), o None si la entrada
+        no existe o no corresponde al origen. Una entrada truncada o
+        corrupta se borra y cuenta como fallo.
+        """
+        try:
+            return self._unpack(entry, kind, source, unpack)
+        except FileNotFoundError:
+            return None
+        except (OSError, struct.error, ValueError, UnicodeDecodeError):
+            _remove(entry)
+            return None
+
+    @staticmethod
+    def _unpack(entry: str, kind: bytes, source: Tuple[str, int, int],
+                unpack: Callable):
+        with open(entry, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"'{entry}' truncado")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, k, mtime_ns, size, count = _HEADER.unpack_from(mm, 0)
+                if (magic, version, k) != (_MAGIC, _VERSION, kind):
+                    return None
+                view = memoryview(mm)
+                sections = []
+                try:
+                    pos = _HEADER.size
+                    for _ in range(count):
+                        (length,) = _SECTION.unpack_from(mm, pos)
+                        pos += _SECTION.size
+                        sections.append(view[pos:pos + length])
+                        pos += length
+                    if pos != len(mm):
+                        raise ValueError(f"'{entry}' truncado")
+                    # La primera sección es la ruta de origen: protege contra colisiones
+                    if (str(sections[0], "utf-8"), mtime_ns, size) != source:
+                        return None
+                    return unpack(sections[1:])
+                finally:
+                    for section in sections:
+                        section.release()
+                    view.release()
+
+    def _write(self, entry: str, kind: bytes, source: Tuple[str, int, int],
+               sections: List[bytes]):
+        os.makedirs(self.directory, exist_ok=True)
+        sections = [source[0].encode("utf-8")] + sections
+        tmp = _tmp_path(entry)
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, kind, source[1], source[2], len(sections)))
+            for raw in sections:
+                f.write(_SECTION.pack(len(raw)))
+                f.write(raw)
+        os.replace(tmp, entry)
+
+    # -- evicción ----------------------------------------------------------
+
+    def _entries(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [os.path.join(self.directory, name)
+                for name in os.listdir(self.directory) if name.endswith(_SUFFIX)]
+
+    def _is_stale(self, entry: str) -> bool:
+        """Obsoleta si su .txt de origen ya no existe o cambió de mtime/tamaño."""
+        try:
+            with open(entry, "rb") as f:
+                header = f.read(_HEADER.size)
+                _, _, _, mtime_ns, size, _ = _HEADER.unpack(header)
+                (length,) = _SECTION.unpack(f.read(_SECTION.size))
+                src = f.read(length).decode("utf-8")
+        except (OSError, struct.error, UnicodeDecodeError):
+            return True
+        try:
+            return _source_key(src)[1:] != (mtime_ns, size)
+        except OSError:
+            return True
+
+    def evict(self):
+        """Elimina entradas obsoletas y luego las menos recientes hasta caber en max_bytes."""
+        live = []
+        for entry in self._entries():
+            if self._is_stale(entry):
+                _remove(entry)
+                continue
+            try:
+                st = os.stat(entry)
+            except FileNotFoundError:
+                continue
+            live.append((st.st_mtime, st.st_size, entry))
+        total = sum(size for _, size, _ in live)
+        for _, size, entry in sorted(live):
+            if total <= self.max_bytes:
+                break
+            # Si otro proceso ya la borró, igual dejó de ocupar espacio
+            _remove(entry)
+            total -= size
+
+    # -- formato de cada tipo ---------------------------------------------
+
+    @staticmethod
+    def _pack_processes(table: ProcessTable) -> List[bytes]:
+        return [table.names.encode(), table.bt.tobytes(),
+                table.at.tobytes(), table.priority.tobytes()]
+
+    @staticmethod
+    def _unpack_processes(sections: List[bytes]) -> ProcessTable:
+        table = ProcessTable()
+        table.names = StringTable.decode(sections[0])
+        _fill(table.bt, sections[1])
+        _fill(table.at, sections[2])
+        _fill(table.priority, sections[3])
+        return table
+
+    @staticmethod
+    def _pack_actions(table: ActionTable) -> List[bytes]:
+        return [table.names.encode(), table.resources.encode(),
+                table.pid_ids.tobytes(), table.action.tobytes(),
+                table.resource_ids.tobytes(), table.cycle.tobytes()]
+
+    @staticmethod
+    def _unpack_actions(sections: List[bytes]) -> ActionTable:
+        table = ActionTable(StringTable.decode(sections[0]), StringTable.decode(sections[1]))
+        _fill(table.pid_ids, sections[2])
+        _fill(table.action, sections[3])
+        _fill(table.resource_ids, sections[4])
+        _fill(table.cycle, sections[5])
+        return table
+
+
+# -- cache de calendarizaciones ----------------------------------------------
+
+DEFAULT_MEMORY_BYTES = 256 * 1024 ** 2  # 256 MiB
+
+_SCHED_MAGIC = b"SSSC"
+_SCHED_VERSION = 1
+# magic, versión, nº secciones
+_SCHED_HEADER = struct.Struct("<4sBI")
+_SCHED_SUFFIX = ".sched"
+# Costo aproximado de un Event en una lista: el objeto más el puntero
+_EVENT_BYTES = sys.getsizeof(Event("", 0, 0)) + 8
+
+
+def workload_fingerprint(processes, count: Optional[int] = None) -> str:
+    """
+    Hash del contenido de un conjunto de procesos (lista de Process o
+    ProcessTable), o de sus primeros 'count'. Ambas representaciones del
+    mismo workload dan el mismo hash, así la cache se comparte entre la
+    carga normal y la masiva.
+    """
+    if isinstance(processes, ProcessTable):
+        names = StringTable.from_names(processes.names.names[:count])
+        bt, at, priority = processes.bt[:count], processes.at[:count], processes.priority[:count]
+    else:
+        processes = processes[:count]
+        names = StringTable.from_names([p.pid for p in processes])
+        bt = array("q", [p.bt for p in processes])
+        at = array("q", [p.at for p in processes])
+        priority = array("b", [p.priority for p in processes])
+    h = hashlib.sha1(names.encode())
+    for column in (bt, at, priority):
+        h.update(column.tobytes())
+    return h.hexdigest()
+
+
+def _timeline_bytes(timeline) -> int:
+    if isinstance(timeline, EventTable):
+        return sum(col.itemsize * len(col) for col in (timeline.pid_ids, timeline.start, timeline.end))
+    return len(timeline) * _EVENT_BYTES
+
+
+class ScheduleCache:
+    """
+    Timelines de calendarización memorizados.
+
+    max_bytes: presupuesto de memoria; al superarlo se descartan los
+    timelines usados hace más tiempo.
+    directory: si se da, cada timeline también se guarda ahí y sobrevive
+    entre ejecuciones; max_disk_bytes acota el total en disco.
+
+    Los timelines devueltos se comparten con la cache: se tratan como de
+    solo lectura (las listas se entregan como copia superficial).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BYTES,
+                 directory: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, Tuple[object, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(processes, algorithm: str, quantum: Optional[int] = None,
+            aging: Optional[int] = None) -> str:
+        """Clave de una corrida; quantum y aging solo cuentan donde se usan."""
+        alg = algorithm.lower()
+        params = (alg,
+                  quantum if alg == "round robin" else None,
+                  aging if alg == "priority" else None)
+        return hashlib.sha1(repr((workload_fingerprint(processes), params)).encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, processes, algorithm: str, compute: Callable,
+                       quantum: Optional[int] = None, aging: Optional[int] = None):
+        """
+        Timeline de 'algorithm' sobre 'processes': desde memoria, desde disco
+        o, si no está, llamando a compute() y guardando el resultado.
+        """
+        key = self.key(processes, algorithm, quantum, aging)
+        timeline = self._get(key)
+        if timeline is None and self.directory:
+            timeline = self._read(key)
+            if timeline is not None:
+                self._put(key, timeline)
+        if timeline is not None:
+            self.hits += 1
+            return self._adapt(timeline, processes)
+
+        self.misses += 1
+        timeline = compute()
+        self._put(key, timeline)
+        if self.directory:
+            self._write(key, timeline)
+            self.evict_disk()
+        return self._adapt(timeline, processes)
+
+    def clear(self):
+        """Vacía la memoria y, si hay directorio, las entradas en disco."""
+        self._entries.clear()
+        self.bytes = 0
+        for entry in self._disk_entries():
+            _remove(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- memoria -----------------------------------------------------------
+
+    def _get(self, key: str):
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        self._entries.move_to_end(key)
+        return item[0]
+
+    def _put(self, key: str, timeline):
+        size = _timeline_bytes(timeline)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_bytes:
+            return  # no cabe ni solo: no desplaza al resto
+        self._entries[key] = (timeline, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    @staticmethod
+    def _adapt(timeline, processes):
+        """Mismo tipo de timeline que devolvería el scheduler para 'processes'."""
+        if isinstance(processes, ProcessTable):
+            if isinstance(timeline, EventTable):
+                return timeline
+            return EventTable.from_events(timeline, processes.names)
+        return list(timeline)
+
+    # -- disco -------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SCHED_SUFFIX)
+
+    def _read(self, key: str) -> Optional[EventTable]:
+        """
+        El timeline guardado en disco, o None si no está. Una entrada
+        truncada o corrupta (p. ej. de un worker que murió escribiéndola)
+        cuenta como fallo: se borra y se vuelve a calcular.
+        """
+        entry = self._entry_path(key)
+        try:
+            table = self._unpack(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, struct.error, ValueError, UnicodeDecodeError):
+            _remove(entry)
+            return None
+        if table is not None:
+            _touch(entry)
+        return table
+
+    @staticmethod
+    def _unpack(entry: str) -> Optional[EventTable]:
+        with open(entry, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _SCHED_HEADER.size:
+                raise ValueError(f"'{entry}' truncado")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, count = _SCHED_HEADER.unpack_from(mm, 0)
+                if (magic, version, count) != (_SCHED_MAGIC, _SCHED_VERSION, 4):
+                    return None
+                sections = []
+                pos = _SCHED_HEADER.size
+                for _ in range(count):
+                    (length,) = _SECTION.unpack_from(mm, pos)
+                    pos += _SECTION.size
+                    sections.append(mm[pos:pos + length])
+                    pos += length
+                if pos != len(mm):
+                    raise ValueError(f"'{entry}' truncado")
+        table = EventTable(StringTable.decode(sections[0]))
+        _fill(table.pid_ids, sections[1])
+        _fill(table.start, sections[2])
+        _fill(table.end, sections[3])
+        if not len(table.pid_ids) == len(table.start) == len(table.end):
+            raise ValueError(f"'{entry}' con columnas de distinto largo")
+        return table
+
+    def _write(self, key: str, timeline):
+        if not isinstance(timeline, EventTable):
+            timeline = EventTable.from_events(timeline)
+        sections = [timeline.names.encode(), timeline.pid_ids.tobytes(),
+                    timeline.start.tobytes(), timeline.end.tobytes()]
+        os.makedirs(self.directory, exist_ok=True)
+        entry = self._entry_path(key)
+        tmp = _tmp_path(entry)
+        with open(tmp, "wb") as f:
+            f.write(_SCHED_HEADER.pack(_SCHED_MAGIC, _SCHED_VERSION, len(sections)))
+            for raw in sections:
+                f.write(_SECTION.pack(len(raw)))
+                f.write(raw)
+        os.replace(tmp, entry)
+
+    def _disk_entries(self) -> List[str]:
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        return [os.path.join(self.directory, name)
+                for name in os.listdir(self.directory) if name.endswith(_SCHED_SUFFIX)]
+
+    def evict_disk(self):
+        """Elimina los timelines en disco menos recientes hasta caber en max_disk_bytes."""
+        live = []
+        for entry in self._disk_entries():
+            try:
+                st = os.stat(entry)
+            except FileNotFoundError:
+                continue
+            live.append((st.st_mtime, st.st_size, entry))
+        total = sum(size for _, size, _ in live)
+        for _, size, entry in sorted(live):
+            if total <= self.max_disk_bytes:
+                break
+            _remove(entry)
+            total -= size
@@ -1,10 +1,30 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from backend.models    import Process
-from backend.scheduling import Event, fifo, sjf, srt, rr, priority_np
+from backend.scheduling import (Event, fifo, sjf, srt, rr, priority_np,
+                                CheckpointLog, Resume, Timeline)
 from backend.metrics    import compute_metrics
+from backend.cache      import ScheduleCache, workload_fingerprint
+from backend.progress   import CancelToken, ProgressCallback
+
+@dataclass
+class _LastRun:
+    """Lo necesario para retomar la última corrida (modo incremental)."""
+    params: Tuple        # (algoritmo, quantum, aging)
+    count: int           # procesos del workload
+    fingerprint: str     # hash de esos procesos
+    log: CheckpointLog
+    events: Timeline
 
 class CalendarizacionSimulator:
-    def __init__(self):
+    def __init__(self, cache: Optional[ScheduleCache] = None, incremental: bool = False):
+        # Con cache, repetir un algoritmo sobre el mismo workload no recalcula
+        self.cache = cache
+        # Incremental: cada corrida guarda checkpoints y, si después solo se
+        # agregan al final procesos que llegan tarde, la siguiente retoma desde
+        # el último checkpoint válido en vez de empezar en el ciclo 0
+        self.incremental = incremental
+        self._last: Optional[_LastRun] = None
         self.processes: List[Process] = []
         self.events:    List[Event]   = []
         self.max_cycle: int           = 0
@@ -13,20 +33,25 @@ class CalendarizacionSimulator:
         from backend.parsers import load_processes
         self.processes = load_processes(path)
 
-    def configure(self, algorithm: str, quantum: Optional[int] = None):
+    def configure(self, algorithm: str, quantum: Optional[int] = None,
+                  aging: Optional[int] = None, token: Optional[CancelToken] = None,
+                  progress: Optional[ProgressCallback] = None):
         """
         Configura y ejecuta el algoritmo de calendarización indicado.
         Para Round Robin, quantum debe ser un entero positivo.
+        Para Priority, aging (opcional) son los ciclos de espera por nivel ganado.
+        token/progress: cancelación y avance (ver backend.progress); si el
+        token se cancela, lanza Cancelled y el simulador queda vacío.
         """
         alg = algorithm.lower()
         if alg == "fifo":
-            self.events = fifo(self.processes)
+            run = lambda **kw: fifo(self.processes, token, progress, **kw)
 
         elif alg == "sjf":
-            self.events = sjf(self.processes)
+            run = lambda **kw: sjf(self.processes, token, progress, **kw)
 
         elif alg == "srt":
-            self.events = srt(self.processes)
+            run = lambda **kw: srt(self.processes, token, progress, **kw)
 
         elif alg == "round robin":
             # Validación de quantum
@@ -34,16 +59,57 @@ class CalendarizacionSimulator:
                 raise ValueError("Quantum requerido para Round Robin")
             if not isinstance(quantum, int) or quantum < 1:
                 raise ValueError(f"Quantum inválido ({quantum}); debe ser un entero ≥ 1")
-            self.events = rr(self.processes, quantum)
+            run = lambda **kw: rr(self.processes, quantum, token=token, progress=progress, **kw)
 
         elif alg == "priority":
-            self.events = priority_np(self.processes)
+            run = lambda **kw: priority_np(self.processes, aging, token, progress, **kw)
 
         else:
             raise ValueError(f"Algoritmo desconocido: '{algorithm}'")
 
-        # Calcular hasta qué ciclo llega la simulación
-        self.max_cycle = max((e.end for e in self.events), default=0)
+        params = (alg, quantum if alg == "round robin" else None,
+                  aging if alg == "priority" else None)
+        if self.incremental:
+            log = CheckpointLog()
+            resume = self._resume_point(params)
+            compute = lambda: run(checkpoints=log, resume=resume)
+        else:
+            compute = run
+
+        # Suelta el timeline anterior antes de calcular el nuevo
+        self.reset()
+        if self.cache is None:
+            self.events = compute()
+        else:
+            self.events = self.cache.get_or_compute(self.processes, alg, compute,
+                                                    quantum=quantum, aging=aging)
+
+        # Calcular hasta qué ciclo llega la simulación (un EventTable lo lee
+        # de su columna 'end', sin construir los Event)
+        if hasattr(self.events, "max_end"):
+            self.max_cycle = self.events.max_end()
+        else:
+            self.max_cycle = max((e.end for e in self.events), default=0)
+
+        if self.incremental:
+            # Sin checkpoints (vino de la cache) no hay desde dónde retomar
+            self._last = _LastRun(params, len(self.processes),
+                                  workload_fingerprint(self.processes),
+                                  log, self.events) if log.points else None
+
+    def _resume_point(self, params: Tuple) -> Optional[Resume]:
+        """
+        Desde dónde retomar la corrida anterior con los mismos parámetros, si
+        el workload actual es aquel más procesos agregados al final.
+        """
+        last = self._last
+        if last is None or last.params != params or len(self.processes) <= last.count:
+            return None
+        if workload_fingerprint(self.processes, last.count) != last.fingerprint:
+            return None
+        first_new = min(p.at for p in self.processes[last.count:])
+        checkpoint = last.log.latest(first_new)
+        return Resume(checkpoint, last.log, last.events) if checkpoint else None
 
     def get_events(self) -> List[Event]:
         return self.events
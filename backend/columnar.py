@@ -0,0 +1,234 @@
+"""
+Representación columnar (arrays tipados) de cargas de trabajo y timelines.
+
+Cada tabla guarda sus campos numéricos en array.array y los PID / recursos
+como índices a una tabla de strings compartida, así que un registro cuesta
+unos pocos bytes en vez de un objeto con __dict__. Las tablas se comportan
+como secuencias de solo lectura: iterar o indexar construye el Process /
+Event correspondiente al vuelo, así que SimulationEngine, compute_metrics y
+app_ui las consumen sin cambios.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from backend.models import Process, Action, Event, ActionEvent
+
+# Códigos compactos para los campos categóricos
+ACTION_CODES = ("READ", "WRITE")
+STATUS_CODES = ("ACCESED", "WAITING")
+
+
+class StringTable:
+    """
+    Interna strings a ids enteros consecutivos. El dict inverso se construye
+    solo cuando se necesita (intern / ids), así que una tabla cargada con
+    from_names cuesta solo la lista.
+    """
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        self.names: List[str] = []
+        self._ids: Optional[Dict[str, int]] = {}
+        for name in names or ():
+            self.intern(name)
+
+    @classmethod
+    def from_names(cls, names: List[str]) -> "StringTable":
+        """Adopta una lista de nombres ya únicos sin construir el dict."""
+        table = cls()
+        table.names = names
+        table._ids = None
+        return table
+
+    @property
+    def ids(self) -> Dict[str, int]:
+        if self._ids is None:
+            self._ids = {name: idx for idx, name in enumerate(self.names)}
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, idx: int) -> str:
+        return self.names[idx]
+
+    def encode(self) -> bytes:
+        """Serializa los nombres, uno por línea (vienen de líneas: no contienen '\\n')."""
+        return "".join(name + "\n" for name in self.names).encode("utf-8")
+
+    @classmethod
+    def decode(cls, raw) -> "StringTable":
+        """Inverso de encode; acepta bytes o un memoryview (p. ej. sobre un mmap)."""
+        return cls.from_names(str(raw, "utf-8").split("\n")[:-1])
+
+    def intern(self, name: str) -> int:
+        ids = self.ids
+        idx = ids.get(name)
+        if idx is None:
+            idx = len(self.names)
+            ids[name] = idx
+            self.names.append(name)
+        return idx
+
+
+class _Table:
+    """Base: secuencia perezosa sobre columnas de igual longitud."""
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _row(self, i: int):
+        raise NotImplementedError
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._row(i)
+
+    def __iter__(self) -> Iterator:
+        for k in range(len(self)):
+            yield self._row(k)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def to_list(self) -> list:
+        return list(self)
+
+
+class ProcessTable(_Table):
+    """
+    Procesos en columnas. La fila i corresponde al PID names[i]: los PIDs son
+    únicos, así que el id interno de un proceso es su número de fila.
+    """
+
+    def __init__(self):
+        self.names = StringTable()
+        self.bt = array("q")
+        self.at = array("q")
+        self.priority = array("b")
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Process]) -> "ProcessTable":
+        table = cls()
+        for p in processes:
+            table.add(p.pid, p.bt, p.at, p.priority)
+        return table
+
+    def add(self, pid: str, bt: int, at: int, priority: int) -> int:
+        idx = self.names.intern(pid)
+        if idx != len(self.bt):
+            raise ValueError(f"PID duplicado: '{pid}'")
+        self.bt.append(bt)
+        self.at.append(at)
+        self.priority.append(priority)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.bt)
+
+    def _row(self, i: int) -> Process:
+        return Process(self.names[i], self.bt[i], self.at[i], self.priority[i])
+
+
+class ActionTable(_Table):
+    """Acciones en columnas; PID y recurso internados en tablas propias."""
+
+    def __init__(self, names: Optional[StringTable] = None,
+                 resources: Optional[StringTable] = None):
+        self.names = names if names is not None else StringTable()
+        self.resources = resources if resources is not None else StringTable()
+        self.pid_ids = array("l")
+        self.action = array("b")      # índice en ACTION_CODES
+        self.resource_ids = array("l")
+        self.cycle = array("q")
+
+    @classmethod
+    def from_actions(cls, actions: Iterable[Action]) -> "ActionTable":
+        table = cls()
+        for a in actions:
+            table.add(a.pid, a.action, a.resource, a.cycle)
+        return table
+
+    def add(self, pid: str, action: str, resource: str, cycle: int):
+        self.pid_ids.append(self.names.intern(pid))
+        self.action.append(ACTION_CODES.index(action))
+        self.resource_ids.append(self.resources.intern(resource))
+        self.cycle.append(cycle)
+
+    def __len__(self) -> int:
+        return len(self.cycle)
+
+    def _row(self, i: int) -> Action:
+        return Action(self.names[self.pid_ids[i]], ACTION_CODES[self.action[i]],
+                      self.resources[self.resource_ids[i]], self.cycle[i])
+
+
+class EventTable(_Table):
+    """
+    Timeline en columnas. pid_ids indexa names, que normalmente es la misma
+    StringTable del ProcessTable de origen (no se copian los PIDs).
+    """
+
+    def __init__(self, names: Optional[StringTable] = None):
+        self.names = names if names is not None else StringTable()
+        self.pid_ids = array("l")
+        self.start = array("q")
+        self.end = array("q")
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event],
+                    names: Optional[StringTable] = None) -> "EventTable":
+        table = cls(names)
+        for e in events:
+            table.append(e)
+        return table
+
+    def add(self, pid_id: int, start: int, end: int):
+        self.pid_ids.append(pid_id)
+        self.start.append(start)
+        self.end.append(end)
+
+    def append(self, e: Event):
+        self.add(self.names.intern(e.pid), e.start, e.end)
+
+    def max_end(self) -> int:
+        return max(self.end, default=0)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def _row(self, i: int) -> Event:
+        return Event(self.names[self.pid_ids[i]], self.start[i], self.end[i])
+
+
+class ActionEventTable(EventTable):
+    """EventTable con recurso (internado) y estado codificado por evento."""
+
+    def __init__(self, names: Optional[StringTable] = None,
+                 resources: Optional[StringTable] = None):
+        super().__init__(names)
+        self.resources = resources if resources is not None else StringTable()
+        self.resource_ids = array("l")
+        self.status = array("b")      # índice en STATUS_CODES
+
+    def add(self, pid_id: int, start: int, end: int,
+            resource_id: int = 0, status: int = 0):
+        super().add(pid_id, start, end)
+        self.resource_ids.append(resource_id)
+        self.status.append(status)
+
+    def append(self, e: ActionEvent):
+        self.add(self.names.intern(e.pid), e.start, e.end,
+                 self.resources.intern(e.resource), STATUS_CODES.index(e.status))
+
+    def _row(self, i: int) -> ActionEvent:
+        return ActionEvent(self.names[self.pid_ids[i]], self.start[i], self.end[i],
+                           self.resources[self.resource_ids[i]],
+                           STATUS_CODES[self.status[i]])
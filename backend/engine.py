@@ -1,3 +1,4 @@
+import time
 from typing import List, Callable
 from backend.scheduling import Event
 
@@ -6,38 +7,74 @@ class SimulationEngine:
         self,
         events: List[Event],
         on_cycle: Callable[[int, List[Event]], None],
-        max_cycle: int
+        max_cycle: int,
+        sparse: bool = False
     ):
         """
         events: lista de Event(pid, start, end)
         on_cycle: callback que recibe (ciclo_actual, lista_de_events_que_empiezan_este_ciclo)
         max_cycle: hasta dónde simular
+        sparse: si es True, solo se visitan los ciclos en que arranca algún
+                evento (se saltan los ciclos ociosos)
         """
         self.events_by_cycle = {}
         for e in events:
             self.events_by_cycle.setdefault(e.start, []).append(e)
         self.on_cycle = on_cycle
-        self.current = 0
         self.max_cycle = max_cycle
+        self.sparse = sparse
+        self._cycles = sorted(self.events_by_cycle) if sparse else []
+        self._pos = 0
+        self.current = self._first_cycle()
+        self.cycles_per_sec = 0.0
         self._running = False
 
+    def _first_cycle(self) -> int:
+        if not self.sparse:
+            return 0
+        return self._cycles[0] if self._cycles else self.max_cycle + 1
+
     def step(self):
         """Un ciclo: dispara el callback con los eventos que arrancan ahora."""
         evs = self.events_by_cycle.get(self.current, [])
         self.on_cycle(self.current, evs)
-        self.current += 1
+        if self.sparse:
+            # Salta directo al próximo ciclo con eventos
+            self._pos += 1
+            if self._pos < len(self._cycles):
+                self.current = self._cycles[self._pos]
+            else:
+                self.current = self.max_cycle + 1
+        else:
+            self.current += 1
 
-    def run(self, delay: float):
-        """Loop automático con pausa de ‘delay’ segundos entre ciclos."""
-        import time
+    def run(self, delay: float = 0.0) -> float:
+        """
+        Loop automático con pausa de ‘delay’ segundos entre ciclos. Con
+        delay ≤ 0 corre sin dormir (modo headless). Devuelve y guarda en
+        cycles_per_sec el ritmo alcanzado.
+        """
         self._running = True
+        steps = 0
+        t0 = time.perf_counter()
         while self._running and self.current <= self.max_cycle:
             self.step()
-            time.sleep(delay)
+            steps += 1
+            if delay > 0:
+                time.sleep(delay)
+        elapsed = time.perf_counter() - t0
+        self.cycles_per_sec = steps / elapsed if elapsed > 0 else 0.0
+        self._running = False
+        return self.cycles_per_sec
+
+    def run_headless(self) -> float:
+        """Dispara todos los callbacks lo más rápido posible."""
+        return self.run(0)
 
     def pause(self):
         self._running = False
 
     def reset(self):
-        self.current = 0
-        self._running = False
\ No newline at end of file
+        self._pos = 0
+        self.current = self._first_cycle()
+        self._running = False
@@ -0,0 +1,230 @@
+"""
+Escritura de timelines a disco.
+
+write_events consume cualquier iterable de eventos (una lista, un
+EventTable o el flujo de un iter_*) y los va escribiendo a medida que
+llegan, así que guardar una corrida en streaming no la materializa.
+
+write_event_log guarda un timeline (Event o ActionEvent) en un binario
+columnar de ancho fijo: tabla de strings de PIDs (y de recursos) más una
+columna por campo, little-endian y alineadas a 8 bytes. EventLog lo abre
+con mmap y expone las columnas como vistas sobre el archivo: abrir un log
+no lee ni parsea nada, y los Event se construyen al vuelo al recorrerlo,
+así SimulationEngine y los Gantt lo consumen como a cualquier timeline.
+Cada recorrido crea objetos nuevos: si varios consumidores van a guardar
+los eventos (engine, GanttLayout, GanttIndex), conviene materializarlo una
+sola vez con list(log) y compartir esa lista.
+"""
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import chain
+from typing import Iterable, List
+
+from backend.columnar import (_Table, StringTable, EventTable, ActionEventTable,
+                              STATUS_CODES)
+from backend.models import Event, ActionEvent
+
+EVENT_COLUMNS = ("pid", "start", "end")
+ACTION_COLUMNS = EVENT_COLUMNS + ("resource", "status")
+
+def write_events(events: Iterable[Event], path: str) -> int:
+    """
+    Escribe los eventos como CSV (con recurso y estado si son ActionEvent) y
+    devuelve cuántos se escribieron.
+    """
+    it = iter(events)
+    first = next(it, None)
+    actions = isinstance(first, ActionEvent)
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(ACTION_COLUMNS if actions else EVENT_COLUMNS)
+        if first is None:
+            return 0
+        if actions:
+            rows = ((e.pid, e.start, e.end, e.resource, e.status)
+                    for e in chain((first,), it))
+        else:
+            rows = ((e.pid, e.start, e.end) for e in chain((first,), it))
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+# -- log binario -------------------------------------------------------------
+
+LOG_SUFFIX = ".evlog"
+_LOG_MAGIC = b"SSEL"
+_LOG_VERSION = 1
+# magic, versión, tipo ('E' eventos / 'A' eventos de acciones), nº secciones, nº eventos
+_LOG_HEADER = struct.Struct("<4sBcIQ")
+_SECTION = struct.Struct("<Q")
+_ALIGN = 8
+# Columnas de ancho fijo en el archivo, sin importar la plataforma
+# (array('l') mide 4 u 8 bytes según el sistema)
+_ID = "i"
+_CYCLE = "q"
+_STATUS = "b"
+
+def _le(column: array) -> bytes:
+    """Bytes little-endian de una columna."""
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+def _as_table(events: Iterable[Event]) -> EventTable:
+    if isinstance(events, EventTable):
+        return events
+    it = iter(events)
+    first = next(it, None)
+    cls = ActionEventTable if isinstance(first, ActionEvent) else EventTable
+    return cls.from_events(() if first is None else chain((first,), it))
+
+def log_path(path: str, label: str) -> str:
+    """'runs.evlog' + 'mutex' → 'runs-mutex.evlog' (un log por timeline)."""
+    root, ext = os.path.splitext(path)
+    return f"{root}-{label}{ext}"
+
+def write_event_log(events: Iterable[Event], path: str, label: str = "") -> int:
+    """
+    Guarda un timeline en formato binario y devuelve cuántos eventos
+    escribió. Un EventTable / ActionEventTable se escribe directo desde sus
+    columnas; cualquier otro iterable (incluido un flujo iter_*) se junta
+    antes en columnas, a ~21 bytes por evento. 'label' identifica la
+    corrida (p. ej. el algoritmo) al reabrirla.
+    """
+    table = _as_table(events)
+    actions = isinstance(table, ActionEventTable)
+    sections = [label.encode("utf-8"), table.names.encode(),
+                _le(array(_ID, table.pid_ids)), _le(table.start), _le(table.end)]
+    if actions:
+        sections += [table.resources.encode(), _le(array(_ID, table.resource_ids)),
+                     _le(array(_STATUS, table.status))]
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_LOG_HEADER.pack(_LOG_MAGIC, _LOG_VERSION, b"A" if actions else b"E",
+                                 len(sections), len(table)))
+        pos = _LOG_HEADER.size
+        for raw in sections:
+            pad = -(pos + _SECTION.size) % _ALIGN
+            f.write(_SECTION.pack(len(raw) + pad))
+            f.write(b"\0" * pad)
+            f.write(raw)
+            pos += _SECTION.size + pad + len(raw)
+    os.replace(tmp, path)
+    return len(table)
+
+class EventLog(_Table):
+    """
+    Timeline de solo lectura sobre un archivo de write_event_log mapeado en
+    memoria. pid_ids, start, end (y resource_ids, status) son vistas sobre
+    el archivo; names / resources son sus tablas de strings. Hay que
+    cerrarlo (o usarlo con 'with') para soltar el mapeo.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        try:
+            self._load(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self, path: str):
+        mm = self._mm
+        if len(mm) < _LOG_HEADER.size:
+            raise ValueError(f"'{path}' no es un log de eventos")
+        magic, version, kind, count, self._len = _LOG_HEADER.unpack_from(mm, 0)
+        if (magic, version) != (_LOG_MAGIC, _LOG_VERSION) or kind not in (b"E", b"A"):
+            raise ValueError(f"'{path}' no es un log de eventos (versión {_LOG_VERSION})")
+        self.actions = kind == b"A"
+        view = memoryview(mm)
+        self._views.append(view)
+        sections = []
+        pos = _LOG_HEADER.size
+        for _ in range(count):
+            (length,) = _SECTION.unpack_from(mm, pos)
+            pos += _SECTION.size
+            pad = -pos % _ALIGN
+            sections.append(view[pos + pad:pos + length])
+            pos += length
+        self._views.extend(sections)
+
+        self.label = str(sections[0], "utf-8")
+        self.names = StringTable.decode(sections[1])
+        self.pid_ids = self._column(sections[2], _ID)
+        self.start = self._column(sections[3], _CYCLE)
+        self.end = self._column(sections[4], _CYCLE)
+        if self.actions:
+            self.resources = StringTable.decode(sections[5])
+            self.resource_ids = self._column(sections[6], _ID)
+            self.status = self._column(sections[7], _STATUS)
+
+    def _column(self, raw: memoryview, typecode: str):
+        if sys.byteorder == "big":
+            # El archivo es little-endian: aquí sí hay que copiar
+            column = array(typecode, raw)
+            column.byteswap()
+            return column
+        column = raw.cast(typecode)
+        self._views.append(column)
+        return column
+
+    def close(self):
+        """Suelta las vistas y el mapeo; el log deja de poder leerse."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mm.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _row(self, i: int) -> Event:
+        pid = self.names[self.pid_ids[i]]
+        if self.actions:
+            return ActionEvent(pid, self.start[i], self.end[i],
+                               self.resources[self.resource_ids[i]],
+                               STATUS_CODES[self.status[i]])
+        return Event(pid, self.start[i], self.end[i])
+
+    def __iter__(self):
+        names = self.names.names
+        if self.actions:
+            resources = self.resources.names
+            for p, s, e, r, st in zip(self.pid_ids, self.start, self.end,
+                                      self.resource_ids, self.status):
+                yield ActionEvent(names[p], s, e, resources[r], STATUS_CODES[st])
+        else:
+            for p, s, e in zip(self.pid_ids, self.start, self.end):
+                yield Event(names[p], s, e)
+
+    def max_end(self) -> int:
+        return max(self.end, default=0)
+
+    def to_table(self) -> EventTable:
+        """Copia a un EventTable / ActionEventTable en memoria (para compute_metrics)."""
+        if self.actions:
+            table = ActionEventTable(self.names, self.resources)
+            table.resource_ids.extend(self.resource_ids)
+            table.status.extend(self.status)
+        else:
+            table = EventTable(self.names)
+        table.pid_ids.extend(self.pid_ids)
+        table.start.extend(self.start)
+        table.end.extend(self.end)
+        return table
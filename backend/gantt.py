@@ -0,0 +1,223 @@
+"""
+Geometría de los diagramas de Gantt, independiente de Tk.
+
+GanttLayout se calcula una sola vez por corrida: fila de cada PID y su
+color. Así, dibujar un ciclo solo toca los eventos que empiezan en él (los
+entrega SimulationEngine, ya indexados por ciclo de inicio).
+
+FrameQueue lleva esos eventos del hilo de reproducción al main loop de Tk,
+que la vacía una vez por frame y dibuja todo lo acumulado de una vez.
+
+GanttIndex permite virtualizar la vista: responde qué eventos (o, con poco
+zoom, qué barras resumen) caen dentro de una ventana de ciclos × filas, en
+tiempo proporcional a lo visible y no al tamaño del timeline.
+"""
+import math
+import random
+from operator import attrgetter
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from backend.models import Event
+
+# Parámetros de dibujo
+X_SCALE = 30
+ROW_HEIGHT = 30
+# Con menos píxeles por ciclo que esto, se dibujan barras resumen en vez de eventos
+MIN_DETAIL_PX = 2.0
+
+_start_of = attrgetter("start")
+
+def random_color(rng=random) -> str:
+    r, g, b = [rng.randint(100, 255) for _ in range(3)]
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+class GanttLayout:
+    """
+    rows: PID → fila. Si no se da un orden, las filas siguen el orden en que
+    cada PID aparece por primera vez en el timeline (como se dibujaba antes).
+    colors: PID → color de relleno.
+    """
+
+    def __init__(self, events: List[Event], pids: Optional[Iterable[str]] = None):
+        rows: Dict[str, int] = {}
+        if pids is not None:
+            for pid in pids:
+                rows.setdefault(pid, len(rows))
+        else:
+            # sorted es estable: dentro de un ciclo se respeta el orden original
+            for e in sorted(events, key=_start_of):
+                rows.setdefault(e.pid, len(rows))
+        self.rows = rows
+        self.colors = {pid: random_color() for pid in rows}
+        self.max_end = max((e.end for e in events), default=0)
+
+    def box(self, ev: Event, x_scale: float = X_SCALE) -> Tuple[float, int, float, int]:
+        """Coordenadas (x1, y1, x2, y2) del rectángulo de un evento."""
+        y1 = self.rows[ev.pid] * ROW_HEIGHT
+        return ev.start * x_scale, y1, ev.end * x_scale, y1 + ROW_HEIGHT - 5
+
+@dataclass
+class Frame:
+    cycle: Optional[int] = None         # último ciclo incluido en el frame
+    batches: Dict[Hashable, List[Event]] = field(default_factory=dict)
+    pending: bool = False               # quedaron ciclos para el próximo frame
+    closed: bool = False                # el productor terminó
+
+class FrameQueue:
+    """
+    Cola productor (hilo de reproducción) → consumidor (main loop de Tk).
+    deque.append y popleft son atómicos, así que no hace falta lock.
+    """
+    _CLOSED = object()
+
+    def __init__(self):
+        self._items = deque()
+
+    def push(self, key: Hashable, cycle: int, events: List[Event]):
+        self._items.append((key, cycle, events))
+
+    def close(self):
+        self._items.append(self._CLOSED)
+
+    def drain(self, max_events: Optional[int] = None) -> Frame:
+        """
+        Junta en un solo Frame todos los ciclos pendientes, agrupando los
+        eventos por clave (p. ej. por algoritmo). Con max_events, corta
+        apenas se supera ese total y deja el resto para el próximo frame.
+        """
+        frame = Frame()
+        count = 0
+        items = self._items
+        while items:
+            if max_events is not None and count >= max_events:
+                frame.pending = True
+                break
+            item = items.popleft()
+            if item is self._CLOSED:
+                frame.closed = True
+                break
+            key, cycle, events = item
+            # Varios timelines avanzan a la par: el frame muestra el más adelantado
+            frame.cycle = cycle if frame.cycle is None else max(frame.cycle, cycle)
+            if events:
+                frame.batches.setdefault(key, []).extend(events)
+                count += len(events)
+        return frame
+
+@dataclass
+class SummaryBar:
+    """Intervalos de una fila fundidos porque su separación no se ve a este zoom."""
+    __slots__ = ("row", "start", "end", "count")
+    row: int
+    start: int
+    end: int
+    count: int    # eventos que abarca la barra
+
+class GanttIndex:
+    """
+    Índice de un timeline para dibujar solo lo visible.
+
+    Por fila guarda los eventos ordenados por inicio, así una ventana de
+    ciclos se resuelve con búsqueda binaria. Lo ordenado de cada fila se
+    arma recién cuando esa fila se vuelve visible. Para zoom lejano arma,
+    también bajo demanda, una pirámide de niveles de detalle: en el nivel k se funden
+    los intervalos separados por menos de 2**k ciclos, de modo que con
+    2**k ciclos por píxel hay a lo sumo una barra por píxel y fila.
+
+    'until' en las consultas limita a los eventos que empiezan hasta ese
+    ciclo (lo ya reproducido en la animación).
+    """
+
+    def __init__(self, events: List[Event], layout: GanttLayout):
+        self.n_rows = len(layout.rows)
+        self._events = [[] for _ in range(self.n_rows)]
+        rows = layout.rows
+        for e in events:
+            self._events[rows[e.pid]].append(e)
+        self._rows = {}       # fila → (starts, reach, max_len), armado al verla
+        self._levels = {}     # (fila, k) → (starts, ends, counts)
+
+    def _row(self, row: int) -> Tuple[array, array, int]:
+        cached = self._rows.get(row)
+        if cached is None:
+            evs = self._events[row]
+            evs.sort(key=_start_of)
+            # reach: máximo end acumulado, para recortar lo no reproducido
+            reach = array('q')
+            top = max_len = 0
+            for e in evs:
+                if e.end > top:
+                    top = e.end
+                if e.end - e.start > max_len:
+                    max_len = e.end - e.start
+                reach.append(top)
+            cached = self._rows[row] = (array('q', [e.start for e in evs]), reach, max_len)
+        return cached
+
+    def events_in(self, row: int, c0: int, c1: int,
+                  until: Optional[int] = None) -> List[Event]:
+        """Eventos de 'row' que se intersectan con los ciclos [c0, c1)."""
+        starts, _, max_len = self._row(row)
+        lo = bisect_left(starts, c0 - max_len)
+        hi = bisect_left(starts, c1)
+        if until is not None:
+            hi = min(hi, bisect_right(starts, until))
+        return [e for e in self._events[row][lo:hi] if e.end > c0]
+
+    def _level(self, row: int, k: int) -> Tuple[array, array, array]:
+        cached = self._levels.get((row, k))
+        if cached is not None:
+            return cached
+        if k == 0:
+            self._row(row)  # deja la fila ordenada
+            source = ((e.start, e.end, 1) for e in self._events[row])
+        else:
+            source = zip(*self._level(row, k - 1))
+        gap = 1 << k
+        starts, ends, counts = array('q'), array('q'), array('q')
+        for s, e, c in source:
+            if ends and s - ends[-1] < gap:
+                if e > ends[-1]:
+                    ends[-1] = e
+                counts[-1] += c
+            else:
+                starts.append(s)
+                ends.append(e)
+                counts.append(c)
+        self._levels[row, k] = (starts, ends, counts)
+        return starts, ends, counts
+
+    def bars_in(self, row: int, c0: int, c1: int, cycles_per_px: float,
+                until: Optional[int] = None) -> List[SummaryBar]:
+        """Barras resumen de 'row' en [c0, c1), a lo sumo ~una por píxel."""
+        k = max(0, math.ceil(math.log2(cycles_per_px))) if cycles_per_px > 0 else 0
+        starts, ends, counts = self._level(row, k)
+        lo = bisect_right(ends, c0)
+        hi = bisect_left(starts, c1)
+        limit = None
+        if until is not None:
+            hi = min(hi, bisect_right(starts, until))
+            row_starts, reach, _ = self._row(row)
+            shown = bisect_right(row_starts, until)
+            limit = reach[shown - 1] if shown else 0
+        bars = []
+        for i in range(lo, hi):
+            end = ends[i] if limit is None else min(ends[i], limit)
+            bars.append(SummaryBar(row, starts[i], end, counts[i]))
+        return bars
+
+    def visible(self, c0: int, c1: int, r0: int, r1: int, cycles_per_px: float,
+                until: Optional[int] = None) -> Tuple[List[Event], List[SummaryBar]]:
+        """
+        Lo que hay que materializar en la ventana ciclos [c0, c1) × filas
+        [r0, r1): eventos individuales si cada ciclo mide al menos
+        MIN_DETAIL_PX píxeles, o barras resumen si no.
+        """
+        rows = range(max(0, r0), min(self.n_rows, r1))
+        if cycles_per_px * MIN_DETAIL_PX <= 1:
+            return [e for r in rows for e in self.events_in(r, c0, c1, until)], []
+        return [], [b for r in rows for b in self.bars_in(r, c0, c1, cycles_per_px, until)]
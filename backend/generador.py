@@ -0,0 +1,148 @@
+"""
+Generador sintético de workloads, reproducible por semilla.
+
+Produce procesos y acciones sin pasar por disco, ya sea perezosamente
+(iter_processes / iter_actions, uno a uno) o en tablas columnares por lotes
+(process_batches / action_batches / generate_*_table), listas para fifo, sjf,
+srt, rr, priority_np y simulate_synchronization.
+
+Llegadas:
+  - "poisson": tiempos entre llegadas exponenciales con media 1/rate.
+  - "bursty":  ráfagas de burst_size llegadas casi simultáneas separadas por
+               huecos largos (mismo ritmo medio que poisson).
+Bursts:
+  - "exponential": media mean_burst.
+  - "pareto":      cola pesada (alpha = pareto_alpha) con la misma media.
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Sequence
+
+from backend.models import Process, Action, Resource
+from backend.columnar import ProcessTable, ActionTable, StringTable
+
+@dataclass
+class WorkloadSpec:
+    n_processes: int = 1000
+    seed: Optional[int] = None
+    arrivals: str = "poisson"           # "poisson" | "bursty"
+    rate: float = 0.5                   # llegadas por ciclo (promedio)
+    burst_size: int = 20                # llegadas por ráfaga en modo bursty
+    bursts: str = "exponential"         # "exponential" | "pareto"
+    mean_burst: float = 8.0
+    pareto_alpha: float = 1.5
+    # Peso relativo de cada prioridad 0–10 (por defecto uniforme)
+    priority_weights: Sequence[float] = field(default_factory=lambda: [1.0] * 11)
+
+@dataclass
+class ContentionSpec:
+    n_actions: int = 1000
+    seed: Optional[int] = None
+    n_resources: int = 10
+    max_counter: int = 3                # contador de cada recurso en 1..max_counter
+    hot_fraction: float = 0.2           # fracción de recursos "calientes"
+    hot_share: float = 0.8              # fracción de accesos que van a los calientes
+    read_ratio: float = 0.7
+    cycles: int = 1000                  # ciclos sobre los que se reparten las acciones
+
+def _arrival_times(spec: WorkloadSpec, rng: random.Random) -> Iterator[int]:
+    t = 0.0
+    if spec.arrivals == "poisson":
+        while True:
+            yield int(t)
+            t += rng.expovariate(spec.rate)
+    elif spec.arrivals == "bursty":
+        gap = spec.burst_size / spec.rate
+        while True:
+            for _ in range(spec.burst_size):
+                yield int(t)
+                t += rng.expovariate(spec.rate * spec.burst_size * 10)
+            t += rng.expovariate(1.0 / gap)
+    else:
+        raise ValueError(f"Modo de llegadas desconocido: '{spec.arrivals}'")
+
+def _burst(spec: WorkloadSpec, rng: random.Random) -> int:
+    if spec.bursts == "exponential":
+        value = rng.expovariate(1.0 / spec.mean_burst)
+    elif spec.bursts == "pareto":
+        # paretovariate tiene mínimo 1 y media alpha/(alpha-1)
+        alpha = spec.pareto_alpha
+        scale = spec.mean_burst * (alpha - 1) / alpha if alpha > 1 else spec.mean_burst
+        value = scale * rng.paretovariate(alpha)
+    else:
+        raise ValueError(f"Distribución de bursts desconocida: '{spec.bursts}'")
+    return max(1, int(round(value)))
+
+def iter_processes(spec: WorkloadSpec) -> Iterator[Process]:
+    """Procesos P1..Pn en orden de llegada, generados de a uno."""
+    rng = random.Random(spec.seed)
+    levels = list(range(len(spec.priority_weights)))
+    arrivals = _arrival_times(spec, rng)
+    for k in range(1, spec.n_processes + 1):
+        at = next(arrivals)
+        bt = _burst(spec, rng)
+        prio = rng.choices(levels, spec.priority_weights)[0]
+        yield Process(pid=f"P{k}", bt=bt, at=at, priority=prio)
+
+def process_batches(spec: WorkloadSpec, batch_size: int = 100_000) -> Iterator[ProcessTable]:
+    """Los mismos procesos que iter_processes, en ProcessTables de batch_size."""
+    table = ProcessTable()
+    for p in iter_processes(spec):
+        table.add(p.pid, p.bt, p.at, p.priority)
+        if len(table) == batch_size:
+            yield table
+            table = ProcessTable()
+    if len(table):
+        yield table
+
+def generate_process_table(spec: WorkloadSpec) -> ProcessTable:
+    """Workload completo como una sola tabla, sin crear objetos Process."""
+    rng = random.Random(spec.seed)
+    levels = list(range(len(spec.priority_weights)))
+    arrivals = _arrival_times(spec, rng)
+    table = ProcessTable()
+    for _ in range(spec.n_processes):
+        table.at.append(next(arrivals))
+        table.bt.append(_burst(spec, rng))
+        table.priority.append(rng.choices(levels, spec.priority_weights)[0])
+    # PIDs únicos por construcción: no hace falta internarlos uno a uno
+    table.names = StringTable.from_names([f"P{k}" for k in range(1, spec.n_processes + 1)])
+    return table
+
+def generate_resources(spec: ContentionSpec) -> list:
+    rng = random.Random(spec.seed)
+    return [Resource(name=f"R{k}", counter=rng.randint(1, spec.max_counter))
+            for k in range(1, spec.n_resources + 1)]
+
+def iter_actions(spec: ContentionSpec, pids: Sequence[str]) -> Iterator[Action]:
+    """
+    Acciones ordenadas por ciclo sobre los PIDs dados. Un hot_share de los
+    accesos cae en la fracción hot_fraction de recursos (contención).
+    """
+    rng = random.Random(spec.seed)
+    n_hot = max(1, int(spec.n_resources * spec.hot_fraction))
+    hot = [f"R{k}" for k in range(1, n_hot + 1)]
+    cold = [f"R{k}" for k in range(n_hot + 1, spec.n_resources + 1)] or hot
+    step = spec.cycles / spec.n_actions if spec.n_actions else 0
+    for k in range(spec.n_actions):
+        resource = rng.choice(hot if rng.random() < spec.hot_share else cold)
+        action = "READ" if rng.random() < spec.read_ratio else "WRITE"
+        yield Action(pid=rng.choice(pids), action=action, resource=resource,
+                     cycle=int(k * step))
+
+def action_batches(spec: ContentionSpec, pids: Sequence[str],
+                   batch_size: int = 100_000) -> Iterator[ActionTable]:
+    table = ActionTable()
+    for a in iter_actions(spec, pids):
+        table.add(a.pid, a.action, a.resource, a.cycle)
+        if len(table) == batch_size:
+            yield table
+            table = ActionTable()
+    if len(table):
+        yield table
+
+def generate_action_table(spec: ContentionSpec, pids: Sequence[str]) -> ActionTable:
+    table = ActionTable()
+    for a in iter_actions(spec, pids):
+        table.add(a.pid, a.action, a.resource, a.cycle)
+    return table
@@ -0,0 +1,186 @@
+"""
+Cálculo de simulaciones fuera del main loop de Tk.
+
+SimulationPool corre cada algoritmo de calendarización (o la simulación de
+sincronización) en un proceso del pool y devuelve un Future por corrida; la
+interfaz los consulta con after() en vez de esperarlos, así la ventana sigue
+respondiendo y cada algoritmo usa su propio núcleo.
+
+El worker devuelve, junto al timeline, lo que la interfaz iba a calcular
+después sobre él (ciclo final y métricas), para no recorrerlo de nuevo en
+el hilo principal.
+
+Cancelar y seguir el avance cruza procesos con memoria compartida: un
+contador de generación (cancel() lo incrementa y cada corrida en curso se
+aborta en su próxima revisión) y un slot de avance por corrida.
+"""
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from backend.cache import ScheduleCache
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.sincronizacion import SincronizacionSimulator
+from backend.progress import CancelToken, ProgressCallback
+
+# Slots de avance compartidos (se reciclan en ronda)
+PROGRESS_SLOTS = 64
+
+# Estado de cada worker (se crea en el initializer)
+_cache: Optional[ScheduleCache] = None
+_generation = None      # multiprocessing.Value: generación vigente del pool
+_progress = None        # multiprocessing.Array: avance (0–1) por slot
+# Simulador incremental de la última corrida: (algoritmo, generación, sim).
+# Si la siguiente es del mismo algoritmo y su workload solo agrega procesos
+# al final, el worker retoma desde el último checkpoint. Se guarda uno solo
+# por worker, así entre corridas queda a lo sumo un timeline retenido
+_incremental: Optional[Tuple[str, int, CalendarizacionSimulator]] = None
+
+def _init_worker(cache_dir: Optional[str], generation=None, progress=None):
+    global _cache, _generation, _progress, _incremental
+    _cache = ScheduleCache(directory=cache_dir)
+    _generation, _progress = generation, progress
+    _incremental = None
+
+def _incremental_simulator(algorithm: str, generation: int) -> CalendarizacionSimulator:
+    """
+    El simulador de la corrida anterior si es del mismo algoritmo y de la
+    misma generación; si no, lo suelta y crea uno nuevo.
+    """
+    global _incremental
+    if _incremental is not None and _incremental[:2] == (algorithm, generation):
+        return _incremental[2]
+    _incremental = None
+    sim = CalendarizacionSimulator(_cache, incremental=True)
+    _incremental = (algorithm, generation, sim)
+    return sim
+
+class _PoolToken(CancelToken):
+    """Cancelado en cuanto el pool pasa a otra generación."""
+
+    def __init__(self, generation: int):
+        super().__init__()
+        self.generation = generation
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or _generation.value != self.generation
+
+def _job_hooks(job: Optional[Tuple[int, int]]) -> Tuple[Optional[CancelToken],
+                                                       Optional[ProgressCallback]]:
+    """Token y callback de una corrida del pool; (None, None) fuera de él."""
+    if job is None or _generation is None:
+        return None, None
+    generation, slot = job
+    def report(done: int, total: int):
+        _progress[slot] = done / total if total else 1.0
+    return _PoolToken(generation), report
+
+@dataclass
+class SimulationResult:
+    events: object      # List[Event] / EventTable (o su versión con acciones)
+    max_cycle: int
+    metrics: Dict
+
+def run_schedule(processes, algorithm: str, quantum: Optional[int] = None,
+                 job: Optional[Tuple[int, int]] = None) -> SimulationResult:
+    """
+    Una corrida de calendarización completa; se ejecuta en el worker.
+    job = (generación, slot) la vuelve cancelable y reporta su avance.
+    """
+    token, progress = _job_hooks(job)
+    if token is None:
+        sim = CalendarizacionSimulator(_cache)
+    else:
+        sim = _incremental_simulator(algorithm.lower(), token.generation)
+    sim.processes = processes
+    sim.configure(algorithm, quantum, token=token, progress=progress)
+    return SimulationResult(sim.get_events(), sim.get_max_cycle(), sim.get_metrics())
+
+def run_sync(processes, resources, actions, mode: str, queued: bool = False,
+             hold=1, top: int = 5, job: Optional[Tuple[int, int]] = None) -> SimulationResult:
+    """Una corrida de sincronización completa; se ejecuta en el worker."""
+    token, progress = _job_hooks(job)
+    sim = SincronizacionSimulator()
+    sim.processes, sim.resources, sim.actions = processes, resources, actions
+    sim.configure(mode, queued=queued, hold=hold, token=token, progress=progress)
+    return SimulationResult(sim.get_events(), sim.get_max_cycle(), sim.get_metrics(top))
+
+class SimulationPool:
+    """
+    ProcessPoolExecutor que se arranca en el primer submit.
+
+    max_workers: procesos del pool (por defecto, todos los núcleos).
+    cache_dir: directorio de la ScheduleCache de los workers; con el mismo
+    directorio que usa el resto de la app, lo ya calculado se comparte.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Sin lock: un solo escritor por valor y lecturas de un double/entero
+        self._generation = multiprocessing.Value("q", 0, lock=False)
+        self._progress = multiprocessing.Array("d", PROGRESS_SLOTS, lock=False)
+        self._next_slot = 0
+        self._slots: "weakref.WeakKeyDictionary[Future, int]" = weakref.WeakKeyDictionary()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker,
+                initargs=(self.cache_dir, self._generation, self._progress))
+        return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % PROGRESS_SLOTS
+        self._progress[slot] = 0.0
+        future = self._pool().submit(fn, *args, job=(self._generation.value, slot))
+        self._slots[future] = slot
+        return future
+
+    def progress(self, future: Future) -> float:
+        """Fracción completada (0–1) de una corrida enviada por este pool."""
+        if future.done():
+            return 1.0
+        return self._progress[self._slots[future]]
+
+    def cancel(self):
+        """
+        Aborta todo lo enviado hasta ahora: lo que no empezó no corre y lo
+        que está corriendo lanza Cancelled en su próxima revisión, soltando
+        su memoria. El pool sigue disponible para nuevas corridas.
+        """
+        self._generation.value += 1
+        for future in list(self._slots.keys()):
+            future.cancel()
+
+    def submit_schedules(self, processes, algorithms: Iterable[str],
+                         quantum: Optional[int] = None) -> Dict[str, Future]:
+        """
+        Un Future por algoritmo, cada uno con su SimulationResult. El
+        quantum solo se pasa a Round Robin.
+        """
+        return {
+            alg: self._submit(run_schedule, processes, alg,
+                              quantum if alg.lower() == "round robin" else None)
+            for alg in algorithms
+        }
+
+    def submit_sync(self, processes, resources, actions, mode: str,
+                    queued: bool = False, hold=1, top: int = 5) -> Future:
+        return self._submit(run_sync, processes, resources, actions,
+                            mode, queued, hold, top)
+
+    def shutdown(self):
+        """Aborta lo pendiente y suelta los workers sin esperarlos."""
+        # cancel() ya canceló lo que no empezó (cancel_futures es de 3.9+)
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
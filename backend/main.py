@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+import asyncio
 import argparse
 from typing import List
 
@@ -9,22 +10,56 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from backend.parsers    import load_processes, load_resources, load_actions, ParseError
-from backend.scheduling import fifo, sjf, srt, rr, priority_np, Event
-from backend.sincronizacion import SincronizacionSimulator
+from backend.parsers    import (load_processes, load_resources, load_actions, ParseError,
+                                load_processes_table, load_actions_table, ParseStats)
+from backend.scheduling import Event, iter_fifo, iter_sjf, iter_srt, iter_rr, iter_priority_np
+from backend.sincronizacion import SincronizacionSimulator, MODES, compare_modes, format_comparison
 from backend.calendarizacion import CalendarizacionSimulator
 from backend.engine     import SimulationEngine
-from backend.metrics    import compute_metrics
+from backend.async_engine import AsyncPlaybackEngine
+from backend.metrics    import compute_metrics, MetricsStream
+from backend.eventlog   import write_events, write_event_log, log_path, EventLog
+from backend.cache      import WorkloadCache, ScheduleCache
+from backend.sweep      import run_sweep, format_table, write_csv
+from backend.progress   import CancelToken, Cancelled, cancel_on_sigint, console_progress
 
-def load_all():
+# Nombre de cada --alg para CalendarizacionSimulator.configure
+ALGORITHMS = {'fifo': 'fifo', 'sjf': 'sjf', 'srt': 'srt', 'rr': 'round robin', 'priority': 'priority'}
+# Versión en streaming de cada --alg (Round Robin recibe además el quantum)
+STREAMS = {'fifo': iter_fifo, 'sjf': iter_sjf, 'srt': iter_srt, 'rr': iter_rr,
+           'priority': iter_priority_np}
+
+def load_all(bulk: bool = False, cache: WorkloadCache = None):
     datos = os.path.join(project_root, 'datos')
-    procs = load_processes( os.path.join(datos, 'procesos.txt') )
+    if not bulk and cache is None:
+        procs = load_processes( os.path.join(datos, 'procesos.txt') )
+        res   = load_resources( os.path.join(datos, 'recursos.txt') )
+        acts  = load_actions( os.path.join(datos, 'acciones.txt') )
+        return procs, res, acts
+
+    # Carga masiva a tablas columnares, reportando throughput
+    # (con cache, solo se parsea lo que no esté ya guardado)
+    p_stats, a_stats = ParseStats(), ParseStats()
+    load_p = cache.load_processes if cache else load_processes_table
+    load_a = cache.load_actions   if cache else load_actions_table
+    procs = load_p( os.path.join(datos, 'procesos.txt'), p_stats )
     res   = load_resources( os.path.join(datos, 'recursos.txt') )
-    acts  = load_actions( os.path.join(datos, 'acciones.txt') )
+    acts  = load_a( os.path.join(datos, 'acciones.txt'), a_stats )
+    for name, st in (('procesos', p_stats), ('acciones', a_stats)):
+        if st.lines:
+            print(f"Parseo {name}: {st.lines} líneas en {st.seconds:.3f}s "
+                  f"({st.lines_per_sec:,.0f} líneas/s)")
+    if cache:
+        print(f"Cache de workloads: {cache.hits} aciertos, {cache.misses} fallos")
     return procs, res, acts
 
 def simulate_with_engine(events: List[Event], delay: float = 0.2):
-    max_cycle = max(e.end for e in events)
+    # Tablas y logs conocen su último ciclo por columna: así un EventLog se
+    # recorre (y materializa) una sola vez, dentro del engine
+    if hasattr(events, "max_end"):
+        max_cycle = events.max_end()
+    else:
+        max_cycle = max((e.end for e in events), default=0)
     def on_cycle(cycle: int, evs: List[Event]):
         if evs:
             # si el evento tiene atributo status, lo incluimos
@@ -38,13 +73,53 @@ def simulate_with_engine(events: List[Event], delay: float = 0.2):
             print(f"[ Ciclo {cycle:3d} ] ──", ", ".join(details))
         else:
             print(f"[ Ciclo {cycle:3d} ] (no inicia ningún proceso)")
-    engine = SimulationEngine(events, on_cycle, max_cycle)
+    if delay <= 0:
+        # Sin animación: solo ciclos con eventos, lo más rápido posible
+        engine = SimulationEngine(events, on_cycle, max_cycle, sparse=True)
+        print(f"\n▶▶▶ Simulación headless hasta ciclo {max_cycle}\n")
+        rate = engine.run_headless()
+        print(f"\n✅ Simulación finalizada ({rate:,.0f} ciclos/s).\n")
+        return
+    # Ritmo fijo contra el reloj: lo que tarda cada ciclo no se suma al delay
+    engine = AsyncPlaybackEngine(events, on_cycle, max_cycle, delay)
     print(f"\n▶▶▶ Iniciando simulación hasta ciclo {max_cycle} (delay={delay}s)\n")
-    while engine.current <= engine.max_cycle:
-        engine.step()
-        time.sleep(delay)
+    asyncio.run(engine.run())
     print("\n✅ Simulación finalizada.\n")
 
+def stream_schedule(procs, alg: str, quantum: int, path: str, show_progress: bool = False):
+    """
+    Calendariza en streaming: cada evento va a 'path' y a las métricas a
+    medida que se decide, sin guardar el timeline ni animarlo.
+    """
+    stream = MetricsStream(procs)
+    args = (quantum,) if alg == 'rr' else ()
+    t0 = time.perf_counter()
+    with cancel_on_sigint(CancelToken()) as token:
+        events = STREAMS[alg](procs, *args, token=token,
+                              progress=console_progress(alg.upper()) if show_progress else None)
+        count = write_events(stream.observe(events), path)
+    seconds = time.perf_counter() - t0
+    metrics = stream.result()
+    print(f"\n{count} eventos escritos en {path} ({count / seconds if seconds else 0:,.0f} eventos/s), "
+          f"hasta el ciclo {stream.max_cycle}")
+    print(f"Métricas de {alg.upper()}:")
+    print(f"  Avg Waiting Time    = {metrics['avg_waiting_time']:.2f}")
+    print(f"  Avg Turnaround Time = {metrics['avg_turnaround_time']:.2f}")
+
+def replay_logs(paths: List[str], delay: float):
+    """Reproduce logs binarios sin cargar archivos de entrada ni simular."""
+    for path in paths:
+        with EventLog(path) as log:
+            print(f"\n=== {log.label or path}: {len(log)} eventos ===")
+            simulate_with_engine(log, delay=delay)
+
+def parse_quanta(spec: str) -> List[int]:
+    """'1,2,4' o rango inclusivo '1-8' → lista de quantum."""
+    if '-' in spec:
+        lo, hi = (int(x) for x in spec.split('-', 1))
+        return list(range(lo, hi + 1))
+    return [int(x) for x in spec.split(',') if x.strip()]
+
 def main():
     parser = argparse.ArgumentParser(description="Prueba de distintos algoritmos de scheduling y sincronización")
     parser.add_argument('-m','--mode', choices=['sched','sync'], default='sync',
@@ -55,29 +130,89 @@ def main():
                         help="Quantum para Round Robin (solo en modo sched)")
     parser.add_argument('-d','--delay', type=float, default=0.05,
                         help="Delay en segundos entre ciclos de simulación")
+    parser.add_argument('--queued', action='store_true',
+                        help="Sincronización con colas FIFO por recurso, retención y liberación (modo sync)")
+    parser.add_argument('--hold', type=int, default=1,
+                        help="Ciclos que se retiene un recurso con --queued")
+    parser.add_argument('--compare', action='store_true',
+                        help="Compara mutex, semaphore y rwlock sobre la misma traza (modo sync, sin animación)")
+    parser.add_argument('--bulk', action='store_true',
+                        help="Carga masiva (mmap + columnar) para archivos grandes")
+    parser.add_argument('--cache', nargs='?', const='', default=None, metavar='DIR',
+                        help="Usa la cache binaria de workloads parseados (implica --bulk)")
+    parser.add_argument('--cache-max-mb', type=int, default=1024,
+                        help="Presupuesto de disco de la cache en MB")
+    parser.add_argument('--sweep', action='store_true',
+                        help="Corre todos los algoritmos en paralelo y compara métricas (sin animación)")
+    parser.add_argument('--quanta', default='1,2,4,8',
+                        help="Quantum de Round Robin para --sweep: '1,2,4' o rango '1-8'")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos del pool para --sweep (por defecto, todos los núcleos)")
+    parser.add_argument('--out', default=None,
+                        help="CSV donde escribir la tabla de --sweep")
+    parser.add_argument('--stream', default=None, metavar='CSV',
+                        help="Modo sched: escribe los eventos en CSV a medida que se deciden, "
+                             "sin guardar el timeline ni animarlo")
+    parser.add_argument('--save-log', default=None, metavar='EVLOG',
+                        help="Guarda el timeline calculado en un log binario (modos sched y sync; "
+                             "en sync, uno por modo)")
+    parser.add_argument('--replay', nargs='+', default=None, metavar='EVLOG',
+                        help="Reproduce logs guardados con --save-log, sin cargar ni simular")
     args = parser.parse_args()
 
     try:
-        procs, res, acts = load_all()
+        if args.replay:
+            replay_logs(args.replay, args.delay)
+            return
+
+        cache = None
+        if args.cache is not None:
+            cache = WorkloadCache(args.cache or None, args.cache_max_mb * 1024 * 1024)
+            args.bulk = True
+        procs, res, acts = load_all(args.bulk, cache)
         print("\n=== Objetos Cargados ===")
-        print("Procesos:", procs)
-        print("Recursos:", res)
-        print("Acciones:", acts)
-
-        if args.mode == 'sched':
-            # Calendarización
-            if args.alg == 'fifo':
-                events = fifo(procs)
-            elif args.alg == 'sjf':
-                events = sjf(procs)
-            elif args.alg == 'srt':
-                events = srt(procs)
-            elif args.alg == 'rr':
-                events = rr(procs, quantum=args.quantum)
-            elif args.alg == 'priority':
-                events = priority_np(procs)
-            else:
+        if args.bulk:
+            print(f"Procesos: {len(procs)}, Recursos: {len(res)}, Acciones: {len(acts)}")
+        else:
+            print("Procesos:", procs)
+            print("Recursos:", res)
+            print("Acciones:", acts)
+
+        if args.sweep:
+            # Barrido: todos los algoritmos en un pool, sin SimulationEngine
+            quanta = parse_quanta(args.quanta)
+            t0 = time.perf_counter()
+            rows = run_sweep(procs, quanta, workers=args.workers)
+            print(f"\n=== Barrido ({len(rows)} corridas, {time.perf_counter() - t0:.2f}s) ===")
+            print(format_table(rows))
+            if args.out:
+                write_csv(rows, args.out)
+                print(f"\nResultados escritos en {args.out}")
+
+        elif args.mode == 'sched' and args.stream:
+            # Memoria constante en la salida: ni timeline ni animación
+            stream_schedule(procs, args.alg, args.quantum, args.stream, args.bulk)
+
+        elif args.mode == 'sched':
+            # Calendarización (con --cache, el timeline se reutiliza entre ejecuciones)
+            if args.alg not in ALGORITHMS:
                 sys.exit("Algoritmo desconocido")
+            schedules = None
+            if cache:
+                schedules = ScheduleCache(directory=cache.directory, max_disk_bytes=cache.max_bytes)
+            sim = CalendarizacionSimulator(schedules)
+            sim.processes = procs
+            # Ctrl-C aborta el cálculo; con --bulk se muestra el avance
+            with cancel_on_sigint(CancelToken()) as token:
+                sim.configure(ALGORITHMS[args.alg], args.quantum if args.alg == 'rr' else None,
+                              token=token,
+                              progress=console_progress(args.alg.upper()) if args.bulk else None)
+            events = sim.get_events()
+            if args.save_log:
+                write_event_log(events, args.save_log, args.alg.upper())
+                print(f"Timeline guardado en {args.save_log}")
+            if schedules:
+                print(f"Cache de calendarizaciones: {schedules.hits} aciertos, {schedules.misses} fallos")
 
             metrics = compute_metrics(events, procs)
             print(f"\nMétricas de {args.alg.upper()}:")
@@ -88,6 +223,13 @@ def main():
 
             simulate_with_engine(events, delay=args.delay)
 
+        elif args.compare:
+            # Misma traza con cada modo: throughput y esperas frente a mutex
+            rows = compare_modes(res, acts, MODES, queued=args.queued, hold=args.hold)
+            engine = "colas FIFO" if args.queued else "por ciclo"
+            print(f"\n=== Comparación de modos ({engine}) ===")
+            print(format_comparison(rows))
+
         else:
             # Sincronización: ejecutamos ambos modos
             for mode in ('mutex', 'semaphore'):
@@ -95,15 +237,28 @@ def main():
                 sim.processes = procs
                 sim.resources = res
                 sim.actions   = acts
-                sim.configure(mode)
+                with cancel_on_sigint(CancelToken()) as token:
+                    sim.configure(mode, queued=args.queued, hold=args.hold, token=token,
+                                  progress=console_progress(mode.upper()) if args.bulk else None)
 
                 events = sim.get_events()
-                acc  = sum(1 for ev in events if ev.status == 'ACCESED')
-                wait = sum(1 for ev in events if ev.status != 'ACCESED')
+                m = sim.get_metrics()
+                if args.save_log:
+                    path = log_path(args.save_log, mode)
+                    write_event_log(events, path, mode)
+                    print(f"Timeline guardado en {path}")
 
                 print(f"\n=== Sincronización con {mode.upper()} ===")
-                print(f"Accesos totales: {acc}")
-                print(f"Esperas totales: {wait}")
+                print(f"Accesos totales: {m['acquisitions']}")
+                print(f"Esperas totales: {m['waits']}")
+                print(f"Espera media/máx: {m['avg_wait']:.2f} / {m['max_wait']} ciclos, "
+                      f"{m['acquisitions_per_cycle']:.2f} accesos/ciclo (pico {m['peak_acquisitions']})")
+                print("Recursos más disputados:")
+                for name in m['hot_resources']:
+                    r = m['per_resource'][name]
+                    print(f"  {name}: uso {r['utilization']:.0%}, esperas {r['waits']} "
+                          f"(media {r['avg_wait']:.2f}, máx {r['max_wait']}), "
+                          f"cola máx {r['max_queue']}, media {r['avg_queue']:.2f}")
 
                 simulate_with_engine(events, delay=args.delay)
 
@@ -111,6 +266,8 @@ def main():
         print('❌ Archivo no encontrado:', fnf)
     except ParseError as pe:
         print('❌ Error de parseo:', pe)
+    except Cancelled:
+        print('\n⏹ Simulación cancelada')
     except Exception as e:
         print('❌ Error inesperado:', e)
 
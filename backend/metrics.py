@@ -1,10 +1,16 @@
-from typing import List, Dict
-from collections import defaultdict
+from array import array
+from typing import Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 
 from backend.models   import Process
 from backend.scheduling import Event
+from backend.columnar import ProcessTable, EventTable
 
-def compute_metrics(events: List[Event], processes: List[Process]) -> Dict:
+try:  # NumPy es opcional: acelera compute_metric_arrays si está instalado
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+def compute_metrics(events: Sequence[Event], processes: Sequence[Process]) -> Dict:
     """
     Dada la lista de eventos y la lista de procesos, calcula:
       - waiting_time por proceso  = turnaround_time - burst_time
@@ -21,14 +27,22 @@ def compute_metrics(events: List[Event], processes: List[Process]) -> Dict:
       "avg_waiting_time": float,
       "avg_turnaround_time": float
     }
+
+    Si events es un EventTable y processes un ProcessTable, el cálculo se
+    hace sobre columnas con compute_metric_arrays.
     """
+    if isinstance(events, EventTable) and isinstance(processes, ProcessTable):
+        return _metrics_from_tables(events, processes)
+
     # map pid → Process
     proc_map = {p.pid: p for p in processes}
 
-    # agrupar todos los eventos por pid
-    ev_by_pid = defaultdict(list)
+    # fin de cada pid = máximo end de sus eventos
+    finish: Dict[str, int] = {}
     for e in events:
-        ev_by_pid[e.pid].append(e)
+        f = finish.get(e.pid)
+        if f is None or e.end > f:
+            finish[e.pid] = e.end
 
     per_proc = {}
     total_wait = 0.0
@@ -36,13 +50,12 @@ def compute_metrics(events: List[Event], processes: List[Process]) -> Dict:
     n = len(processes)
 
     for pid, proc in proc_map.items():
-        evs = sorted(ev_by_pid.get(pid, []), key=lambda e: e.start)
-        if not evs:
+        finish_time = finish.get(pid)
+        if finish_time is None:
             # proceso nunca ejecutado
             turnaround = 0
             waiting    = 0
         else:
-            finish_time = max(e.end for e in evs)
             turnaround  = finish_time - proc.at
             waiting     = turnaround - proc.bt
 
@@ -58,3 +71,310 @@ def compute_metrics(events: List[Event], processes: List[Process]) -> Dict:
         "avg_waiting_time": total_wait / n if n else 0.0,
         "avg_turnaround_time": total_ta / n if n else 0.0
     }
+
+def _event_rows(events: EventTable, processes: ProcessTable) -> Optional[List[int]]:
+    """Traduce los ids de PID del timeline a filas del ProcessTable (-1 si no existe)."""
+    if events.names is processes.names:
+        return None
+    ids = processes.names.ids
+    return [ids.get(name, -1) for name in events.names.names]
+
+def compute_metric_arrays(events: EventTable, processes: ProcessTable) -> Tuple:
+    """
+    Versión columnar de compute_metrics: devuelve (turnaround, waiting), dos
+    arrays alineados con las filas de processes (0 para procesos que nunca
+    corrieron). Con NumPy son ndarrays int64 calculados con un group-by-max
+    del end por PID; sin NumPy, array('q') calculados en un solo recorrido.
+    """
+    n = len(processes)
+    remap = _event_rows(events, processes)
+
+    if np is not None:
+        rows  = np.frombuffer(events.pid_ids, dtype=events.pid_ids.typecode).astype(np.int64)
+        ends  = np.frombuffer(events.end, dtype=np.int64)
+        if remap is not None and len(remap):
+            rows = np.asarray(remap, dtype=np.int64)[rows]
+        known = (rows >= 0) & (rows < n)
+        rows, ends = rows[known], ends[known]
+        finish = np.zeros(n, dtype=np.int64)
+        np.maximum.at(finish, rows, ends)
+        ran = np.bincount(rows, minlength=n)[:n] > 0
+        at = np.frombuffer(processes.at, dtype=np.int64)
+        bt = np.frombuffer(processes.bt, dtype=np.int64)
+        turnaround = np.where(ran, finish - at, 0)
+        waiting    = np.where(ran, turnaround - bt, 0)
+        return turnaround, waiting
+
+    finish = [-1] * n
+    ends = events.end
+    for k, pid_id in enumerate(events.pid_ids):
+        row = pid_id if remap is None else remap[pid_id]
+        if 0 <= row < n and ends[k] > finish[row]:
+            finish[row] = ends[k]
+    turnaround = array("q", bytes(8 * n))
+    waiting    = array("q", bytes(8 * n))
+    at, bt = processes.at, processes.bt
+    for row in range(n):
+        if finish[row] >= 0:
+            turnaround[row] = finish[row] - at[row]
+            waiting[row]    = turnaround[row] - bt[row]
+    return turnaround, waiting
+
+def _metrics_from_tables(events: EventTable, processes: ProcessTable) -> Dict:
+    turnaround, waiting = compute_metric_arrays(events, processes)
+    n = len(processes)
+    names = processes.names.names
+    wt, ta = waiting.tolist(), turnaround.tolist()
+    per_proc = {
+        names[row]: {"waiting_time": wt[row], "turnaround_time": ta[row]}
+        for row in range(n)
+    }
+    return {
+        "per_process": per_proc,
+        "avg_waiting_time": sum(wt) / n if n else 0.0,
+        "avg_turnaround_time": sum(ta) / n if n else 0.0
+    }
+
+class MetricsStream:
+    """
+    compute_metrics sobre un flujo de eventos (p. ej. el de iter_rr) sin
+    guardarlo: solo se lleva el fin de cada proceso, así que la memoria
+    depende de la cantidad de procesos y no de la de eventos.
+
+        stream = MetricsStream(procs)
+        write_events(stream.observe(iter_rr(procs, 2)), "timeline.csv")
+        stream.result()   # mismo dict que compute_metrics
+    """
+
+    def __init__(self, processes: Sequence[Process]):
+        if isinstance(processes, ProcessTable):
+            self.pids = processes.names.names
+            self.rows = processes.names.ids
+            self.at, self.bt = processes.at, processes.bt
+        else:
+            self.pids = [p.pid for p in processes]
+            # Con PIDs repetidos vale el último, igual que en compute_metrics
+            self.rows = {pid: row for row, pid in enumerate(self.pids)}
+            self.at = [p.at for p in processes]
+            self.bt = [p.bt for p in processes]
+        self.finish = array("q", [-1]) * len(self.pids)
+        self.events = 0
+        self.max_cycle = 0
+
+    def add(self, e: Event):
+        self.consume((e,))
+
+    def consume(self, events: Iterable[Event]) -> "MetricsStream":
+        """Agota 'events' registrando cada uno."""
+        rows, finish = self.rows, self.finish
+        count, last = self.events, self.max_cycle
+        for e in events:
+            count += 1
+            end = e.end
+            if end > last:
+                last = end
+            row = rows.get(e.pid)
+            if row is not None and end > finish[row]:
+                finish[row] = end
+        self.events, self.max_cycle = count, last
+        return self
+
+    def observe(self, events: Iterable[Event]) -> Iterator[Event]:
+        """Registra cada evento y lo deja pasar (para encadenar con un writer)."""
+        rows, finish = self.rows, self.finish
+        for e in events:
+            self.events += 1
+            end = e.end
+            if end > self.max_cycle:
+                self.max_cycle = end
+            row = rows.get(e.pid)
+            if row is not None and end > finish[row]:
+                finish[row] = end
+            yield e
+
+    def result(self) -> Dict:
+        per_proc = {}
+        total_wait = 0
+        total_ta = 0
+        n = len(self.pids)
+        finish, at, bt = self.finish, self.at, self.bt
+        for pid, row in self.rows.items():
+            if finish[row] < 0:
+                # proceso nunca ejecutado
+                turnaround = waiting = 0
+            else:
+                turnaround = finish[row] - at[row]
+                waiting    = turnaround - bt[row]
+            per_proc[pid] = {"waiting_time": waiting, "turnaround_time": turnaround}
+            total_wait += waiting
+            total_ta   += turnaround
+        return {
+            "per_process": per_proc,
+            "avg_waiting_time": total_wait / n if n else 0.0,
+            "avg_turnaround_time": total_ta / n if n else 0.0
+        }
+
+class _ResourceStats:
+    __slots__ = ("capacity", "arrivals", "acquisitions", "held", "active", "busy", "busy_since",
+                 "waits", "wait_total", "wait_max",
+                 "queue", "queue_max", "queue_area", "queue_since", "queue_series")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.arrivals = 0          # acciones que pidieron el recurso
+        self.acquisitions = 0
+        self.held = 0              # ciclos-permiso retenidos (suma de holds)
+        self.active = 0            # accesos en curso
+        self.busy = 0              # ciclos con al menos un acceso en curso
+        self.busy_since = 0
+        self.waits = 0             # acciones que tuvieron que esperar
+        self.wait_total = 0
+        self.wait_max = 0
+        self.queue = 0             # largo actual de la cola
+        self.queue_max = 0
+        self.queue_area = 0        # ∫ largo de cola dt, para el promedio
+        self.queue_since = 0       # ciclo del último cambio de largo
+        self.queue_series: List[Tuple[int, int]] = []  # (ciclo, largo) en cada cambio
+
+    def set_queue(self, now: int, length: int):
+        self.queue_area += self.queue * (now - self.queue_since)
+        self.queue_since = now
+        self.queue = length
+        self.queue_max = max(self.queue_max, length)
+        series = self.queue_series
+        if series and series[-1][0] == now:
+            series[-1] = (now, length)
+        else:
+            series.append((now, length))
+
+class SyncStats:
+    """
+    Métricas de contención que los simuladores de sincronización llenan
+    en la misma pasada que generan los eventos (se pasa como 'stats', igual
+    que ParseStats en los parsers).
+
+    Por recurso: adquisiciones, utilización (con capacidad > 1, ciclos
+    retenidos sobre capacidad × duración; si no, fracción del tiempo en que
+    alguien lo tiene, así varios lectores de un rwlock no la inflan),
+    esperas (cantidad, media y máxima) y largo de la cola en el tiempo.
+    Global: esperas, adquisiciones por ciclo y ranking de recursos más
+    disputados. La espera media, global o por recurso, se promedia sobre
+    todas las acciones que llegaron (las que no esperaron cuentan 0).
+    """
+
+    def __init__(self):
+        self.resources: Dict[str, _ResourceStats] = {}
+        self.acquisitions_by_cycle: Dict[int, int] = {}
+        self.arrivals = 0
+        self.first = None          # primer ciclo con actividad
+        self.last = 0              # último fin de retención o espera
+
+    # -- ganchos para los simuladores --------------------------------------
+
+    def _resource(self, name: str, capacity: int = 1) -> _ResourceStats:
+        rs = self.resources.get(name)
+        if rs is None:
+            rs = self.resources[name] = _ResourceStats(capacity)
+        return rs
+
+    def arrive(self, resource: str, capacity: int, now: int):
+        self._resource(resource, capacity).arrivals += 1
+        self.arrivals += 1
+        if self.first is None or now < self.first:
+            self.first = now
+
+    def enqueue(self, resource: str, now: int):
+        rs = self.resources[resource]
+        rs.set_queue(now, rs.queue + 1)
+
+    def grant(self, resource: str, arrived: int, now: int, end: int):
+        """Adquisición en 'now' de una acción que llegó en 'arrived'."""
+        rs = self.resources[resource]
+        rs.acquisitions += 1
+        rs.held += end - now
+        if rs.active == 0:
+            rs.busy_since = now
+        rs.active += 1
+        if now > arrived:
+            rs.set_queue(now, rs.queue - 1)
+            self._wait(rs, now - arrived)
+        by_cycle = self.acquisitions_by_cycle
+        by_cycle[now] = by_cycle.get(now, 0) + 1
+        self.last = max(self.last, end)
+
+    def release(self, resource: str, now: int):
+        rs = self.resources[resource]
+        rs.active -= 1
+        if rs.active == 0:
+            rs.busy += now - rs.busy_since
+
+    def give_up(self, resource: str, arrived: int, now: int):
+        """Una acción en cola se retira en 'now' sin acceder."""
+        rs = self.resources[resource]
+        rs.set_queue(now, rs.queue - 1)
+        self._wait(rs, now - arrived)
+        self.last = max(self.last, now)
+
+    @staticmethod
+    def _wait(rs: _ResourceStats, wait: int):
+        rs.waits += 1
+        rs.wait_total += wait
+        rs.wait_max = max(rs.wait_max, wait)
+
+    # -- resultados --------------------------------------------------------
+
+    @property
+    def span(self) -> int:
+        return self.last - (self.first or 0)
+
+    def utilization(self, resource: str) -> float:
+        rs = self.resources[resource]
+        span = self.span
+        if not span:
+            return 0.0
+        if rs.capacity > 1:
+            return rs.held / (rs.capacity * span)
+        return rs.busy / span
+
+    def queue_length(self, resource: str) -> List[Tuple[int, int]]:
+        """Largo de la cola de 'resource' como función escalón: (ciclo, largo)."""
+        return list(self.resources[resource].queue_series)
+
+    def per_resource(self) -> Dict[str, Dict]:
+        span = self.span
+        out = {}
+        for name, rs in self.resources.items():
+            out[name] = {
+                "capacity": rs.capacity,
+                "acquisitions": rs.acquisitions,
+                "utilization": self.utilization(name),
+                "waits": rs.waits,
+                "wait_total": rs.wait_total,
+                # Igual que en summary: por acción que llegó, esperara o no
+                "avg_wait": rs.wait_total / rs.arrivals if rs.arrivals else 0.0,
+                "max_wait": rs.wait_max,
+                "max_queue": rs.queue_max,
+                "avg_queue": rs.queue_area / span if span else 0.0,
+            }
+        return out
+
+    def hot_resources(self, top: int = 10, key: str = "wait_total") -> List[Tuple[str, Dict]]:
+        """Recursos ordenados por 'key' (por defecto, ciclos totales de espera)."""
+        ranked = sorted(self.per_resource().items(), key=lambda kv: kv[1][key], reverse=True)
+        return ranked[:top]
+
+    def summary(self) -> Dict:
+        acquisitions = sum(rs.acquisitions for rs in self.resources.values())
+        waits = sum(rs.waits for rs in self.resources.values())
+        wait_total = sum(rs.wait_total for rs in self.resources.values())
+        span = self.span
+        return {
+            "arrivals": self.arrivals,
+            "acquisitions": acquisitions,
+            "waits": waits,
+            "avg_wait": wait_total / self.arrivals if self.arrivals else 0.0,
+            "max_wait": max((rs.wait_max for rs in self.resources.values()), default=0),
+            "cycles": span,
+            "acquisitions_per_cycle": acquisitions / span if span else 0.0,
+            "peak_acquisitions": max(self.acquisitions_by_cycle.values(), default=0),
+        }
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 
+# __slots__ explícitos: sin __dict__ por instancia (dataclass(slots=True) pide 3.10+)
+
 @dataclass
 class Process:
+    __slots__ = ("pid", "bt", "at", "priority")
     pid: str
     bt: int       # Burst Time
     at: int       # Arrival Time
@@ -9,12 +12,27 @@ class Process:
 
 @dataclass
 class Resource:
+    __slots__ = ("name", "counter")
     name: str
     counter: int
 
 @dataclass
 class Action:
+    __slots__ = ("pid", "action", "resource", "cycle")
     pid: str
     action: str  
     resource: str
     cycle: int
+
+@dataclass
+class Event:
+    __slots__ = ("pid", "start", "end")
+    pid: str
+    start: int
+    end: int
+
+@dataclass
+class ActionEvent(Event):
+    __slots__ = ("resource", "status")
+    resource: str
+    status: str  # 'ACCESED' o 'WAITING'
@@ -1,11 +1,58 @@
 import os
-from typing import List
+import mmap
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Callable, Iterator, List, Optional, Tuple
 from backend.models import Process, Resource, Action
+from backend.columnar import ProcessTable, ActionTable, ACTION_CODES
 
 class ParseError(Exception):
     """Error al leer/parsing de una línea."""
     pass
 
+# Tiempos y ciclos se guardan en columnas int64 (ProcessTable, ActionTable):
+# ambos loaders rechazan lo que no entra, así aceptan las mismas entradas
+_MAX_INT64 = 2 ** 63 - 1
+
+def _check_width(path: str, lineno: int, *values: int):
+    """ParseError si algún valor no entra en un entero de 64 bits."""
+    for value in values:
+        if value > _MAX_INT64:
+            raise ParseError(f"{path}:{lineno} → valor fuera de rango para 64 bits: {value}")
+
+def _parse_process_line(path: str, lineno: int, line: str, seen_pids: set) -> Process:
+    parts = [p.strip() for p in line.split(',')]
+    if len(parts) != 4:
+        raise ParseError(f"{path}:{lineno} → se esperaban 4 campos, encontré {len(parts)}")
+
+    pid, bt_s, at_s, prio_s = parts
+
+    # Detección de PID duplicado
+    if pid in seen_pids:
+        raise ParseError(f"{path}:{lineno} → PID duplicado: '{pid}'")
+    seen_pids.add(pid)
+
+    # Conversión a enteros
+    try:
+        bt   = int(bt_s)
+        at   = int(at_s)
+        prio = int(prio_s)
+    except ValueError as e:
+        raise ParseError(f"{path}:{lineno} → valor no entero: {e}")
+
+    # Validaciones de rango
+    if bt < 0:
+        raise ParseError(f"{path}:{lineno} → Burst Time debe ser ≥ 0, encontrado {bt}")
+    if at < 0:
+        raise ParseError(f"{path}:{lineno} → Arrival Time debe ser ≥ 0, encontrado {at}")
+    if not (0 <= prio <= 10):
+        raise ParseError(f"{path}:{lineno} → Priority fuera de rango 0–10: {prio}")
+    _check_width(path, lineno, bt, at)
+
+    return Process(pid=pid, bt=bt, at=at, priority=prio)
+
 def load_processes(path: str) -> List[Process]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"'{path}' no existe")
@@ -17,35 +64,7 @@ def load_processes(path: str) -> List[Process]:
             line = line.strip()
             if not line or line.startswith('#'):
                 continue
-
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) != 4:
-                raise ParseError(f"{path}:{lineno} → se esperaban 4 campos, encontré {len(parts)}")
-
-            pid, bt_s, at_s, prio_s = parts
-
-            # Detección de PID duplicado
-            if pid in seen_pids:
-                raise ParseError(f"{path}:{lineno} → PID duplicado: '{pid}'")
-            seen_pids.add(pid)
-
-            # Conversión a enteros
-            try:
-                bt   = int(bt_s)
-                at   = int(at_s)
-                prio = int(prio_s)
-            except ValueError as e:
-                raise ParseError(f"{path}:{lineno} → valor no entero: {e}")
-
-            # Validaciones de rango
-            if bt < 0:
-                raise ParseError(f"{path}:{lineno} → Burst Time debe ser ≥ 0, encontrado {bt}")
-            if at < 0:
-                raise ParseError(f"{path}:{lineno} → Arrival Time debe ser ≥ 0, encontrado {at}")
-            if not (0 <= prio <= 10):
-                raise ParseError(f"{path}:{lineno} → Priority fuera de rango 0–10: {prio}")
-
-            processes.append(Process(pid=pid, bt=bt, at=at, priority=prio))
+            processes.append(_parse_process_line(path, lineno, line, seen_pids))
 
     return processes
 
@@ -86,6 +105,29 @@ def load_resources(path: str) -> List[Resource]:
     return resources
 
 
+def _parse_action_line(path: str, lineno: int, line: str) -> Action:
+    parts = [p.strip() for p in line.split(',')]
+    if len(parts) != 4:
+        raise ParseError(f"{path}:{lineno} → se esperaban 4 campos, encontré {len(parts)}")
+
+    pid, action_s, resource, cycle_s = parts
+
+    # Normalizar y validar tipo de acción
+    action = action_s.upper()
+    if action not in {"READ", "WRITE"}:
+        raise ParseError(f"{path}:{lineno} → acción desconocida: '{action_s}' (debe ser READ o WRITE)")
+
+    # Conversión y validación de ciclo
+    try:
+        cycle = int(cycle_s)
+    except ValueError as e:
+        raise ParseError(f"{path}:{lineno} → ciclo no entero: {e}")
+    if cycle < 0:
+        raise ParseError(f"{path}:{lineno} → ciclo debe ser ≥0, encontrado {cycle}")
+    _check_width(path, lineno, cycle)
+
+    return Action(pid=pid, action=action, resource=resource, cycle=cycle)
+
 def load_actions(path: str) -> List[Action]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"'{path}' no existe")
@@ -96,26 +138,182 @@ def load_actions(path: str) -> List[Action]:
             line = line.strip()
             if not line or line.startswith('#'):
                 continue
+            actions.append(_parse_action_line(path, lineno, line))
 
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) != 4:
-                raise ParseError(f"{path}:{lineno} → se esperaban 4 campos, encontré {len(parts)}")
+    return actions
 
-            pid, action_s, resource, cycle_s = parts
 
-            # Normalizar y validar tipo de acción
-            action = action_s.upper()
-            if action not in {"READ", "WRITE"}:
-                raise ParseError(f"{path}:{lineno} → acción desconocida: '{action_s}' (debe ser READ o WRITE)")
+# ---------------------------------------------------------------------------
+# Carga masiva: archivo mapeado en memoria → tablas columnares
+# ---------------------------------------------------------------------------
 
-            # Conversión y validación de ciclo
-            try:
-                cycle = int(cycle_s)
-            except ValueError as e:
-                raise ParseError(f"{path}:{lineno} → ciclo no entero: {e}")
-            if cycle < 0:
-                raise ParseError(f"{path}:{lineno} → ciclo debe ser ≥0, encontrado {cycle}")
+# Tamaño aproximado de cada bloque procesado de una vez
+BULK_CHUNK_BYTES = 16 * 1024 * 1024
 
-            actions.append(Action(pid=pid, action=action, resource=resource, cycle=cycle))
+@dataclass
+class ParseStats:
+    lines: int = 0       # líneas leídas (incluye comentarios y vacías)
+    rows: int = 0        # registros cargados
+    seconds: float = 0.0
 
-    return actions
+    @property
+    def lines_per_sec(self) -> float:
+        return self.lines / self.seconds if self.seconds else 0.0
+
+def _iter_chunks(path: str, chunk_bytes: int) -> Iterator[Tuple[int, str]]:
+    """
+    Recorre el archivo mapeado en memoria en bloques que terminan en salto de
+    línea. Devuelve (número de la primera línea del bloque, texto).
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            lineno = 1
+            while pos < size:
+                end = pos + chunk_bytes
+                if end >= size:
+                    end = size
+                else:
+                    nl = mm.find(b'\n', end)
+                    end = size if nl == -1 else nl + 1
+                text = mm[pos:end].decode('utf-8')
+                yield lineno, text
+                lineno += text.count('\n')
+                pos = end
+
+def _chunk_columns(text: str, lines: List[str]) -> List[List[str]]:
+    """
+    Las 4 columnas de un bloque, cada una como lista de strings. Sin
+    comentarios ni líneas vacías se usan las líneas tal cual; el conteo de
+    comas por línea (map sobre str.count) garantiza 4 campos en cada fila
+    antes del split conjunto.
+    """
+    rows = lines
+    if '#' in text or set(map(str.count, rows, repeat(','))) != {3}:
+        rows = [l for l in lines if l.strip() and not l.lstrip().startswith('#')]
+        if not rows:
+            return []
+        if set(map(str.count, rows, repeat(','))) != {3}:
+            raise ValueError("número de campos")
+    fields = ','.join(rows).split(',')
+    return [fields[k::4] for k in range(4)]
+
+def _bulk_load(path: str, chunk_bytes: int, stats: Optional[ParseStats],
+               fast: Callable[[List[List[str]]], int],
+               slow: Callable[[int, List[str]], int]):
+    """
+    Esqueleto común de la carga masiva. Por bloque, 'fast' valida y convierte
+    columnas completas (map(int) por columna, mínimos y máximos para los
+    rangos) y solo modifica la tabla si todo el bloque es válido; ante un
+    ValueError (o un OverflowError: un entero que no entra en su columna),
+    'slow' re-parsea el bloque línea a línea con las mismas reglas que
+    load_* para reportar el ParseError con su número de línea.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"'{path}' no existe")
+    t0 = time.perf_counter()
+    n_lines = 0
+    n_rows = 0
+    for first, text in _iter_chunks(path, chunk_bytes):
+        lines = text.split('\n')
+        if text.endswith('\n'):
+            lines.pop()
+        n_lines += len(lines)
+        try:
+            cols = _chunk_columns(text, lines)
+            if cols:
+                n_rows += fast(cols)
+        except (ValueError, OverflowError):
+            n_rows += slow(first, lines)
+    if stats is not None:
+        stats.lines = n_lines
+        stats.rows = n_rows
+        stats.seconds = time.perf_counter() - t0
+
+def load_processes_table(path: str, stats: Optional[ParseStats] = None,
+                         chunk_bytes: int = BULK_CHUNK_BYTES) -> ProcessTable:
+    """
+    Equivalente masivo de load_processes: mismas validaciones y mensajes de
+    ParseError, pero produce directamente un ProcessTable. Si se pasa stats,
+    se completa con líneas, registros y tiempo (lines_per_sec).
+    """
+    table = ProcessTable()
+    ids = table.names.ids
+
+    def fast(cols: List[List[str]]) -> int:
+        pid_s, bt_s, at_s, prio_s = cols
+        pids  = list(map(str.strip, pid_s))
+        bts   = list(map(int, bt_s))
+        ats   = list(map(int, at_s))
+        prios = list(map(int, prio_s))
+        if (min(bts) < 0 or min(ats) < 0 or min(prios) < 0 or max(prios) > 10):
+            raise ValueError("fuera de rango")
+        if len(set(pids)) != len(pids) or any(p in ids for p in pids):
+            raise ValueError("PID duplicado")
+        # Conversión a columnas (puede lanzar OverflowError) antes de tocar la tabla
+        bt_col = array(table.bt.typecode, bts)
+        at_col = array(table.at.typecode, ats)
+        prio_col = array(table.priority.typecode, prios)
+        base = len(table.names.names)
+        table.names.names.extend(pids)
+        ids.update(zip(pids, range(base, base + len(pids))))
+        table.bt.extend(bt_col)
+        table.at.extend(at_col)
+        table.priority.extend(prio_col)
+        return len(pid_s)
+
+    def slow(first: int, lines: List[str]) -> int:
+        seen_pids = set(ids)
+        count = 0
+        for lineno, line in enumerate(lines, start=first):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            p = _parse_process_line(path, lineno, line, seen_pids)
+            table.add(p.pid, p.bt, p.at, p.priority)
+            count += 1
+        return count
+
+    _bulk_load(path, chunk_bytes, stats, fast, slow)
+    return table
+
+def load_actions_table(path: str, stats: Optional[ParseStats] = None,
+                       chunk_bytes: int = BULK_CHUNK_BYTES) -> ActionTable:
+    """Equivalente masivo de load_actions; produce un ActionTable."""
+    table = ActionTable()
+    codes = {name: code for code, name in enumerate(ACTION_CODES)}
+
+    def fast(cols: List[List[str]]) -> int:
+        pid_s, action_s, resource_s, cycle_s = cols
+        actions = [codes[a.strip().upper()] if a.strip().upper() in codes else -1
+                   for a in action_s]
+        cycles  = list(map(int, cycle_s))
+        if (min(actions) < 0 or min(cycles) < 0):
+            raise ValueError("fuera de rango")
+        # Conversión a columnas (puede lanzar OverflowError) antes de internar
+        action_col = array(table.action.typecode, actions)
+        cycle_col = array(table.cycle.typecode, cycles)
+        intern_pid = table.names.intern
+        intern_res = table.resources.intern
+        table.pid_ids.fromlist([intern_pid(p.strip()) for p in pid_s])
+        table.action.extend(action_col)
+        table.resource_ids.fromlist([intern_res(r.strip()) for r in resource_s])
+        table.cycle.extend(cycle_col)
+        return len(pid_s)
+
+    def slow(first: int, lines: List[str]) -> int:
+        count = 0
+        for lineno, line in enumerate(lines, start=first):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            a = _parse_action_line(path, lineno, line)
+            table.add(a.pid, a.action, a.resource, a.cycle)
+            count += 1
+        return count
+
+    _bulk_load(path, chunk_bytes, stats, fast, slow)
+    return table
@@ -0,0 +1,103 @@
+"""
+Cancelación cooperativa y reporte de avance para corridas largas.
+
+Los schedulers y simuladores aceptan un CancelToken y un callback
+progress(hecho, total) opcionales. No revisan en cada iteración: Watch fija
+un umbral (una fracción 1/CHECKS del total) y el bucle solo compara su
+contador con ese umbral, así que el costo es una comparación de enteros
+por iteración y a lo sumo ~CHECKS revisiones por corrida.
+"""
+import signal
+import sys
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+# Revisiones (token y callback) por corrida
+CHECKS = 1000
+# Umbral que un contador nunca alcanza: sin token ni callback no se revisa nada
+NEVER = sys.maxsize
+
+ProgressCallback = Callable[[int, int], None]   # (hecho, total)
+
+class Cancelled(Exception):
+    """La corrida se abortó porque su CancelToken fue cancelado."""
+
+class CancelToken:
+    """
+    Bandera de cancelación. cancel() puede llamarse desde otro hilo o desde
+    un manejador de señales; la corrida la ve en su próxima revisión.
+    """
+
+    def __init__(self):
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        self._cancelled = True
+
+class Watch:
+    """
+    Punto de control de un bucle con un contador creciente ('hecho').
+
+    El bucle compara su contador con 'next' y, al alcanzarlo, llama a
+    check(hecho): lanza Cancelled si el token se canceló, informa el avance
+    y devuelve el próximo umbral.
+    """
+    __slots__ = ("token", "callback", "total", "step", "next")
+
+    def __init__(self, total: int, token: Optional[CancelToken] = None,
+                 progress: Optional[ProgressCallback] = None, checks: int = CHECKS,
+                 always: bool = False):
+        self.token = token
+        self.callback = progress
+        self.total = total
+        self.step = max(1, total // checks)
+        # always: revisar aunque no haya token ni callback (p. ej. para checkpoints)
+        self.next = 0 if always or token is not None or progress is not None else NEVER
+
+    def check(self, done: int) -> int:
+        if self.token is not None and self.token.cancelled:
+            raise Cancelled()
+        if self.callback is not None:
+            self.callback(min(done, self.total), self.total)
+        self.next = done + self.step
+        return self.next
+
+    def finish(self):
+        """La corrida terminó: informa total de total (ya no se cancela)."""
+        if self.callback is not None:
+            self.callback(self.total, self.total)
+
+@contextmanager
+def cancel_on_sigint(token: CancelToken):
+    """
+    Dentro del bloque, Ctrl-C cancela 'token' en vez de lanzar
+    KeyboardInterrupt, así la corrida termina en su próxima revisión y
+    suelta lo calculado. Un segundo Ctrl-C sí interrumpe de inmediato.
+    Solo puede usarse desde el hilo principal.
+    """
+    def handler(signum, frame):
+        token.cancel()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    previous = signal.signal(signal.SIGINT, handler)
+    try:
+        yield token
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+def console_progress(label: str, stream=sys.stderr) -> ProgressCallback:
+    """Callback de avance que reescribe una línea de consola con el porcentaje."""
+    last = [-1]
+    def report(done: int, total: int):
+        pct = 100 * done // total if total else 100
+        if pct == last[0]:
+            return
+        last[0] = pct
+        stream.write(f"\r{label}: {pct:3d}%")
+        if pct == 100:
+            stream.write("\n")
+        stream.flush()
+    return report
@@ -1,145 +1,508 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
-from typing import List
-from backend.models import Process
+from itertools import chain
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple, Union
+from backend.models import Process, Event
+from backend.columnar import ProcessTable, EventTable
+from backend.progress import CancelToken, ProgressCallback, Watch, CHECKS, NEVER
+
+# Los algoritmos aceptan una lista de Process o un ProcessTable. Con un
+# ProcessTable trabajan directo sobre sus columnas y devuelven un EventTable;
+# con una lista devuelven List[Event] como siempre.
+#
+# Todos aceptan además token (CancelToken) y progress(hecho, total): el avance
+# se mide en ciclos simulados sobre una cota del makespan (max(at) + sum(bt)).
+#
+# Cada algoritmo tiene además una versión iter_* que produce los Event a medida
+# que se deciden, sin materializar el timeline (memoria constante en la salida).
+#
+# Con checkpoints (CheckpointLog) guardan su estado cada tanto; con resume
+# (Resume) retoman una corrida anterior desde uno de esos checkpoints, tras
+# agregar al final procesos que llegan después de su ciclo.
+Workload = Union[Sequence[Process], ProcessTable]
+Timeline = Union[List[Event], EventTable]
+
+# Checkpoints por corrida, repartidos entre las revisiones del Watch
+CHECKPOINTS = 32
 
 @dataclass
-class Event:
-    pid: str
-    start: int
-    end: int
+class Checkpoint:
+    """Estado de un scheduler al comienzo de una iteración de su bucle."""
+    __slots__ = ("clock", "admitted", "emitted", "state")
+    clock: int       # ciclo actual
+    admitted: int    # procesos ya admitidos, en orden de llegada
+    emitted: int     # eventos ya emitidos
+    state: tuple     # cola de listos y demás estado propio del algoritmo (copias)
+
+class CheckpointLog:
+    """
+    Checkpoints de una corrida, ordenados por ciclo, y el orden de llegada
+    con el que se tomaron. Un checkpoint sigue valiendo si al workload solo
+    se le agregan, al final, procesos con at > su ciclo: hasta ahí ninguna
+    decisión del scheduler pudo depender de ellos (con at igual al ciclo,
+    Round Robin ya los habría encolado antes de reencolar al que salió).
+    """
+
+    def __init__(self):
+        self.points: List[Checkpoint] = []
+        self.order = array("q")
+        self._countdown = 0
+
+    def begin(self, order: Sequence[int], resume: Optional["Resume"] = None):
+        """Arranca el registro; al reanudar conserva los checkpoints previos."""
+        self.order = array("q", order)
+        self.points = []
+        if resume is not None:
+            # Los anteriores siguen valiendo; el de arranque se vuelve a tomar
+            clock = resume.checkpoint.clock
+            self.points = [c for c in resume.log.points if c.clock < clock]
+        self._countdown = 0
+
+    def offer(self, clock: int, admitted: int, emitted: int, snapshot: Callable[[], tuple]):
+        """Se llama en cada revisión del Watch; guarda uno de cada CHECKS // CHECKPOINTS."""
+        if self._countdown <= 0:
+            self.points.append(Checkpoint(clock, admitted, emitted, snapshot()))
+            self._countdown = CHECKS // CHECKPOINTS
+        self._countdown -= 1
+
+    def latest(self, cycle: int) -> Optional[Checkpoint]:
+        """Último checkpoint válido para procesos nuevos que llegan en 'cycle'."""
+        k = bisect_left([c.clock for c in self.points], cycle)
+        return self.points[k - 1] if k else None
 
-def fifo(processes: List[Process]) -> List[Event]:
-    procs = sorted(processes, key=lambda p: p.at)
+@dataclass
+class Resume:
+    """Desde dónde retomar: checkpoint, su registro y el timeline de esa corrida."""
+    checkpoint: Checkpoint
+    log: CheckpointLog
+    timeline: Timeline
+
+def _columns(processes: Workload):
+    """(pids, bt, at, priority) indexables por id de proceso."""
+    if isinstance(processes, ProcessTable):
+        return processes.names, processes.bt, processes.at, processes.priority
+    return ([p.pid for p in processes], [p.bt for p in processes],
+            [p.at for p in processes], [p.priority for p in processes])
+
+def _arrival_order(at: Sequence[int]) -> List[int]:
+    """Ids de proceso ordenados (estable) por llegada."""
+    return sorted(range(len(at)), key=at.__getitem__)
+
+def _timeline(processes: Workload, pids) -> Tuple[Timeline, Callable[[int, int, int], None]]:
+    """Timeline vacío del tipo adecuado y su función emit(id, start, end)."""
+    if isinstance(processes, ProcessTable):
+        table = EventTable(processes.names)
+        return table, table.add
     timeline: List[Event] = []
-    current = 0
-    for p in procs:
-        if current < p.at:
-            current = p.at
-        start = current
-        end = current + p.bt
-        timeline.append(Event(p.pid, start, end))
-        current = end
+    append = timeline.append
+    return timeline, lambda idx, start, end: append(Event(pids[idx], start, end))
+
+def _copy_prefix(timeline: Timeline, previous: Timeline, count: int):
+    """Agrega a 'timeline' los primeros 'count' eventos de 'previous'."""
+    if isinstance(timeline, EventTable) and isinstance(previous, EventTable):
+        # Mismos ids: el workload nuevo extiende al anterior
+        timeline.pid_ids.extend(previous.pid_ids[:count])
+        timeline.start.extend(previous.start[:count])
+        timeline.end.extend(previous.end[:count])
+    elif isinstance(timeline, EventTable):
+        for e in previous[:count]:
+            timeline.append(e)
+    else:
+        timeline.extend(previous[:count])
+
+def _prepare(processes: Workload, pids, at, checkpoints: Optional[CheckpointLog],
+             resume: Optional[Resume]):
+    """
+    (order, timeline, emit, checkpoint de arranque o None). Al reanudar, el
+    orden de llegada conserva el prefijo ya admitido y solo se ordena el
+    resto (lo pendiente más los procesos nuevos, ids ≥ len(log.order)).
+    """
+    timeline, emit = _timeline(processes, pids)
+    start = None
+    if resume is None:
+        order = _arrival_order(at)
+    else:
+        start = resume.checkpoint
+        old = resume.log.order
+        rest = sorted(chain(old[start.admitted:], range(len(old), len(at))),
+                      key=at.__getitem__)
+        order = old[:start.admitted].tolist() + rest
+        _copy_prefix(timeline, resume.timeline, start.emitted)
+    if checkpoints is not None:
+        checkpoints.begin(order, resume)
+    return order, timeline, emit, start
+
+def _watch(at, bt, token: Optional[CancelToken],
+           progress: Optional[ProgressCallback],
+           checkpoints: Optional[CheckpointLog] = None) -> Watch:
+    """Watch sobre el ciclo actual; la cota solo se calcula si hace falta."""
+    if token is None and progress is None and checkpoints is None:
+        return Watch(0)
+    return Watch(max(at, default=0) + sum(bt), token, progress, always=True)
+
+def _schedule(processes: Workload, steps, params: tuple,
+              token: Optional[CancelToken], progress: Optional[ProgressCallback],
+              checkpoints: Optional[CheckpointLog], resume: Optional[Resume]) -> Timeline:
+    """Corre el generador 'steps' de un algoritmo y materializa su timeline."""
+    columns = _columns(processes)
+    pids, bt, at, _ = columns
+    order, timeline, emit, ck = _prepare(processes, pids, at, checkpoints, resume)
+    watch = _watch(at, bt, token, progress, checkpoints)
+    for idx, start, end in steps(columns, order, watch, ck, checkpoints,
+                                 timeline.__len__, *params):
+        emit(idx, start, end)
     return timeline
 
-def sjf(processes: List[Process]) -> List[Event]:
-    procs = sorted(processes, key=lambda p: p.at)
-    ready: List[Process] = []
-    timeline: List[Event] = []
-    current = 0
-    i = 0
-    while i < len(procs) or ready:
+def _stream(processes: Workload, steps, params: tuple,
+            token: Optional[CancelToken],
+            progress: Optional[ProgressCallback]) -> Iterator[Event]:
+    """Los eventos de 'steps' a medida que se deciden, sin guardar el timeline."""
+    columns = _columns(processes)
+    pids, bt, at, _ = columns
+    watch = _watch(at, bt, token, progress)
+    for idx, start, end in steps(columns, _arrival_order(at), watch, None, None,
+                                 None, *params):
+        yield Event(pids[idx], start, end)
+
+# Generadores de cada algoritmo: emiten (id de proceso, start, end) en orden.
+# 'ck' es el checkpoint desde donde arrancar (o None) y 'emitted()' cuenta lo
+# ya emitido, para los checkpoints que se tomen en el camino.
+
+def _fifo_steps(columns, order, watch: Watch, ck: Optional[Checkpoint],
+                checkpoints: Optional[CheckpointLog], emitted):
+    _, bt, at, _ = columns
+    n = len(order)
+    # El bucle es tan corto que se revisa entre tramos y no en cada proceso
+    size = max(1, n if watch.next == NEVER else n // CHECKS)
+    current, first = (ck.clock, ck.admitted) if ck else (0, 0)
+    for lo in range(first, n, size):
+        if current >= watch.next:
+            watch.check(current)
+            if checkpoints is not None:
+                checkpoints.offer(current, lo, emitted(), tuple)
+        for idx in order[lo:lo + size]:
+            if current < at[idx]:
+                current = at[idx]
+            start = current
+            current += bt[idx]
+            yield idx, start, current
+    watch.finish()
+
+def fifo(processes: Workload, token: Optional[CancelToken] = None,
+         progress: Optional[ProgressCallback] = None,
+         checkpoints: Optional[CheckpointLog] = None,
+         resume: Optional[Resume] = None) -> Timeline:
+    return _schedule(processes, _fifo_steps, (), token, progress, checkpoints, resume)
+
+def iter_fifo(processes: Workload, token: Optional[CancelToken] = None,
+              progress: Optional[ProgressCallback] = None) -> Iterator[Event]:
+    return _stream(processes, _fifo_steps, (), token, progress)
+
+def _sjf_steps(columns, order, watch: Watch, ck: Optional[Checkpoint],
+               checkpoints: Optional[CheckpointLog], emitted):
+    _, bt, at, _ = columns
+    n = len(order)
+    # heap de (bt, orden de llegada)
+    ready: List[Tuple[int, int]] = list(ck.state[0]) if ck else []
+    next_check = watch.next
+    current, i = (ck.clock, ck.admitted) if ck else (0, 0)
+    while i < n or ready:
+        if current >= next_check:
+            next_check = watch.check(current)
+            if checkpoints is not None:
+                checkpoints.offer(current, i, emitted(), lambda: (list(ready),))
         # Añadimos a ready todos los que han llegado
-        while i < len(procs) and procs[i].at <= current:
-            ready.append(procs[i])
+        while i < n and at[order[i]] <= current:
+            heapq.heappush(ready, (bt[order[i]], i))
             i += 1
         if not ready:
-            current = procs[i].at
+            current = at[order[i]]
             continue
         # Elegimos el de menor BT
-        ready.sort(key=lambda p: p.bt)
-        p = ready.pop(0)
+        burst, k = heapq.heappop(ready)
         start = current
-        end = current + p.bt
-        timeline.append(Event(p.pid, start, end))
-        current = end
-    return timeline
+        current += burst
+        yield order[k], start, current
+    watch.finish()
 
-def srt(processes: List[Process]) -> List[Event]:
-    # 1) Orden inicial por llegada
-    procs = sorted(processes, key=lambda p: p.at)
-    remaining = {p.pid: p.bt for p in procs}
-    
-    timeline: List[Event] = []
-    ready: List[Process] = []
-    current = 0
-    i = 0
-    
-    last_pid = None
-    slice_start = 0
-
-    while i < len(procs) or ready:
-        # 2) Añadir al ready todos los que han llegado
-        while i < len(procs) and procs[i].at <= current:
-            ready.append(procs[i])
+def sjf(processes: Workload, token: Optional[CancelToken] = None,
+        progress: Optional[ProgressCallback] = None,
+        checkpoints: Optional[CheckpointLog] = None,
+        resume: Optional[Resume] = None) -> Timeline:
+    """
+    Shortest Job First no-preemptivo.
+
+    El ready es un heap con clave (bt, idx): el índice de llegada reproduce el
+    desempate del antiguo sort estable, así que el orden de despacho no cambia.
+    """
+    return _schedule(processes, _sjf_steps, (), token, progress, checkpoints, resume)
+
+def iter_sjf(processes: Workload, token: Optional[CancelToken] = None,
+             progress: Optional[ProgressCallback] = None) -> Iterator[Event]:
+    return _stream(processes, _sjf_steps, (), token, progress)
+
+def _srt_steps(columns, order, watch: Watch, ck: Optional[Checkpoint],
+               checkpoints: Optional[CheckpointLog], emitted):
+    _, bt, at, _ = columns
+    n = len(order)
+    # heap de (remaining, -at, orden)
+    ready: List[Tuple[int, int, int]] = list(ck.state[0]) if ck else []
+    next_check = watch.next
+    current, i = (ck.clock, ck.admitted) if ck else (0, 0)
+
+    # Proceso en CPU y desde cuándo (su slice aún no se emitió)
+    last_k, slice_start = ck.state[1:] if ck else (None, 0)
+
+    while i < n or ready:
+        if current >= next_check:
+            next_check = watch.check(current)
+            if checkpoints is not None:
+                checkpoints.offer(current, i, emitted(),
+                                  lambda: (list(ready), last_k, slice_start))
+        # 1) Añadir al ready todos los que han llegado
+        while i < n and at[order[i]] <= current:
+            heapq.heappush(ready, (bt[order[i]], -at[order[i]], i))
             i += 1
 
-        # 3) Si no hay nada listo, avanzar al siguiente at
+        # 2) Si no hay nada listo, avanzar al siguiente at
         if not ready:
-            current = procs[i].at
+            current = at[order[i]]
             continue
 
-        # 4) Selección del siguiente proceso:
-        #    menor remaining, y en empate el que llegó más tarde (–p.at)
-        p = min(ready, key=lambda p: (remaining[p.pid], -p.at))
+        # 3) Selección del siguiente proceso
+        rem, neg_at, k = heapq.heappop(ready)
 
-        # 5) Si cambiamos de PID, cerramos slice previo
-        if p.pid != last_pid:
-            if last_pid is not None:
-                timeline.append(Event(last_pid, slice_start, current))
+        # 4) Si cambiamos de proceso, cerramos slice previo
+        if k != last_k:
+            if last_k is not None:
+                yield order[last_k], slice_start, current
             slice_start = current
-            last_pid = p.pid
+            last_k = k
 
-        # 6) Ejecutar un “tick”
-        remaining[p.pid] -= 1
-        current += 1
+        # 5) Ejecutar hasta terminar o hasta la próxima llegada
+        finish = current + rem
+        if i < n and at[order[i]] < finish:
+            next_at = at[order[i]]
+            rem -= next_at - current
+            current = next_at
+            heapq.heappush(ready, (rem, neg_at, k))
+        else:
+            # 6) Terminó: cerramos su slice
+            current = finish
+            yield order[k], slice_start, current
+            last_k = None
 
-        # 7) Si remanentes, se queda en ready; si no, lo sacamos y cerramos slice
-        if remaining[p.pid] == 0:
-            timeline.append(Event(p.pid, slice_start, current))
-            ready.remove(p)
-            last_pid = None
+    watch.finish()
 
-    return timeline
+def srt(processes: Workload, token: Optional[CancelToken] = None,
+        progress: Optional[ProgressCallback] = None,
+        checkpoints: Optional[CheckpointLog] = None,
+        resume: Optional[Resume] = None) -> Timeline:
+    """
+    Shortest Remaining Time dirigido por eventos.
 
-def rr(processes: List[Process], quantum: int) -> List[Event]:
-    procs = sorted(processes, key=lambda p: p.at)
-    queue: List[(Process,int)] = []
-    timeline: List[Event] = []
-    current = 0
-    i = 0
+    En vez de avanzar tick a tick, salta directamente al siguiente punto de
+    decisión (próxima llegada o fin del proceso en CPU). El ready es un heap
+    con clave (remaining, -at, índice): menor remaining primero y, en empate,
+    el que llegó más tarde; el índice de llegada conserva el desempate de la
+    versión por ticks. Costo O(n log n) sin importar la longitud de los bursts.
+    """
+    return _schedule(processes, _srt_steps, (), token, progress, checkpoints, resume)
+
+def iter_srt(processes: Workload, token: Optional[CancelToken] = None,
+             progress: Optional[ProgressCallback] = None) -> Iterator[Event]:
+    return _stream(processes, _srt_steps, (), token, progress)
+
+def _rr_steps(columns, order, watch: Watch, ck: Optional[Checkpoint],
+              checkpoints: Optional[CheckpointLog], emitted,
+              quantum: int, coalesce: bool):
+    _, bt, at, _ = columns
+    n = len(order)
+    # (id de proceso, remaining)
+    queue: Deque[Tuple[int, int]] = deque(ck.state[0]) if ck else deque()
+    next_check = watch.next
+    current, i = (ck.clock, ck.admitted) if ck else (0, 0)
 
-    while i < len(procs) or queue:
-        while i < len(procs) and procs[i].at <= current:
-            queue.append((procs[i], procs[i].bt))
+    while i < n or queue:
+        if current >= next_check:
+            next_check = watch.check(current)
+            if checkpoints is not None:
+                checkpoints.offer(current, i, emitted(), lambda: (tuple(queue),))
+        while i < n and at[order[i]] <= current:
+            queue.append((order[i], bt[order[i]]))
             i += 1
         if not queue:
-            current = procs[i].at
+            current = at[order[i]]
             continue
-        p, rem = queue.pop(0)
+        idx, rem = queue.popleft()
         start = current
-        run = min(quantum, rem)
+        if coalesce and not queue:
+            # Solo: quanta completos hasta cubrir la próxima llegada
+            if i < n:
+                k = max(1, -(-(at[order[i]] - current) // quantum))
+                run = min(rem, k * quantum)
+            else:
+                run = rem
+        else:
+            run = min(quantum, rem)
         current += run
         rem -= run
-        timeline.append(Event(p.pid, start, current))
+        yield idx, start, current
         # Añadimos nuevas llegadas durante esta ejecución
-        while i < len(procs) and procs[i].at <= current:
-            queue.append((procs[i], procs[i].bt))
+        while i < n and at[order[i]] <= current:
+            queue.append((order[i], bt[order[i]]))
             i += 1
         if rem > 0:
-            queue.append((p, rem))
+            queue.append((idx, rem))
 
-    return timeline
+    watch.finish()
 
-def priority_np(processes: List[Process]) -> List[Event]:
-    # Priority non-preemptive; prioridad menor = más alta
-    procs = sorted(processes, key=lambda p: p.at)
-    ready: List[Process] = []
-    timeline: List[Event] = []
-    current = 0
-    i = 0
+def rr(processes: Workload, quantum: int, coalesce: bool = False,
+       token: Optional[CancelToken] = None,
+       progress: Optional[ProgressCallback] = None,
+       checkpoints: Optional[CheckpointLog] = None,
+       resume: Optional[Resume] = None) -> Timeline:
+    """
+    Round Robin sobre un deque.
+
+    Con coalesce=True, si el proceso en CPU está solo en la cola se avanza
+    directamente hasta el fin del quantum en que llega el siguiente proceso
+    (o hasta terminar) y se emite un único Event en vez de uno por quantum.
+    """
+    return _schedule(processes, _rr_steps, (quantum, coalesce),
+                     token, progress, checkpoints, resume)
+
+def iter_rr(processes: Workload, quantum: int, coalesce: bool = False,
+            token: Optional[CancelToken] = None,
+            progress: Optional[ProgressCallback] = None) -> Iterator[Event]:
+    return _stream(processes, _rr_steps, (quantum, coalesce), token, progress)
+
+# Rango de prioridades aceptado por load_processes (0 = más alta)
+PRIORITY_LEVELS = 11
+
+class PriorityBuckets:
+    """
+    Cola de prioridad con un bucket FIFO por prioridad (0–10) y una máscara
+    de bits de buckets no vacíos: encolar cuesta O(1) y desencolar, sin
+    aging, también.
 
-    while i < len(procs) or ready:
-        while i < len(procs) and procs[i].at <= current:
-            ready.append(procs[i])
+    Cada entrada guarda su ciclo de llegada. Con aging, un proceso gana un
+    nivel por cada 'aging' ciclos desde que llegó, así que en cada bucket la
+    cabeza (la que más esperó) es la de mejor nivel: pop solo compara las
+    cabezas, a lo sumo PRIORITY_LEVELS.
+
+    aging: ciclos de espera por nivel ganado (None: sin aging).
+    """
+
+    def __init__(self, aging: Optional[int] = None):
+        self.buckets: List[Deque[Tuple[int, int]]] = [deque() for _ in range(PRIORITY_LEVELS)]
+        self.mask = 0
+        self.size = 0
+        self.aging = aging
+
+    def __len__(self) -> int:
+        return self.size
+
+    def copy(self) -> "PriorityBuckets":
+        other = PriorityBuckets(self.aging)
+        other.buckets = [deque(b) for b in self.buckets]
+        other.mask = self.mask
+        other.size = self.size
+        return other
+
+    def push(self, level: int, idx: int, cycle: int):
+        self.buckets[level].append((cycle, idx))
+        self.mask |= 1 << level
+        self.size += 1
+
+    def pop(self, current: int = 0) -> Tuple[int, int]:
+        """
+        Saca al de mejor nivel en el ciclo 'current' y, entre empatados, al
+        que llegó primero; devuelve (nivel, idx).
+        """
+        mask = self.mask
+        buckets = self.buckets
+        prio = (mask & -mask).bit_length() - 1
+        level = prio
+        aging = self.aging
+        if aging is not None:
+            head = buckets[prio][0]
+            level = prio - (current - head[0]) // aging
+            if level < 0:
+                level = 0
+            mask &= mask - 1
+            while mask:
+                other = (mask & -mask).bit_length() - 1
+                mask &= mask - 1
+                candidate = buckets[other][0]
+                cand_level = other - (current - candidate[0]) // aging
+                if cand_level < 0:
+                    cand_level = 0
+                if cand_level < level or (cand_level == level and candidate < head):
+                    prio, head, level = other, candidate, cand_level
+        bucket = buckets[prio]
+        _, idx = bucket.popleft()
+        if not bucket:
+            self.mask &= ~(1 << prio)
+        self.size -= 1
+        return level, idx
+
+def _priority_steps(columns, order, watch: Watch, ck: Optional[Checkpoint],
+                    checkpoints: Optional[CheckpointLog], emitted,
+                    aging: Optional[int]):
+    pids, bt, at, prio = columns
+    n = len(order)
+    ready = ck.state[0].copy() if ck else PriorityBuckets(aging)
+    next_check = watch.next
+    current, i = (ck.clock, ck.admitted) if ck else (0, 0)
+
+    while i < n or ready:
+        if current >= next_check:
+            next_check = watch.check(current)
+            if checkpoints is not None:
+                checkpoints.offer(current, i, emitted(), lambda: (ready.copy(),))
+        while i < n and at[order[i]] <= current:
+            idx = order[i]
+            if not (0 <= prio[idx] < PRIORITY_LEVELS):
+                raise ValueError(f"Priority fuera de rango 0–10: {prio[idx]} ({pids[idx]})")
+            ready.push(prio[idx], idx, at[idx])
             i += 1
         if not ready:
-            current = procs[i].at
+            current = at[order[i]]
             continue
-        ready.sort(key=lambda p: p.priority)
-        p = ready.pop(0)
+        _, idx = ready.pop(current)
         start = current
-        end = current + p.bt
-        timeline.append(Event(p.pid, start, end))
-        current = end
+        current += bt[idx]
+        yield idx, start, current
+
+    watch.finish()
+
+def _check_aging(aging: Optional[int]):
+    if aging is not None and (not isinstance(aging, int) or aging < 1):
+        raise ValueError(f"Aging inválido ({aging}); debe ser un entero ≥ 1")
+
+def priority_np(processes: Workload, aging: Optional[int] = None,
+                token: Optional[CancelToken] = None,
+                progress: Optional[ProgressCallback] = None,
+                checkpoints: Optional[CheckpointLog] = None,
+                resume: Optional[Resume] = None) -> Timeline:
+    """
+    Priority no-preemptivo; prioridad menor = más alta.
+
+    Usa PriorityBuckets, así que las prioridades deben estar en 0–10 (el mismo
+    rango que valida load_processes). Con aging, un proceso en espera sube un
+    nivel por cada 'aging' ciclos desde su llegada; dentro de un nivel se
+    atiende por orden de llegada, haya subido o no.
+    """
+    _check_aging(aging)
+    return _schedule(processes, _priority_steps, (aging,),
+                     token, progress, checkpoints, resume)
 
-    return timeline
\ No newline at end of file
+def iter_priority_np(processes: Workload, aging: Optional[int] = None,
+                     token: Optional[CancelToken] = None,
+                     progress: Optional[ProgressCallback] = None) -> Iterator[Event]:
+    _check_aging(aging)
+    return _stream(processes, _priority_steps, (aging,), token, progress)
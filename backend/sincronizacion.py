@@ -1,25 +1,52 @@
-from typing import List
-from collections import defaultdict
-from dataclasses import dataclass
-from backend.models import Resource, Action
-from backend.scheduling import Event
+import heapq
+from typing import Dict, Iterable, List, Optional, Union
+from collections import defaultdict, deque
+from operator import attrgetter
+from backend.models import Resource, Action, ActionEvent
+from backend.metrics import SyncStats
+from backend.progress import CancelToken, ProgressCallback, Watch
 
-@dataclass
-class ActionEvent(Event):
-    resource: str
-    status: str  # 'ACCESED' o 'WAITING'
+# rwlock: lecturas concurrentes, escrituras exclusivas. "rwlock" da
+# preferencia a los lectores y "rwlock-writers" a los escritores.
+MODES = ("mutex", "semaphore", "rwlock", "rwlock-writers")
+RW_MODES = ("rwlock", "rwlock-writers")
+
+def _check_mode(mode: str):
+    if mode not in MODES:
+        raise ValueError(f"Modo de sincronización desconocido: '{mode}'")
+
+def _rw_grants(acts: List[Action], mode: str) -> List[bool]:
+    """Qué acciones de un mismo ciclo y recurso acceden bajo un rwlock."""
+    has_read = any(a.action != "WRITE" for a in acts)
+    has_write = any(a.action == "WRITE" for a in acts)
+    if has_read and (mode == "rwlock" or not has_write):
+        # todas las lecturas comparten el recurso; las escrituras esperan
+        return [a.action != "WRITE" for a in acts]
+    # una sola escritura, exclusiva
+    first = next(i for i, a in enumerate(acts) if a.action == "WRITE")
+    return [i == first for i in range(len(acts))]
 
 def simulate_synchronization(
     resources: List[Resource],
     actions: List[Action],
-    mode: str = "mutex"  # o "semaphore"
+    mode: str = "mutex",  # "semaphore", "rwlock" o "rwlock-writers"
+    stats: Optional[SyncStats] = None,
+    token: Optional[CancelToken] = None,
+    progress: Optional[ProgressCallback] = None
 ) -> List[ActionEvent]:
     """
     Para cada ciclo agrupa las acciones y, según el modo:
       - mutex: cap = 1
       - semaphore: cap = cuenta inicial del recurso
+      - rwlock: los READ comparten el recurso y un WRITE lo toma en
+        exclusiva; con lectores y escritores en el mismo ciclo ganan los
+        lectores ("rwlock") o un escritor ("rwlock-writers")
     Decide cuáles ACCESED y el resto WAITING. Cada acción dura 1 ciclo.
+    Si se pasa 'stats', se llena en la misma pasada (quien no accede cuenta
+    como una espera de 1 ciclo y deja la cola al terminar el ciclo).
+    token/progress: cancelación y avance, medido en acciones procesadas.
     """
+    _check_mode(mode)
     # counter inicial por recurso
     counters = {r.name: r.counter for r in resources}  # :contentReference[oaicite:0]{index=0}
     # agrupa acciones por ciclo
@@ -28,7 +55,12 @@ def simulate_synchronization(
         acts_by_cycle[act.cycle].append(act)           # :contentReference[oaicite:1]{index=1}
 
     events: List[ActionEvent] = []
+    watch = Watch(len(actions), token, progress)
+    done = 0
     for cycle in sorted(acts_by_cycle):
+        if done >= watch.next:
+            watch.check(done)
+        done += len(acts_by_cycle[cycle])
         # agrupa por recurso
         por_recurso = defaultdict(list)
         for act in acts_by_cycle[cycle]:
@@ -36,14 +68,18 @@ def simulate_synchronization(
 
         for res_name, acts in por_recurso.items():
             # capacidad según modo
-            if mode == "mutex":
-                cap = 1
-            else:  # semaphore
-                cap = counters.get(res_name, 1)
+            cap = counters.get(res_name, 1) if mode == "semaphore" else 1
+            if mode in RW_MODES:
+                grants = _rw_grants(acts, mode)
+            else:
+                grants = [idx < cap for idx in range(len(acts))]
+
+            if stats is not None:
+                _cycle_stats(stats, res_name, cap, cycle, grants)
 
             # genera ACCESED o WAITING
-            for idx, act in enumerate(acts):
-                status = "ACCESED" if idx < cap else "WAITING"
+            for act, granted in zip(acts, grants):
+                status = "ACCESED" if granted else "WAITING"
                 events.append(
                     ActionEvent(
                         pid      = act.pid,
@@ -53,8 +89,236 @@ def simulate_synchronization(
                         status   = status
                     )
                 )
+    watch.finish()
     return events
 
+def _cycle_stats(stats: SyncStats, resource: str, cap: int, cycle: int,
+                 grants: List[bool]):
+    for granted in grants:
+        stats.arrive(resource, cap, cycle)
+        if granted:
+            stats.grant(resource, cycle, cycle, cycle + 1)
+        else:
+            stats.enqueue(resource, cycle)
+    # al cerrar el ciclo se liberan los accesos y los que esperaban se retiran
+    for granted in grants:
+        if granted:
+            stats.release(resource, cycle + 1)
+        else:
+            stats.give_up(resource, cycle, cycle + 1)
+
+class _ResourceState:
+    __slots__ = ("capacity", "in_use", "writer", "queue", "write_queue")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_use = 0            # accesos activos (en rwlock, lectores activos)
+        self.writer = False        # rwlock: hay un escritor activo
+        self.queue = deque()       # acciones esperando, en orden de llegada
+        self.write_queue = deque() # rwlock: escritores esperando (queue = lectores)
+
+class SyncEngine:
+    """
+    Sincronización por eventos, con colas de espera reales.
+
+    Cada acción llega en su ciclo y pide su recurso. Si hay capacidad libre
+    (mutex: 1, semaphore: counter del recurso) y nadie esperando antes que
+    ella, lo toma por 'hold' ciclos; si no, entra a la cola FIFO del
+    recurso. Al cumplirse el hold se libera el recurso y pasa el siguiente
+    de la cola. Las liberaciones pendientes viven en un heap, así que solo
+    se visitan instantes con eventos: O(n log n) para n acciones.
+
+    En los modos rwlock los READ comparten el recurso y cada WRITE lo toma
+    en exclusiva, con una cola por tipo. "rwlock" prefiere lectores: un
+    READ entra mientras no haya un escritor activo, aunque haya escritores
+    esperando. "rwlock-writers" prefiere escritores: con un escritor en
+    cola no entran nuevos lectores, y al liberarse pasa primero él.
+
+    Por acción se generan un WAITING [llegada, acceso) si tuvo que esperar
+    y un ACCESED [acceso, acceso + hold).
+
+    hold: ciclos que se retiene el recurso; un entero o un dict por tipo de
+          acción, p. ej. {"READ": 1, "WRITE": 3}.
+    """
+
+    def __init__(self, resources: List[Resource], mode: str = "mutex",
+                 hold: Union[int, Dict[str, int]] = 1):
+        _check_mode(mode)
+        holds = hold.values() if isinstance(hold, dict) else [hold]
+        if any(h < 1 for h in holds):
+            raise ValueError("El hold debe ser de al menos 1 ciclo")
+        self.mode = mode
+        self.hold = hold
+        self.counters = {r.name: r.counter for r in resources}
+
+    def _capacity(self, resource: str) -> int:
+        # Solo el semáforo tiene varios permisos; un rwlock es un único lock
+        # (sus lectores lo comparten sin consumir capacidad)
+        if self.mode == "semaphore":
+            return self.counters.get(resource, 1)
+        return 1
+
+    def _hold_of(self, act: Action) -> int:
+        if isinstance(self.hold, dict):
+            return self.hold.get(act.action, 1)
+        return self.hold
+
+    # -- reglas de acceso por modo -------------------------------------------
+
+    def _admit(self, state: _ResourceState, act: Action) -> bool:
+        """¿La acción que llega entra ya? Si no, se encola."""
+        if self.mode not in RW_MODES:
+            return not state.queue and state.in_use < state.capacity
+        if act.action == "WRITE":
+            return not state.writer and state.in_use == 0 and not state.write_queue
+        if self.mode == "rwlock":
+            return not state.writer
+        return not state.writer and not state.write_queue
+
+    def _enqueue(self, state: _ResourceState, act: Action):
+        if self.mode in RW_MODES and act.action == "WRITE":
+            state.write_queue.append(act)
+        else:
+            state.queue.append(act)
+
+    def _next_waiters(self, state: _ResourceState) -> List[Action]:
+        """Acciones de la cola que pasan tras una liberación."""
+        if self.mode not in RW_MODES:
+            take = min(len(state.queue), state.capacity - state.in_use)
+            return [state.queue.popleft() for _ in range(take)]
+        if state.writer:
+            return []
+        if state.queue and (self.mode == "rwlock" or not state.write_queue):
+            readers = list(state.queue)
+            state.queue.clear()
+            return readers
+        if state.write_queue and state.in_use == 0:
+            return [state.write_queue.popleft()]
+        return []
+
+    # -- simulación --------------------------------------------------------
+
+    def run(self, actions: Iterable[Action],
+            stats: Optional[SyncStats] = None,
+            token: Optional[CancelToken] = None,
+            progress: Optional[ProgressCallback] = None) -> List[ActionEvent]:
+        """
+        Simula y devuelve los eventos; si se pasa 'stats', lo llena en la
+        misma pasada. token/progress: cancelación y avance en acciones.
+        """
+        states: Dict[str, _ResourceState] = {}
+        releases = []   # heap de (ciclo, secuencia, recurso, fue_escritura)
+        events: List[ActionEvent] = []
+        seq = 0
+        rw = self.mode in RW_MODES
+
+        def grant(act: Action, now: int):
+            nonlocal seq
+            state = states[act.resource]
+            write = rw and act.action == "WRITE"
+            if write:
+                state.writer = True
+            else:
+                state.in_use += 1
+            if now > act.cycle:
+                events.append(ActionEvent(act.pid, act.cycle, now, act.resource, "WAITING"))
+            end = now + self._hold_of(act)
+            events.append(ActionEvent(act.pid, now, end, act.resource, "ACCESED"))
+            heapq.heappush(releases, (end, seq, act.resource, write))
+            seq += 1
+            if stats is not None:
+                stats.grant(act.resource, act.cycle, now, end)
+
+        def release_until(now: int):
+            # Liberaciones antes que llegadas: lo liberado en t se puede tomar en t
+            while releases and releases[0][0] <= now:
+                t, _, resource, write = heapq.heappop(releases)
+                state = states[resource]
+                if write:
+                    state.writer = False
+                else:
+                    state.in_use -= 1
+                if stats is not None:
+                    stats.release(resource, t)
+                for act in self._next_waiters(state):
+                    grant(act, t)
+
+        # sorted es estable: en un mismo ciclo se respeta el orden de entrada
+        ordered = sorted(actions, key=attrgetter("cycle"))
+        watch = Watch(len(ordered), token, progress)
+        next_check = watch.next
+        for k, act in enumerate(ordered):
+            if k >= next_check:
+                next_check = watch.check(k)
+            release_until(act.cycle)
+            state = states.get(act.resource)
+            if state is None:
+                state = states[act.resource] = _ResourceState(self._capacity(act.resource))
+            if stats is not None:
+                stats.arrive(act.resource, state.capacity, act.cycle)
+            if self._admit(state, act):
+                grant(act, act.cycle)
+            else:
+                self._enqueue(state, act)
+                if stats is not None:
+                    stats.enqueue(act.resource, act.cycle)
+        release_until(float("inf"))
+        watch.finish()
+        return events
+
+def simulate_queued(
+    resources: List[Resource],
+    actions: List[Action],
+    mode: str = "mutex",
+    hold: Union[int, Dict[str, int]] = 1,
+    stats: Optional[SyncStats] = None,
+    token: Optional[CancelToken] = None,
+    progress: Optional[ProgressCallback] = None
+) -> List[ActionEvent]:
+    """Atajo para SyncEngine(resources, mode, hold).run(actions, stats, token, progress)."""
+    return SyncEngine(resources, mode, hold).run(actions, stats, token, progress)
+
+def compare_modes(
+    resources: List[Resource],
+    actions: List[Action],
+    modes: Iterable[str] = ("mutex", "rwlock", "rwlock-writers"),
+    queued: bool = True,
+    hold: Union[int, Dict[str, int]] = 1
+) -> List[Dict]:
+    """
+    Corre la misma traza con cada modo y resume cada corrida; sirve para ver
+    cuánto ganan los rwlock frente a mutex en trazas con muchas lecturas.
+    """
+    rows = []
+    for mode in modes:
+        stats = SyncStats()
+        if queued:
+            simulate_queued(resources, actions, mode, hold, stats)
+        else:
+            simulate_synchronization(resources, actions, mode, stats)
+        m = stats.summary()
+        rows.append({
+            "modo": mode,
+            "accesos": m["acquisitions"],
+            "esperas": m["waits"],
+            "avg_wait": m["avg_wait"],
+            "max_wait": m["max_wait"],
+            "ciclos": m["cycles"],
+            "throughput": m["acquisitions_per_cycle"],
+        })
+    return rows
+
+def format_comparison(rows: List[Dict]) -> str:
+    header = (f"{'Modo':<16} {'Accesos':>9} {'Esperas':>9} {'Avg wait':>9} "
+              f"{'Max wait':>9} {'Ciclos':>9} {'Acc/ciclo':>10}")
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['modo']:<16} {r['accesos']:>9} {r['esperas']:>9} {r['avg_wait']:>9.2f} "
+            f"{r['max_wait']:>9} {r['ciclos']:>9} {r['throughput']:>10.3f}"
+        )
+    return "\n".join(lines)
+
 class SincronizacionSimulator:
     def __init__(self):
         self.processes: List = []
@@ -62,6 +326,7 @@ class SincronizacionSimulator:
         self.actions:   List[Action]   = []
         self.events:    List[ActionEvent] = []
         self.max_cycle: int = 0
+        self.stats = SyncStats()
 
     def load_processes(self, path: str):
         from backend.parsers import load_processes
@@ -75,9 +340,28 @@ class SincronizacionSimulator:
         from backend.parsers import load_actions
         self.actions = load_actions(path)
 
-    def configure(self, mode: str = "mutex"):
-        self.events = simulate_synchronization(self.resources, self.actions, mode)
-        self.max_cycle = max(e.end for e in self.events) if self.events else 0
+    def configure(self, mode: str = "mutex", queued: bool = False,
+                  hold: Union[int, Dict[str, int]] = 1,
+                  token: Optional[CancelToken] = None,
+                  progress: Optional[ProgressCallback] = None):
+        """
+        queued=False: decisión independiente por ciclo (simulate_synchronization).
+        queued=True: colas FIFO por recurso con retención y liberación (SyncEngine).
+        Las métricas de contención se juntan en la misma pasada (get_metrics).
+        Si 'token' se cancela, lanza Cancelled y el simulador queda vacío.
+        Un modo fuera de MODES lanza ValueError sin tocar lo ya simulado.
+        """
+        _check_mode(mode)
+        self.reset()
+        stats = SyncStats()
+        if queued:
+            events = simulate_queued(self.resources, self.actions, mode, hold, stats,
+                                     token, progress)
+        else:
+            events = simulate_synchronization(self.resources, self.actions, mode, stats,
+                                              token, progress)
+        self.events, self.stats = events, stats
+        self.max_cycle = stats.last
 
     def get_events(self) -> List[ActionEvent]:
         return self.events
@@ -85,6 +369,22 @@ class SincronizacionSimulator:
     def get_max_cycle(self) -> int:
         return self.max_cycle
 
+    def get_metrics(self, top: int = 5) -> Dict:
+        """
+        Resumen de la última corrida: accesos, esperas (media y máxima),
+        adquisiciones por ciclo, métricas por recurso ("per_resource") y los
+        'top' recursos con más ciclos de espera ("hot_resources").
+        """
+        metrics = self.stats.summary()
+        metrics["per_resource"] = self.stats.per_resource()
+        metrics["hot_resources"] = [name for name, _ in self.stats.hot_resources(top)]
+        return metrics
+
+    def get_queue_length(self, resource: str) -> List:
+        """Largo de la cola de 'resource' en el tiempo: [(ciclo, largo), ...]."""
+        return self.stats.queue_length(resource)
+
     def reset(self):
         self.events = []
         self.max_cycle = 0
+        self.stats = SyncStats()
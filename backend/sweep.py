@@ -0,0 +1,87 @@
+"""
+Barrido de parámetros: corre todos los algoritmos (y varios quantum de Round
+Robin) sobre el mismo workload en un pool de procesos y junta las métricas
+promedio y el tiempo de pared de cada corrida.
+"""
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.calendarizacion import CalendarizacionSimulator
+
+ALGORITHMS = ("fifo", "sjf", "srt", "round robin", "priority")
+COLUMNS = ("algoritmo", "quantum", "avg_waiting_time", "avg_turnaround_time",
+           "eventos", "max_cycle", "segundos")
+
+# Workload compartido por cada worker (se envía una sola vez vía initializer)
+_workload = None
+
+def _init_worker(processes):
+    global _workload
+    _workload = processes
+
+def _run_one(config: Tuple[str, Optional[int]]) -> Dict:
+    alg, quantum = config
+    t0 = time.perf_counter()
+    sim = CalendarizacionSimulator()
+    sim.processes = _workload
+    sim.configure(alg, quantum)
+    m = sim.get_metrics()
+    elapsed = time.perf_counter() - t0
+    return {
+        "algoritmo": alg,
+        "quantum": quantum,
+        "avg_waiting_time": m["avg_waiting_time"],
+        "avg_turnaround_time": m["avg_turnaround_time"],
+        "eventos": len(sim.get_events()),
+        "max_cycle": sim.get_max_cycle(),
+        "segundos": elapsed,
+    }
+
+def sweep_configs(quanta: Iterable[int],
+                  algorithms: Iterable[str] = ALGORITHMS) -> List[Tuple[str, Optional[int]]]:
+    """Una configuración por algoritmo; Round Robin se repite por cada quantum."""
+    configs = []
+    for alg in algorithms:
+        if alg == "round robin":
+            configs.extend((alg, q) for q in quanta)
+        else:
+            configs.append((alg, None))
+    return configs
+
+def run_sweep(processes, quanta: Iterable[int],
+              algorithms: Iterable[str] = ALGORITHMS,
+              workers: Optional[int] = None) -> List[Dict]:
+    """
+    Corre cada configuración en un ProcessPoolExecutor (workers=None usa
+    todos los núcleos; workers=1 corre en el proceso actual). Devuelve una
+    fila por corrida, en el orden de sweep_configs.
+    """
+    configs = sweep_configs(quanta, algorithms)
+    if workers == 1:
+        _init_worker(processes)
+        return [_run_one(c) for c in configs]
+    workers = min(workers or os.cpu_count() or 1, len(configs)) or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(processes,)) as pool:
+        return list(pool.map(_run_one, configs))
+
+def format_table(rows: List[Dict]) -> str:
+    header = f"{'Algoritmo':<12} {'Q':>4} {'Avg WT':>12} {'Avg TA':>12} {'Eventos':>10} {'Ciclos':>10} {'Tiempo(s)':>10}"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        q = "" if r["quantum"] is None else r["quantum"]
+        lines.append(
+            f"{r['algoritmo']:<12} {q:>4} {r['avg_waiting_time']:>12.2f} "
+            f"{r['avg_turnaround_time']:>12.2f} {r['eventos']:>10} "
+            f"{r['max_cycle']:>10} {r['segundos']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+def write_csv(rows: List[Dict], path: str):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,186 @@
+"""
+Benchmarks de escalado para los schedulers, el simulador de sincronización,
+compute_metrics y la carga de workloads (parseo masivo frente a un acierto
+de WorkloadCache) sobre workloads sintéticos.
+
+Uso:
+    python benchmarks/run_benchmarks.py                      # 10^2 .. 10^5
+    python benchmarks/run_benchmarks.py --max-exp 7          # hasta 10^7
+    python benchmarks/run_benchmarks.py --out bench.json --save-baseline base.json
+    python benchmarks/run_benchmarks.py --baseline base.json # compara y falla si hay regresión
+
+Por cada (target, tamaño) registra el mejor tiempo de pared, memoria pico
+(tracemalloc, en una segunda corrida para no distorsionar el tiempo) y
+eventos/segundo. La salida es JSON; con --baseline se imprime el cociente
+contra la corrida guardada y el proceso termina con código 1 si algún
+target quedó más lento que el umbral.
+"""
+import argparse
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from backend.generador import (WorkloadSpec, ContentionSpec, generate_process_table,
+                               generate_action_table, generate_resources)
+from backend.scheduling import fifo, sjf, srt, rr, priority_np
+from backend.sincronizacion import simulate_synchronization, simulate_queued
+from backend.metrics import compute_metrics
+from backend.parsers import load_processes_table
+from backend.cache import WorkloadCache
+
+TARGETS = ("fifo", "sjf", "srt", "rr", "priority_np", "sync", "sync_queued", "metrics",
+           "parse", "cache_hit")
+
+def _workload_dir(procs) -> str:
+    """Escribe el workload como .txt en un directorio temporal (se borra al salir)."""
+    directory = tempfile.mkdtemp(prefix="sistos-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+    with open(os.path.join(directory, "procesos.txt"), "w", encoding="utf-8") as f:
+        for p in procs:
+            f.write(f"{p.pid},{p.bt},{p.at},{p.priority}\n")
+    return directory
+
+def build_case(target: str, size: int, seed: int) -> Callable[[], object]:
+    """Prepara el workload (fuera de la medición) y devuelve la función a medir."""
+    procs = generate_process_table(WorkloadSpec(n_processes=size, seed=seed))
+    if target == "fifo":
+        return lambda: fifo(procs)
+    if target == "sjf":
+        return lambda: sjf(procs)
+    if target == "srt":
+        return lambda: srt(procs)
+    if target == "rr":
+        return lambda: rr(procs, 4)
+    if target == "priority_np":
+        return lambda: priority_np(procs)
+    if target in ("sync", "sync_queued"):
+        spec = ContentionSpec(n_actions=size, seed=seed, cycles=max(1, size // 4))
+        resources = generate_resources(spec)
+        actions = generate_action_table(spec, procs.names.names)
+        if target == "sync_queued":
+            return lambda: simulate_queued(resources, actions, "semaphore", hold=2)
+        return lambda: simulate_synchronization(resources, actions)
+    if target == "metrics":
+        events = srt(procs)
+        return lambda: (compute_metrics(events, procs), len(events))[1]
+    if target in ("parse", "cache_hit"):
+        directory = _workload_dir(procs)
+        path = os.path.join(directory, "procesos.txt")
+        if target == "parse":
+            return lambda: load_processes_table(path)
+        # La primera carga parsea y guarda el binario; lo medido son aciertos
+        cache = WorkloadCache(directory=os.path.join(directory, "cache"))
+        cache.load_processes(path)
+        return lambda: cache.load_processes(path)
+    raise ValueError(f"Target desconocido: {target}")
+
+def measure(fn: Callable[[], object], memory: bool, repeat: int = 3) -> Dict:
+    """Mejor tiempo de 'repeat' corridas; la memoria se mide aparte."""
+    seconds = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        out = fn()
+        seconds = min(seconds, time.perf_counter() - t0)
+        events = out if isinstance(out, int) else len(out)
+        del out
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak,
+        "events": events,
+        "events_per_sec": events / seconds if seconds else None,
+    }
+
+def run(targets: List[str], min_exp: int, max_exp: int, seed: int, memory: bool,
+        repeat: int = 3) -> List[Dict]:
+    results = []
+    for exp in range(min_exp, max_exp + 1):
+        size = 10 ** exp
+        for target in targets:
+            fn = build_case(target, size, seed)
+            rec = {"target": target, "size": size, **measure(fn, memory, repeat)}
+            results.append(rec)
+            peak = f"{rec['peak_bytes'] / 2**20:9.1f} MB" if rec["peak_bytes"] is not None else "        -"
+            print(f"{target:<12} n={size:<10} {rec['seconds']:9.4f}s {peak} "
+                  f"{rec['events_per_sec'] or 0:14,.0f} ev/s", flush=True)
+    return results
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float,
+            min_seconds: float = 0.01) -> List[Dict]:
+    """
+    Regresiones: mismos (target, size) con tiempo > threshold × baseline.
+    Las corridas del baseline más cortas que min_seconds se muestran pero no
+    cuentan (a esa escala domina el ruido).
+    """
+    base = {(r["target"], r["size"]): r for r in baseline}
+    regressions = []
+    print(f"\n{'target':<12} {'size':>10} {'base(s)':>10} {'ahora(s)':>10} {'ratio':>7}")
+    for r in results:
+        b = base.get((r["target"], r["size"]))
+        if b is None or not b["seconds"]:
+            continue
+        ratio = r["seconds"] / b["seconds"]
+        flag = "  REGRESIÓN" if ratio > threshold and b["seconds"] >= min_seconds else ""
+        print(f"{r['target']:<12} {r['size']:>10} {b['seconds']:>10.4f} {r['seconds']:>10.4f} {ratio:>7.2f}{flag}")
+        if flag:
+            regressions.append({**r, "baseline_seconds": b["seconds"], "ratio": ratio})
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de escalado del simulador")
+    parser.add_argument('--targets', default=",".join(TARGETS),
+                        help=f"Lista separada por comas de {', '.join(TARGETS)}")
+    parser.add_argument('--min-exp', type=int, default=2, help="Tamaño mínimo 10^min-exp")
+    parser.add_argument('--max-exp', type=int, default=5, help="Tamaño máximo 10^max-exp (hasta 7)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help="No medir memoria pico")
+    parser.add_argument('--out', default=None, help="JSON con los resultados")
+    parser.add_argument('--baseline', default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument('--save-baseline', default=None, help="Guarda esta corrida como baseline")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Cociente de tiempo a partir del cual se marca regresión")
+    parser.add_argument('--min-seconds', type=float, default=0.01,
+                        help="Ignora en la comparación corridas del baseline más cortas que esto")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Corridas por caso; se registra el mejor tiempo")
+    args = parser.parse_args()
+
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    for t in targets:
+        if t not in TARGETS:
+            parser.error(f"target desconocido: {t}")
+
+    results = run(targets, args.min_exp, args.max_exp, args.seed,
+                  not args.no_memory, args.repeat)
+    doc = {"python": sys.version.split()[0], "seed": args.seed, "results": results}
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresión(es) sobre el baseline")
+            sys.exit(1)
+        print("\n✅ Sin regresiones")
+
+if __name__ == '__main__':
+    main()
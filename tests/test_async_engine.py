@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from backend.async_engine import AsyncPlaybackEngine, AsyncPlayer, run_many
+from backend.models import Event
+
+EVENTS = [Event('A', 0, 2), Event('B', 2, 3), Event('C', 10, 12)]
+
+def test_pacing_does_not_accumulate_callback_time():
+    stamps = []
+    def on_cycle(cycle, evs):
+        stamps.append(time.monotonic())
+        time.sleep(0.005)   # trabajo por ciclo, menor que el delay
+    engine = AsyncPlaybackEngine(EVENTS, on_cycle, max_cycle=19, delay=0.02)
+    asyncio.run(engine.run())
+    assert len(stamps) == 20
+    # 19 intervalos de 20ms; con time.sleep tras el callback serían ~475ms
+    assert stamps[-1] - stamps[0] < 19 * 0.02 + 0.06
+    assert engine.cycles_per_sec > 0
+
+def test_sparse_playback_visits_event_cycles():
+    seen = []
+    engine = AsyncPlaybackEngine(EVENTS, lambda c, evs: seen.append((c, [e.pid for e in evs])),
+                                 max_cycle=12, delay=0.001, sparse=True)
+    asyncio.run(engine.run())
+    assert seen == [(0, ['A']), (2, ['B']), (10, ['C'])]
+
+def test_seek_skips_ahead():
+    seen = []
+    engine = AsyncPlaybackEngine(EVENTS, lambda c, evs: seen.append(c), max_cycle=12, delay=0.001)
+    engine.seek(10)
+    asyncio.run(engine.run())
+    assert seen == [10, 11, 12]
+
+def test_pause_resume_and_stop_from_another_thread():
+    player = AsyncPlayer()
+    try:
+        seen = []
+        engine = AsyncPlaybackEngine(EVENTS, lambda c, evs: seen.append(c), max_cycle=1000, delay=0.01)
+        future = player.submit(engine.run())
+        time.sleep(0.05)
+        player.call(engine.pause)
+        time.sleep(0.03)
+        frozen = len(seen)
+        time.sleep(0.05)
+        assert len(seen) == frozen and engine.paused
+        player.call(engine.resume)
+        time.sleep(0.05)
+        assert len(seen) > frozen
+        player.call(engine.stop)
+        future.result(timeout=1)
+        assert seen[-1] < 1000
+    finally:
+        player.close()
+
+def test_run_many_plays_timelines_concurrently():
+    seen = {'a': [], 'b': []}
+    engines = [
+        AsyncPlaybackEngine(EVENTS, lambda c, evs, k=k: seen[k].append(c), max_cycle=9, delay=0.01)
+        for k in ('a', 'b')
+    ]
+    t0 = time.monotonic()
+    rates = asyncio.run(run_many(engines))
+    # En paralelo tardan lo que uno solo (~0.1s), no la suma
+    assert time.monotonic() - t0 < 0.18
+    assert seen['a'] == seen['b'] == list(range(10))
+    assert len(rates) == 2
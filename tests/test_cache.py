@@ -0,0 +1,179 @@
+import os
+import pytest
+from backend.cache import WorkloadCache
+from backend.parsers import load_processes, load_actions
+
+PROCESOS = "# PID, BT, AT, Prio\nP1, 10, 0, 3\nP2, 4, 1, 1\n"
+ACCIONES = "P1, READ, R1, 0\nP2, WRITE, R2, 1\n"
+
+def write(path, text, mtime=None):
+    path.write_text(text, encoding='utf-8')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+def test_cache_hit_returns_same_workload(tmp_path):
+    src = write(tmp_path / "procesos.txt", PROCESOS)
+    cache = WorkloadCache(str(tmp_path / "cache"))
+    first = cache.load_processes(src)
+    second = cache.load_processes(src)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert list(second) == list(first) == load_processes(src)
+
+def test_cache_actions_roundtrip(tmp_path):
+    src = write(tmp_path / "acciones.txt", ACCIONES)
+    cache = WorkloadCache(str(tmp_path / "cache"))
+    cache.load_actions(src)
+    assert list(cache.load_actions(src)) == load_actions(src)
+    assert cache.hits == 1
+
+def test_modified_source_is_reparsed_and_stale_entry_evicted(tmp_path):
+    path = tmp_path / "procesos.txt"
+    src = write(path, PROCESOS, mtime=1_000_000)
+    cache = WorkloadCache(str(tmp_path / "cache"))
+    cache.load_processes(src)
+    src = write(path, PROCESOS + "P3, 2, 5, 0\n", mtime=2_000_000)
+    table = cache.load_processes(src)
+    assert cache.misses == 2
+    assert [p.pid for p in table] == ['P1', 'P2', 'P3']
+    # La entrada de la versión anterior ya no existe
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+def test_disk_budget_evicts_least_recent(tmp_path):
+    cache_dir = tmp_path / "cache"
+    a = write(tmp_path / "a.txt", PROCESOS)
+    b = write(tmp_path / "b.txt", PROCESOS)
+    cache = WorkloadCache(str(cache_dir))
+    cache.load_processes(a)
+    entry_size = os.path.getsize(next(iter(cache_dir.iterdir())))
+    cache.max_bytes = entry_size + entry_size // 2
+    os.utime(next(iter(cache_dir.iterdir())), (0, 0))  # a: uso más antiguo
+    cache.load_processes(b)
+    assert len(os.listdir(cache_dir)) == 1
+    cache.load_processes(b)
+    assert cache.hits == 1
+
+@pytest.mark.parametrize("cut", [3, 8])
+def test_truncated_workload_entry_is_reparsed(tmp_path, cut):
+    src = write(tmp_path / "procesos.txt", PROCESOS)
+    cache_dir = tmp_path / "cache"
+    cache = WorkloadCache(str(cache_dir))
+    cache.load_processes(src)
+    (entry,) = cache_dir.iterdir()
+    with open(entry, "r+b") as f:
+        f.truncate(os.path.getsize(entry) - cut)
+    assert list(cache.load_processes(src)) == load_processes(src)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert list(cache.load_processes(src)) == load_processes(src)
+    assert cache.hits == 1
+
+# --- ScheduleCache ---
+
+from backend.cache import ScheduleCache, workload_fingerprint
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.columnar import ProcessTable
+from backend.models import Process
+from backend.scheduling import rr, srt
+
+PROCS = [Process('P1', 5, 0, 2), Process('P2', 3, 1, 1), Process('P3', 8, 2, 3)]
+
+def test_fingerprint_ignores_representation_but_not_content():
+    table = ProcessTable.from_processes(PROCS)
+    assert workload_fingerprint(PROCS) == workload_fingerprint(table)
+    changed = PROCS[:2] + [Process('P3', 8, 2, 4)]
+    assert workload_fingerprint(changed) != workload_fingerprint(PROCS)
+
+def test_schedule_cache_memoizes_by_algorithm_and_quantum():
+    cache = ScheduleCache()
+    calls = []
+    def compute(q):
+        calls.append(q)
+        return rr(PROCS, q)
+    first = cache.get_or_compute(PROCS, "Round Robin", lambda: compute(2), quantum=2)
+    again = cache.get_or_compute(list(PROCS), "round robin", lambda: compute(2), quantum=2)
+    cache.get_or_compute(PROCS, "round robin", lambda: compute(3), quantum=3)
+    assert calls == [2, 3]
+    assert again == first == rr(PROCS, 2)
+    # Se entrega una copia: modificarla no toca lo memorizado
+    again.clear()
+    assert cache.get_or_compute(PROCS, "round robin", lambda: compute(2), quantum=2) == first
+    # quantum no cuenta para algoritmos que no lo usan
+    cache.get_or_compute(PROCS, "srt", lambda: srt(PROCS), quantum=2)
+    assert cache.get_or_compute(PROCS, "srt", lambda: 1 / 0, quantum=9) == srt(PROCS)
+
+def test_schedule_cache_lru_under_memory_budget():
+    probe = ScheduleCache()
+    probe.get_or_compute(PROCS, "srt", lambda: srt(PROCS))
+    # Presupuesto para dos timelines: el tercero desaloja al menos usado
+    cache = ScheduleCache(max_bytes=2 * probe.bytes)
+    cache.get_or_compute(PROCS, "fifo", lambda: srt(PROCS))
+    cache.get_or_compute(PROCS, "sjf", lambda: srt(PROCS))
+    cache.get_or_compute(PROCS, "fifo", lambda: 1 / 0)   # fifo pasa a ser el más reciente
+    cache.get_or_compute(PROCS, "srt", lambda: srt(PROCS))
+    assert len(cache) == 2 and cache.bytes <= cache.max_bytes
+    cache.get_or_compute(PROCS, "fifo", lambda: 1 / 0)
+    cache.get_or_compute(PROCS, "sjf", lambda: srt(PROCS))
+    assert (cache.hits, cache.misses) == (2, 4)
+
+def test_schedule_cache_persists_to_disk(tmp_path):
+    directory = str(tmp_path / "cache")
+    ScheduleCache(directory=directory).get_or_compute(PROCS, "srt", lambda: srt(PROCS))
+    fresh = ScheduleCache(directory=directory)
+    assert fresh.get_or_compute(PROCS, "srt", lambda: 1 / 0) == srt(PROCS)
+    # El mismo workload en columnas recibe un EventTable
+    table = ProcessTable.from_processes(PROCS)
+    assert list(fresh.get_or_compute(table, "srt", lambda: 1 / 0)) == srt(PROCS)
+    assert fresh.hits == 2
+    fresh.clear()
+    assert os.listdir(directory) == []
+
+@pytest.mark.parametrize("cut", [3, 8, -1])
+def test_corrupt_schedule_entry_is_a_miss(tmp_path, cut):
+    directory = str(tmp_path / "cache")
+    ScheduleCache(directory=directory).get_or_compute(PROCS, "srt", lambda: srt(PROCS))
+    (entry,) = [os.path.join(directory, name) for name in os.listdir(directory)]
+    with open(entry, "r+b") as f:
+        # cut=-1: queda menos que un encabezado
+        f.truncate(6 if cut < 0 else os.path.getsize(entry) - cut)
+    fresh = ScheduleCache(directory=directory)
+    assert fresh.get_or_compute(PROCS, "srt", lambda: srt(PROCS)) == srt(PROCS)
+    assert (fresh.hits, fresh.misses) == (0, 1)
+    # La entrada rota se reemplazó por una sana
+    assert ScheduleCache(directory=directory).get_or_compute(PROCS, "srt", lambda: 1 / 0) == srt(PROCS)
+
+def test_calendarizacion_simulator_uses_cache():
+    cache = ScheduleCache()
+    for _ in range(2):
+        sim = CalendarizacionSimulator(cache)
+        sim.processes = PROCS
+        sim.configure("Round Robin", 2)
+        assert sim.get_events() == rr(PROCS, 2)
+        assert sim.get_max_cycle() == 16
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_eviction_tolerates_entries_deleted_by_other_processes(tmp_path, monkeypatch):
+    directory = str(tmp_path / "cache")
+    cache = ScheduleCache(directory=directory, max_disk_bytes=0)
+    cache.get_or_compute(PROCS, "srt", lambda: srt(PROCS))
+    # Otro worker borra entradas entre que se listan y se tocan
+    listed = cache._disk_entries
+    ghost = os.path.join(directory, "ghost.sched")
+    monkeypatch.setattr(cache, "_disk_entries", lambda: listed() + [ghost])
+    cache.evict_disk()
+    real_remove = os.remove
+    def racing_remove(path):
+        real_remove(path)
+        raise FileNotFoundError(path)
+    monkeypatch.setattr(os, "remove", racing_remove)
+    assert cache.get_or_compute(PROCS, "fifo", lambda: rr(PROCS, 100)) == rr(PROCS, 100)
+    assert os.listdir(directory) == []
+
+def test_workload_eviction_tolerates_missing_entries(tmp_path, monkeypatch):
+    a = write(tmp_path / "a.txt", PROCESOS)
+    cache = WorkloadCache(str(tmp_path / "cache"), max_bytes=0)
+    listed = cache._entries
+    ghost = str(tmp_path / "cache" / "ghost.bin")
+    monkeypatch.setattr(cache, "_entries", lambda: listed() + [ghost])
+    cache.load_processes(a)
+    cache.load_processes(a)
+    assert cache.misses == 2
@@ -50,6 +50,17 @@ def test_sjf_with_idle():
     # Idle hasta t=3, A:3-5, luego B:5-6
     assert tl == [Event('A', 3, 5), Event('B', 5, 6)]
 
+def test_sjf_tie_keeps_arrival_order():
+    procs = [
+        Process(pid='L', at=0, bt=5, priority=1),
+        Process(pid='B', at=2, bt=2, priority=1),
+        Process(pid='A', at=1, bt=2, priority=1),
+        Process(pid='C', at=3, bt=2, priority=1),
+    ]
+    tl = sjf(procs)
+    # Empate en BT=2 → se respeta el orden de llegada: A, B, C
+    assert [e.pid for e in tl] == ['L', 'A', 'B', 'C']
+
 def test_srt_preemptive_simple():
     procs = [
         Process(pid='P1', at=0, bt=2, priority=1),
@@ -69,6 +80,37 @@ def test_srt_no_preemption():
     tl = srt(procs)
     assert tl == [Event('Z', 0, 3)]
 
+def test_srt_multiple_preemptions():
+    procs = [
+        Process(pid='P1', at=0, bt=8, priority=1),
+        Process(pid='P2', at=1, bt=4, priority=2),
+        Process(pid='P3', at=2, bt=1, priority=3),
+    ]
+    tl = srt(procs)
+    # P1:0-1, P2 llega (4<7) → P2:1-2, P3 llega (1<3) → P3:2-3,
+    # P2 retoma 3-6, P1 retoma 6-13
+    expected = [
+        Event('P1', 0, 1),
+        Event('P2', 1, 2),
+        Event('P3', 2, 3),
+        Event('P2', 3, 6),
+        Event('P1', 6, 13),
+    ]
+    assert tl == expected
+
+def test_srt_long_burst_no_ticks():
+    # Bursts enormes: el motor salta entre llegadas en vez de iterar ciclos
+    procs = [
+        Process(pid='A', at=0, bt=10**9, priority=1),
+        Process(pid='B', at=10**8, bt=5, priority=1),
+    ]
+    tl = srt(procs)
+    assert tl == [
+        Event('A', 0, 10**8),
+        Event('B', 10**8, 10**8 + 5),
+        Event('A', 10**8 + 5, 10**9 + 5),
+    ]
+
 def test_rr_round_robin():
     procs = [
         Process(pid='P1', at=0, bt=3, priority=1),
@@ -93,6 +135,20 @@ def test_rr_with_idle_and_long_quantum():
     # Quantum mayor que burst → se completa en un solo slice
     assert tl == [Event('X', 5, 9)]
 
+def test_rr_coalesce_single_runner():
+    procs = [
+        Process(pid='A', at=0, bt=10, priority=1),
+        Process(pid='B', at=5, bt=2, priority=1),
+    ]
+    # Sin coalesce: un Event por quantum mientras A está sola
+    assert rr(procs, quantum=2)[:3] == [Event('A', 0, 2), Event('A', 2, 4), Event('A', 4, 6)]
+    # Con coalesce: A corre 0-6 de un tirón (B llega a t=5, dentro del 3er quantum)
+    assert rr(procs, quantum=2, coalesce=True) == [
+        Event('A', 0, 6),
+        Event('B', 6, 8),
+        Event('A', 8, 12),
+    ]
+
 def test_priority_non_preemptive():
     procs = [
         Process(pid='P1', at=0, bt=4, priority=3),
@@ -108,3 +164,213 @@ def test_priority_non_preemptive():
         Event('P3', 7, 9),
     ]
     assert tl == expected
+
+def test_priority_ties_fifo_within_level():
+    procs = [
+        Process(pid='L', at=0, bt=5, priority=0),
+        Process(pid='X', at=1, bt=1, priority=4),
+        Process(pid='Y', at=2, bt=1, priority=4),
+        Process(pid='Z', at=3, bt=1, priority=2),
+    ]
+    tl = priority_np(procs)
+    # Z tiene mejor prioridad; X e Y empatan y salen en orden de llegada
+    assert [e.pid for e in tl] == ['L', 'Z', 'X', 'Y']
+
+def test_priority_aging_promotes_waiting_process():
+    procs = [
+        Process(pid='L', at=0, bt=10, priority=0),
+        Process(pid='Old', at=0, bt=1, priority=9),
+        Process(pid='New', at=9, bt=1, priority=5),
+    ]
+    # Sin aging, New (5) gana a Old (9)
+    assert [e.pid for e in priority_np(procs)] == ['L', 'New', 'Old']
+    # Con aging=2, Old espera 10 ciclos → sube 5 niveles hasta 4 y gana
+    assert [e.pid for e in priority_np(procs, aging=2)] == ['L', 'Old', 'New']
+
+def test_priority_aging_keeps_arrival_order_after_promotion():
+    # Con aging=8, en el ciclo 10 A (prio 2, esperó 9) sube al nivel 1, donde
+    # ya está B (prio 1, esperó 7): A llegó antes y sale primero
+    procs = [
+        Process(pid='X', at=0, bt=10, priority=0),
+        Process(pid='A', at=1, bt=1, priority=2),
+        Process(pid='B', at=3, bt=1, priority=1),
+    ]
+    assert [e.pid for e in priority_np(procs, aging=8)] == ['X', 'A', 'B']
+    # La espera que sobra al subir cuenta para el siguiente nivel: en el
+    # ciclo 17 A lleva 16 ciclos (dos niveles) y le gana a E por llegada
+    procs = [
+        Process(pid='X', at=0, bt=10, priority=0),
+        Process(pid='A', at=1, bt=1, priority=2),
+        Process(pid='Y', at=2, bt=7, priority=0),
+        Process(pid='E', at=12, bt=1, priority=0),
+    ]
+    assert [e.pid for e in priority_np(procs, aging=8)] == ['X', 'Y', 'A', 'E']
+
+def test_priority_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        priority_np([Process(pid='X', at=0, bt=1, priority=11)])
+
+# ── Recalendarización incremental ───────────────────────────────────────────
+import random
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.columnar import ProcessTable
+from backend.scheduling import CheckpointLog, Resume
+
+INCREMENTAL = {
+    'fifo': fifo, 'sjf': sjf, 'srt': srt,
+    'rr': lambda p, **kw: rr(p, 3, **kw),
+    'rr_coalesce': lambda p, **kw: rr(p, 2, coalesce=True, **kw),
+    'priority': priority_np,
+    'aging': lambda p, **kw: priority_np(p, 4, **kw),
+}
+
+def _workload(n, span, seed, prefix='P', base=0):
+    rnd = random.Random(seed)
+    return [Process(pid=f'{prefix}{k}', at=base + rnd.randint(0, span),
+                    bt=rnd.randint(1, 12), priority=rnd.randint(0, 10))
+            for k in range(n)]
+
+def _aging_reference(procs, aging):
+    """Nivel = prioridad menos un nivel por cada aging ciclos de espera; empate por llegada."""
+    pending = sorted(range(len(procs)), key=lambda k: (procs[k].at, k))
+    ready, current, out = [], 0, []
+    while pending or ready:
+        while pending and procs[pending[0]].at <= current:
+            ready.append(pending.pop(0))
+        if not ready:
+            current = procs[pending[0]].at
+            continue
+        k = min(ready, key=lambda k: (max(0, procs[k].priority - (current - procs[k].at) // aging),
+                                      procs[k].at, k))
+        ready.remove(k)
+        out.append(Event(procs[k].pid, current, current + procs[k].bt))
+        current += procs[k].bt
+    return out
+
+@pytest.mark.parametrize('aging', [1, 3, 8])
+def test_priority_aging_matches_reference(aging):
+    for seed in range(20):
+        procs = _workload(60, 80, seed)
+        assert priority_np(procs, aging) == _aging_reference(procs, aging)
+
+@pytest.mark.parametrize('name', sorted(INCREMENTAL))
+@pytest.mark.parametrize('table', [False, True])
+def test_resume_matches_full_recompute(name, table):
+    f = INCREMENTAL[name]
+    build = ProcessTable.from_processes if table else list
+    for seed in range(5):
+        procs = _workload(2000, 4000, seed)
+        log = CheckpointLog()
+        first = f(build(procs), checkpoints=log)
+        assert list(first) == list(f(build(procs)))
+        extra = _workload(15, 30, seed, prefix='N', base=2500)
+        checkpoint = log.latest(min(p.at for p in extra))
+        assert checkpoint is not None and checkpoint.clock < 2500
+        workload = build(procs + extra)
+        resumed = f(workload, resume=Resume(checkpoint, log, first))
+        assert list(resumed) == list(f(workload))
+
+def test_checkpoint_must_precede_new_arrivals():
+    log = CheckpointLog()
+    fifo(_workload(500, 1000, 1), checkpoints=log)
+    assert log.points
+    # Un checkpoint en el mismo ciclo de la llegada ya no sirve
+    assert log.latest(0) is None
+    last = log.points[-1]
+    assert log.latest(last.clock) is not last
+    assert log.latest(last.clock + 1) is last
+
+def test_simulator_resumes_after_appending_processes():
+    procs = _workload(1000, 2000, 7)
+    sim = CalendarizacionSimulator(incremental=True)
+    sim.processes = procs
+    sim.configure('round robin', 2)
+    previous = sim.get_events()
+
+    extra = _workload(10, 20, 7, prefix='N', base=1500)
+    sim.processes = procs + extra
+    resume = sim._resume_point(('round robin', 2, None))
+    assert resume is not None and resume.checkpoint.emitted > 0
+    sim.configure('round robin', 2)
+
+    events = sim.get_events()
+    assert events == rr(procs + extra, 2)
+    # El prefijo anterior al checkpoint se reutiliza tal cual
+    cut = resume.checkpoint.emitted
+    assert events[:cut] == previous[:cut]
+
+def test_simulator_does_not_resume_on_changed_workload():
+    procs = _workload(300, 600, 3)
+    sim = CalendarizacionSimulator(incremental=True)
+    sim.processes = procs
+    sim.configure('sjf')
+    # Otro parámetro, otro prefijo o un proceso que llega antes: desde cero
+    changed = [Process(pid='X', at=0, bt=1, priority=0)] + procs[1:]
+    sim.processes = changed + _workload(3, 5, 3, prefix='N', base=800)
+    assert sim._resume_point(('sjf', None, None)) is None
+    sim.processes = procs + _workload(3, 5, 3, prefix='N', base=800)
+    assert sim._resume_point(('fifo', None, None)) is None
+    sim.processes = procs + [Process(pid='E', at=0, bt=2, priority=1)]
+    assert sim._resume_point(('sjf', None, None)) is None
+    sim.configure('sjf')
+    assert sim.get_events() == sjf(sim.processes)
+
+# ── Versiones en streaming ──────────────────────────────────────────────────
+def test_simulator_max_cycle_reads_table_column(monkeypatch):
+    from backend.columnar import EventTable
+    procs = _workload(200, 400, 5)
+    sim = CalendarizacionSimulator()
+    sim.processes = ProcessTable.from_processes(procs)
+    def no_walk(self):
+        raise AssertionError("max_cycle no debería recorrer los eventos")
+    monkeypatch.setattr(EventTable, '__iter__', no_walk)
+    sim.configure('fifo')
+    assert isinstance(sim.get_events(), EventTable)
+    assert sim.get_max_cycle() == max(e.end for e in fifo(procs))
+
+import itertools
+import tracemalloc
+from backend.progress import CancelToken, Cancelled
+from backend.scheduling import iter_fifo, iter_sjf, iter_srt, iter_rr, iter_priority_np
+
+STREAMING = [
+    (fifo, iter_fifo, ()), (sjf, iter_sjf, ()), (srt, iter_srt, ()),
+    (rr, iter_rr, (3,)), (rr, iter_rr, (2, True)),
+    (priority_np, iter_priority_np, ()), (priority_np, iter_priority_np, (4,)),
+]
+
+@pytest.mark.parametrize('full, stream, params', STREAMING)
+@pytest.mark.parametrize('table', [False, True])
+def test_stream_matches_timeline(full, stream, params, table):
+    procs = _workload(1500, 3000, 11)
+    workload = ProcessTable.from_processes(procs) if table else procs
+    assert list(stream(workload, *params)) == list(full(workload, *params))
+
+def test_stream_is_lazy_and_cancellable():
+    procs = _workload(5000, 100, 2)
+    token = CancelToken()
+    events = iter_rr(procs, 1, token=token)
+    # Los primeros eventos salen sin calcular el resto
+    assert len(list(itertools.islice(events, 10))) == 10
+    token.cancel()
+    with pytest.raises(Cancelled):
+        for _ in events:
+            pass
+
+def test_stream_validates_eagerly():
+    with pytest.raises(ValueError):
+        iter_priority_np([Process(pid='X', at=0, bt=1, priority=0)], aging=0)
+
+def test_stream_memory_does_not_grow_with_events():
+    procs = _workload(200, 100, 4)
+    def peak(quantum):
+        tracemalloc.start()
+        count = sum(1 for _ in iter_rr(procs, quantum))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return count, peak
+    few, few_peak = peak(8)
+    many, many_peak = peak(1)
+    assert many > 4 * few
+    # Más eventos no agrandan lo retenido (margen por ruido del allocator)
+    assert many_peak < few_peak * 1.5
@@ -0,0 +1,50 @@
+import pytest
+from backend.columnar import ProcessTable, EventTable, ActionTable, ActionEventTable
+from backend.scheduling import fifo, sjf, srt, rr, priority_np
+from backend.metrics import compute_metrics
+from backend.models import Process, Action, Event, ActionEvent
+
+@pytest.fixture
+def processes():
+    return [
+        Process(pid='P1', at=0, bt=8, priority=3),
+        Process(pid='P2', at=1, bt=4, priority=1),
+        Process(pid='P3', at=2, bt=1, priority=2),
+    ]
+
+def test_process_table_roundtrip(processes):
+    table = ProcessTable.from_processes(processes)
+    assert len(table) == 3
+    assert table[1] == processes[1]
+    assert table[-1] == processes[-1]
+    assert list(table) == processes
+
+def test_process_table_rejects_duplicate_pid():
+    table = ProcessTable()
+    table.add('P1', 1, 0, 0)
+    with pytest.raises(ValueError):
+        table.add('P1', 2, 0, 0)
+
+@pytest.mark.parametrize("alg", [fifo, sjf, srt, priority_np, lambda p: rr(p, 2)])
+def test_schedulers_produce_event_table(processes, alg):
+    table = ProcessTable.from_processes(processes)
+    events = alg(table)
+    assert isinstance(events, EventTable)
+    # Los PIDs no se copian: el timeline comparte la tabla de strings
+    assert events.names is table.names
+    assert list(events) == alg(processes)
+    assert compute_metrics(events, table) == compute_metrics(alg(processes), processes)
+
+def test_event_table_from_events():
+    evs = [Event('A', 0, 2), Event('B', 2, 3), Event('A', 3, 5)]
+    table = EventTable.from_events(evs)
+    assert table == evs
+    assert table[0:2] == evs[0:2]
+    assert len(table.names) == 2
+    assert table.max_end() == 5
+
+def test_action_tables():
+    acts = [Action('P1', 'READ', 'R1', 0), Action('P2', 'WRITE', 'R1', 1)]
+    assert list(ActionTable.from_actions(acts)) == acts
+    aevs = [ActionEvent('P1', 0, 1, 'R1', 'ACCESED'), ActionEvent('P2', 0, 1, 'R1', 'WAITING')]
+    assert list(ActionEventTable.from_events(aevs)) == aevs
@@ -0,0 +1,39 @@
+from backend.engine import SimulationEngine
+from backend.models import Event
+
+EVENTS = [Event('A', 0, 2), Event('B', 2, 3), Event('C', 1000, 1001), Event('D', 1000, 1004)]
+
+def collect(sparse):
+    seen = []
+    engine = SimulationEngine(EVENTS, lambda c, evs: seen.append((c, [e.pid for e in evs])),
+                              max_cycle=1004, sparse=sparse)
+    return engine, seen
+
+def test_dense_visits_every_cycle():
+    engine, seen = collect(sparse=False)
+    engine.run(0)
+    assert len(seen) == 1005
+    assert seen[1000] == (1000, ['C', 'D'])
+
+def test_sparse_skips_idle_cycles():
+    engine, seen = collect(sparse=True)
+    rate = engine.run_headless()
+    assert seen == [(0, ['A']), (2, ['B']), (1000, ['C', 'D'])]
+    assert rate > 0 and engine.cycles_per_sec == rate
+    assert engine.current == engine.max_cycle + 1
+
+def test_sparse_step_and_reset():
+    engine, seen = collect(sparse=True)
+    engine.step()
+    engine.step()
+    assert engine.current == 1000
+    engine.reset()
+    assert engine.current == 0
+    engine.step()
+    assert seen[-1] == (0, ['A'])
+
+def test_sparse_without_events():
+    seen = []
+    engine = SimulationEngine([], lambda c, evs: seen.append(c), max_cycle=0, sparse=True)
+    engine.run_headless()
+    assert seen == []
@@ -0,0 +1,124 @@
+import csv
+from backend.eventlog import write_events
+from backend.models import Event, ActionEvent, Process
+from backend.scheduling import iter_fifo
+
+def _rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+def test_write_events_streams_generator(tmp_path):
+    procs = [Process(pid=f'P{k}', at=k, bt=2, priority=0) for k in range(5)]
+    path = tmp_path / 'tl.csv'
+    assert write_events(iter_fifo(procs), str(path)) == 5
+    rows = _rows(path)
+    assert rows[0] == ['pid', 'start', 'end']
+    assert rows[1:3] == [['P0', '0', '2'], ['P1', '2', '4']]
+
+def test_write_action_events(tmp_path):
+    path = tmp_path / 'sync.csv'
+    events = [ActionEvent('P1', 0, 1, 'R1', 'ACCESED'), ActionEvent('P2', 0, 1, 'R1', 'WAITING')]
+    assert write_events(events, str(path)) == 2
+    rows = _rows(path)
+    assert rows[0] == ['pid', 'start', 'end', 'resource', 'status']
+    assert rows[2] == ['P2', '0', '1', 'R1', 'WAITING']
+
+def test_write_empty(tmp_path):
+    path = tmp_path / 'empty.csv'
+    assert write_events(iter([]), str(path)) == 0
+    assert _rows(path) == [['pid', 'start', 'end']]
+
+# ── Log binario ─────────────────────────────────────────────────────────────
+import pytest
+from backend.columnar import ProcessTable, StringTable
+from backend.engine import SimulationEngine
+from backend.eventlog import write_event_log, log_path, EventLog
+from backend.gantt import GanttLayout, GanttIndex
+from backend.scheduling import rr
+
+@pytest.fixture
+def procs():
+    return [Process(pid=f'P{k}', at=k % 7, bt=3 + k % 5, priority=k % 11) for k in range(40)]
+
+def test_event_log_roundtrip(tmp_path, procs):
+    events = rr(procs, 2)
+    path = str(tmp_path / 'rr.evlog')
+    assert write_event_log(events, path, 'Round Robin') == len(events)
+    with EventLog(path) as log:
+        assert log.label == 'Round Robin' and not log.actions
+        assert len(log) == len(events)
+        assert list(log) == events
+        assert log[3] == events[3] and log[-1] == events[-1] and log[2:5] == events[2:5]
+        assert log.max_end() == max(e.end for e in events)
+        assert list(log.to_table()) == events
+
+def test_event_log_from_table_is_columnar(tmp_path, procs):
+    table = rr(ProcessTable.from_processes(procs), 3)
+    path = str(tmp_path / 'rr.evlog')
+    write_event_log(table, path)
+    with EventLog(path) as log:
+        # Columnas de ancho fijo, alineadas y sin copiar
+        assert isinstance(log.start, memoryview)
+        assert (log.pid_ids.itemsize, log.start.itemsize) == (4, 8)
+        assert list(log.start) == list(table.start)
+        assert log.names.names == table.names.names
+        assert list(log) == list(table)
+
+def test_event_log_action_events(tmp_path):
+    events = [ActionEvent('P1', 0, 1, 'R1', 'ACCESED'), ActionEvent('P2', 0, 1, 'R1', 'WAITING'),
+              ActionEvent('P2', 1, 2, 'R2', 'ACCESED')]
+    path = str(tmp_path / 'sync.evlog')
+    write_event_log(iter(events), path, 'mutex')
+    with EventLog(path) as log:
+        assert log.actions
+        assert log.resources.names == ['R1', 'R2']
+        assert list(log) == events and log[1] == events[1]
+
+def test_event_log_empty(tmp_path):
+    path = str(tmp_path / 'empty.evlog')
+    assert write_event_log([], path) == 0
+    with EventLog(path) as log:
+        assert len(log) == 0 and list(log) == [] and log.max_end() == 0
+
+def test_event_log_rejects_other_files(tmp_path):
+    path = tmp_path / 'x.evlog'
+    path.write_bytes(b'P1, 3, 0, 1\n' * 4)
+    with pytest.raises(ValueError):
+        EventLog(str(path))
+    path.write_bytes(b'SS')
+    with pytest.raises(ValueError):
+        EventLog(str(path))
+
+def test_event_log_feeds_engine_and_gantt(tmp_path, procs):
+    events = rr(procs, 2)
+    path = str(tmp_path / 'rr.evlog')
+    write_event_log(events, path)
+    seen = []
+    with EventLog(path) as log:
+        engine = SimulationEngine(log, lambda c, evs: seen.extend(evs), log.max_end())
+        engine.run_headless()
+        index = GanttIndex(log, GanttLayout(log))
+    assert seen == sorted(events, key=lambda e: e.start)
+    assert index.events_in(0, 0, 10**9) == [e for e in events if e.pid == 'P0']
+
+def test_replay_walks_log_once(tmp_path, procs, monkeypatch, capsys):
+    from backend.main import replay_logs
+    path = str(tmp_path / 'rr.evlog')
+    write_event_log(rr(procs, 2), path, 'rr')
+    passes = []
+    walk = EventLog.__iter__
+    def counting(self):
+        passes.append(self.label)
+        return walk(self)
+    monkeypatch.setattr(EventLog, '__iter__', counting)
+    replay_logs([path], delay=0)
+    assert passes == ['rr']
+    assert 'Simulación finalizada' in capsys.readouterr().out
+
+def test_log_path():
+    assert log_path('/tmp/runs.evlog', 'mutex') == '/tmp/runs-mutex.evlog'
+
+def test_string_table_encode_decode():
+    table = StringTable(['P1', 'Ñandú', 'P3'])
+    assert StringTable.decode(memoryview(table.encode())).names == table.names
+    assert StringTable.decode(StringTable().encode()).names == []
@@ -0,0 +1,93 @@
+import re
+import threading
+
+from backend.gantt import GanttLayout, GanttIndex, FrameQueue, X_SCALE, ROW_HEIGHT
+from backend.models import Event
+
+def test_rows_follow_first_appearance():
+    # Lista desordenada: la fila depende del primer inicio, no de la posición
+    events = [Event('B', 4, 6), Event('A', 0, 2), Event('C', 2, 4), Event('A', 6, 8)]
+    layout = GanttLayout(events)
+    assert layout.rows == {'A': 0, 'C': 1, 'B': 2}
+    assert layout.max_end == 8
+
+def test_explicit_row_order():
+    layout = GanttLayout([Event('P2', 0, 1)], pids=['P1', 'P2', 'P3'])
+    assert layout.rows == {'P1': 0, 'P2': 1, 'P3': 2}
+    assert set(layout.colors) == {'P1', 'P2', 'P3'}
+    assert all(re.fullmatch(r"#[0-9A-F]{6}", c) for c in layout.colors.values())
+
+def test_box_geometry():
+    layout = GanttLayout([Event('A', 0, 2), Event('B', 2, 5)])
+    assert layout.box(Event('B', 2, 5)) == (2 * X_SCALE, ROW_HEIGHT, 5 * X_SCALE, 2 * ROW_HEIGHT - 5)
+
+def test_frame_queue_coalesces_cycles_per_key():
+    frames = FrameQueue()
+    for c in range(5):
+        frames.push('FIFO', c, [Event('A', c, c + 1)])
+        frames.push('SJF', c, [])
+    frame = frames.drain()
+    assert frame.cycle == 4 and not frame.pending and not frame.closed
+    assert [e.start for e in frame.batches['FIFO']] == [0, 1, 2, 3, 4]
+    assert 'SJF' not in frame.batches
+    assert frames.drain().cycle is None
+
+def test_frame_queue_budget_and_close():
+    frames = FrameQueue()
+    for c in range(10):
+        frames.push('k', c, [Event('A', c, c + 1), Event('B', c, c + 1)])
+    frames.close()
+    first = frames.drain(max_events=6)
+    assert len(first.batches['k']) == 6 and first.pending and first.cycle == 2
+    rest = frames.drain()
+    assert len(rest.batches['k']) == 14 and rest.closed
+
+def test_frame_queue_across_threads():
+    frames = FrameQueue()
+    def produce():
+        for c in range(1000):
+            frames.push('k', c, [Event('A', c, c + 1)])
+        frames.close()
+    t = threading.Thread(target=produce)
+    t.start()
+    got = []
+    while True:
+        frame = frames.drain(max_events=50)
+        got.extend(e.start for e in frame.batches.get('k', []))
+        if frame.closed:
+            break
+    t.join()
+    assert got == list(range(1000))
+
+def make_index():
+    # A: tramos cortos separados por huecos de 1 y de 10 ciclos; B: un evento largo
+    events = [Event('A', 0, 2), Event('A', 3, 5), Event('A', 15, 16),
+              Event('B', 0, 40), Event('A', 50, 52)]
+    return GanttIndex(events, GanttLayout(events))
+
+def test_index_window_query():
+    index = make_index()
+    assert [(e.start, e.end) for e in index.events_in(0, 4, 20)] == [(3, 5), (15, 16)]
+    # El evento largo de B empieza antes de la ventana pero la atraviesa
+    assert [(e.start, e.end) for e in index.events_in(1, 30, 35)] == [(0, 40)]
+    assert index.events_in(0, 5, 15) == []
+    assert [e.start for e in index.events_in(0, 0, 100, until=3)] == [0, 3]
+
+def test_index_summary_bars_merge_subpixel_gaps():
+    index = make_index()
+    bars = index.bars_in(0, 0, 100, cycles_per_px=2)     # nivel 1: hueco < 2 se funde
+    assert [(b.start, b.end, b.count) for b in bars] == [(0, 5, 2), (15, 16, 1), (50, 52, 1)]
+    bars = index.bars_in(0, 0, 100, cycles_per_px=16)    # nivel 4: hueco < 16 se funde
+    assert [(b.start, b.end, b.count) for b in bars] == [(0, 16, 3), (50, 52, 1)]
+    # Solo lo reproducido: la barra se recorta al último end revelado
+    bars = index.bars_in(0, 0, 100, cycles_per_px=16, until=3)
+    assert [(b.start, b.end) for b in bars] == [(0, 5)]
+
+def test_index_visible_switches_level_of_detail():
+    index = make_index()
+    events, bars = index.visible(0, 100, 0, 2, cycles_per_px=1 / X_SCALE)
+    assert len(events) == 5 and bars == []
+    events, bars = index.visible(0, 100, 0, 2, cycles_per_px=64)
+    assert events == [] and [(b.row, b.start, b.end) for b in bars] == [(0, 0, 52), (1, 0, 40)]
+    # Filas fuera de rango se ignoran
+    assert index.visible(0, 100, 5, 10, cycles_per_px=1) == ([], [])
@@ -0,0 +1,47 @@
+import pytest
+from backend.generador import (
+    WorkloadSpec, ContentionSpec, iter_processes, process_batches,
+    generate_process_table, iter_actions, generate_action_table, generate_resources,
+)
+from backend.scheduling import fifo, srt
+from backend.sincronizacion import simulate_synchronization
+
+@pytest.mark.parametrize("arrivals, bursts", [
+    ("poisson", "exponential"), ("bursty", "pareto"),
+])
+def test_generated_workload_is_reproducible(arrivals, bursts):
+    spec = WorkloadSpec(n_processes=500, seed=7, arrivals=arrivals, bursts=bursts)
+    procs = list(iter_processes(spec))
+    assert procs == list(iter_processes(spec))
+    assert list(generate_process_table(spec)) == procs
+    ats = [p.at for p in procs]
+    assert ats == sorted(ats)
+    assert all(p.bt >= 1 and 0 <= p.priority <= 10 for p in procs)
+
+def test_batches_cover_whole_workload():
+    spec = WorkloadSpec(n_processes=250, seed=1)
+    batches = list(process_batches(spec, batch_size=100))
+    assert [len(b) for b in batches] == [100, 100, 50]
+    assert [p for b in batches for p in b] == list(iter_processes(spec))
+
+def test_priority_mix():
+    weights = [0.0] * 11
+    weights[3] = 1.0
+    spec = WorkloadSpec(n_processes=100, seed=2, priority_weights=weights)
+    assert {p.priority for p in iter_processes(spec)} == {3}
+
+def test_generated_workload_drives_schedulers():
+    table = generate_process_table(WorkloadSpec(n_processes=300, seed=4))
+    assert len(fifo(table)) == 300
+    assert sum(e.end - e.start for e in srt(table)) == sum(table.bt)
+
+def test_contention_profile():
+    spec = ContentionSpec(n_actions=2000, seed=5, n_resources=10,
+                          hot_fraction=0.2, hot_share=0.9)
+    acts = list(iter_actions(spec, ["P1", "P2"]))
+    hot = sum(1 for a in acts if a.resource in ("R1", "R2"))
+    assert hot / len(acts) > 0.85
+    assert [a.cycle for a in acts] == sorted(a.cycle for a in acts)
+    assert list(generate_action_table(spec, ["P1", "P2"])) == acts
+    events = simulate_synchronization(generate_resources(spec), acts)
+    assert len(events) == len(acts)
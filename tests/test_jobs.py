@@ -0,0 +1,78 @@
+import pytest
+
+import multiprocessing
+
+from backend import jobs
+from backend.jobs import SimulationPool, run_schedule
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.columnar import ProcessTable
+from backend.sincronizacion import SincronizacionSimulator
+from backend.models import Process, Resource, Action
+
+PROCS = [
+    Process(pid='P1', at=0, bt=5, priority=2),
+    Process(pid='P2', at=1, bt=3, priority=1),
+    Process(pid='P3', at=2, bt=8, priority=3),
+]
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SimulationPool(max_workers=2, cache_dir=str(tmp_path))
+    yield pool
+    pool.shutdown()
+
+def test_schedules_match_running_in_process(pool):
+    algs = ["FIFO", "SRT", "Round Robin"]
+    futures = pool.submit_schedules(PROCS, algs, quantum=2)
+    assert list(futures) == algs
+    for alg, future in futures.items():
+        result = future.result(timeout=30)
+        sim = CalendarizacionSimulator()
+        sim.processes = PROCS
+        sim.configure(alg, 2 if alg == "Round Robin" else None)
+        assert result.events == sim.get_events()
+        assert result.max_cycle == sim.get_max_cycle()
+        assert result.metrics == sim.get_metrics()
+
+def test_columnar_workload_returns_table(pool):
+    table = ProcessTable.from_processes(PROCS)
+    result = pool.submit_schedules(table, ["SJF"])["SJF"].result(timeout=30)
+    assert list(result.events) == run_schedule(PROCS, "sjf").events
+
+def test_errors_surface_through_the_future(pool):
+    future = pool.submit_schedules(PROCS, ["Round Robin"], quantum=0)["Round Robin"]
+    with pytest.raises(ValueError):
+        future.result(timeout=30)
+
+def test_sync_in_pool(pool):
+    resources = [Resource("R1", 1)]
+    actions = [Action(pid=p, action="READ", resource="R1", cycle=0) for p in ("P1", "P2")]
+    result = pool.submit_sync(PROCS, resources, actions, "mutex", queued=True, hold=2).result(timeout=30)
+    sim = SincronizacionSimulator()
+    sim.resources, sim.actions = resources, actions
+    sim.configure("mutex", queued=True, hold=2)
+    assert result.events == sim.get_events()
+    assert result.max_cycle == 4
+    assert result.metrics["waits"] == 1
+
+def test_shutdown_cancels_pending_runs(tmp_path):
+    pool = SimulationPool(max_workers=1, cache_dir=str(tmp_path))
+    futures = [pool.submit_schedules(PROCS, ["FIFO"])["FIFO"] for _ in range(8)]
+    pool.shutdown()
+    assert futures[-1].cancelled()
+
+def test_worker_keeps_a_single_incremental_simulator(tmp_path, monkeypatch):
+    for name in ("_cache", "_generation", "_progress", "_incremental"):
+        monkeypatch.setattr(jobs, name, getattr(jobs, name))
+    generation = multiprocessing.Value("q", 0, lock=False)
+    jobs._init_worker(str(tmp_path), generation,
+                      multiprocessing.Array("d", jobs.PROGRESS_SLOTS, lock=False))
+    run_schedule(PROCS, "FIFO", job=(0, 0))
+    fifo_sim = jobs._incremental[2]
+    run_schedule(PROCS + [Process(pid='P4', at=9, bt=1, priority=0)], "FIFO", job=(0, 0))
+    assert jobs._incremental[2] is fifo_sim
+    run_schedule(PROCS, "SJF", job=(0, 0))
+    assert jobs._incremental[:2] == ("sjf", 0)
+    generation.value = 1
+    run_schedule(PROCS, "SJF", job=(1, 0))
+    assert jobs._incremental[:2] == ("sjf", 1)
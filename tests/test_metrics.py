@@ -0,0 +1,77 @@
+import pytest
+import backend.metrics as metrics
+from backend.metrics import compute_metrics, compute_metric_arrays
+from backend.columnar import ProcessTable, EventTable
+from backend.scheduling import srt, rr
+from backend.models import Process, Event
+
+@pytest.fixture
+def processes():
+    return [
+        Process(pid='P1', at=0, bt=8, priority=1),
+        Process(pid='P2', at=1, bt=4, priority=1),
+        Process(pid='P3', at=2, bt=1, priority=1),
+        Process(pid='P4', at=50, bt=3, priority=1),
+    ]
+
+def test_compute_metrics_basic():
+    procs = [Process(pid='A', at=0, bt=3, priority=1), Process(pid='B', at=1, bt=2, priority=1)]
+    events = [Event('A', 0, 3), Event('B', 3, 5)]
+    m = compute_metrics(events, procs)
+    assert m["per_process"] == {
+        'A': {"waiting_time": 0, "turnaround_time": 3},
+        'B': {"waiting_time": 2, "turnaround_time": 4},
+    }
+    assert m["avg_waiting_time"] == 1.0
+    assert m["avg_turnaround_time"] == 3.5
+
+def test_never_executed_process_counts_zero():
+    procs = [Process(pid='A', at=0, bt=3, priority=1), Process(pid='Z', at=9, bt=1, priority=1)]
+    m = compute_metrics([Event('A', 0, 3)], procs)
+    assert m["per_process"]['Z'] == {"waiting_time": 0, "turnaround_time": 0}
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_columnar_path_matches_list_path(processes, monkeypatch, use_numpy):
+    if use_numpy and metrics.np is None:
+        pytest.skip("NumPy no instalado")
+    if not use_numpy:
+        monkeypatch.setattr(metrics, "np", None)
+    table = ProcessTable.from_processes(processes)
+    for events in (srt(table), rr(table, 2)):
+        expected = compute_metrics(list(events), processes)
+        assert compute_metrics(events, table) == expected
+        # Timeline con su propia tabla de PIDs (sin compartir con el workload)
+        assert compute_metrics(EventTable.from_events(list(events)), table) == expected
+
+def test_metric_arrays_aligned_with_rows(processes):
+    table = ProcessTable.from_processes(processes)
+    turnaround, waiting = compute_metric_arrays(srt(table), table)
+    m = compute_metrics(srt(processes), processes)
+    assert list(turnaround) == [m["per_process"][p.pid]["turnaround_time"] for p in processes]
+    assert list(waiting) == [m["per_process"][p.pid]["waiting_time"] for p in processes]
+
+# ── MetricsStream ───────────────────────────────────────────────────────────
+from backend.metrics import MetricsStream
+from backend.scheduling import iter_rr
+
+def test_metrics_stream_matches_compute_metrics(processes):
+    events = rr(processes, 2)
+    stream = MetricsStream(processes).consume(iter_rr(processes, 2))
+    assert stream.result() == compute_metrics(events, processes)
+    assert stream.events == len(events)
+    assert stream.max_cycle == max(e.end for e in events)
+
+def test_metrics_stream_on_tables(processes):
+    table = ProcessTable.from_processes(processes)
+    stream = MetricsStream(table)
+    passed = list(stream.observe(iter_rr(table, 3)))
+    assert passed == list(rr(table, 3))
+    assert stream.result() == compute_metrics(rr(table, 3), table)
+
+def test_metrics_stream_missing_and_unknown(processes):
+    stream = MetricsStream(processes)
+    stream.add(Event('P1', 0, 8))
+    stream.add(Event('ZZ', 8, 9))
+    result = stream.result()
+    assert result == compute_metrics([Event('P1', 0, 8), Event('ZZ', 8, 9)], processes)
+    assert stream.max_cycle == 9
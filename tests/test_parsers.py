@@ -0,0 +1,96 @@
+import pytest
+from backend.parsers import (
+    load_processes, load_actions, load_processes_table, load_actions_table,
+    ParseError, ParseStats,
+)
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+PROCESOS = """# PID, BT, AT, Prio
+P1,  10,  0,   3
+P2,  4,   1,   1
+
+P3,  8,   2,   4
+"""
+
+ACCIONES = """# PID, ACCION, Recurso, CICLO
+P1,  READ,  R1, 0
+P2,  write, R2, 0
+P1,  WRITE, R1, 3
+"""
+
+@pytest.mark.parametrize("chunk_bytes", [1, 16, 1 << 20])
+def test_bulk_processes_match_line_parser(tmp_path, chunk_bytes):
+    path = write(tmp_path, "procesos.txt", PROCESOS)
+    stats = ParseStats()
+    table = load_processes_table(path, stats, chunk_bytes=chunk_bytes)
+    assert list(table) == load_processes(path)
+    assert stats.lines == 5
+    assert stats.rows == 3
+
+@pytest.mark.parametrize("chunk_bytes", [1, 1 << 20])
+def test_bulk_actions_match_line_parser(tmp_path, chunk_bytes):
+    path = write(tmp_path, "acciones.txt", ACCIONES)
+    table = load_actions_table(path, chunk_bytes=chunk_bytes)
+    assert list(table) == load_actions(path)
+    assert len(table.resources) == 2
+
+@pytest.mark.parametrize("bad_line, msg", [
+    ("P9, 1, 1", "se esperaban 4 campos"),
+    ("P9, x, 1, 1", "valor no entero"),
+    ("P9, 1, 1, 11", "Priority fuera de rango"),
+    ("P2, 1, 1, 1", "PID duplicado"),
+])
+def test_bulk_processes_report_same_error(tmp_path, bad_line, msg):
+    path = write(tmp_path, "procesos.txt", PROCESOS + bad_line + "\nP10, 1, 1, 1\n")
+    with pytest.raises(ParseError) as slow:
+        load_processes(path)
+    with pytest.raises(ParseError) as bulk:
+        load_processes_table(path)
+    assert str(bulk.value) == str(slow.value)
+    assert msg in str(bulk.value)
+    assert ":6 →" in str(bulk.value)
+
+def test_bulk_empty_file(tmp_path):
+    path = write(tmp_path, "vacio.txt", "")
+    assert len(load_processes_table(path)) == 0
+
+def test_bulk_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_processes_table(str(tmp_path / "nope.txt"))
+
+@pytest.mark.parametrize("bad_line", ["P9, 9223372036854775808, 1, 1", "P9, 1, 99999999999999999999, 1"])
+def test_bulk_processes_overflow_is_parse_error(tmp_path, bad_line):
+    path = write(tmp_path, "procesos.txt", PROCESOS + bad_line + "\nP10, 1, 1, 1\n")
+    with pytest.raises(ParseError) as bulk:
+        load_processes_table(path)
+    # Sin tabla a medio llenar, el PID del bloque no se reporta como duplicado
+    assert ":6 →" in str(bulk.value) and "fuera de rango" in str(bulk.value)
+
+@pytest.mark.parametrize("chunk_bytes", [8, 64, 1 << 20])
+def test_both_loaders_reject_over_wide_values_in_line_order(tmp_path, chunk_bytes):
+    # El valor que no entra en 64 bits (línea 2) va antes que el bt negativo (línea 4)
+    text = "P1, 1, 0, 1\nP2, 9223372036854775808, 0, 1\nP3, 1, 0, 1\nP4, -1, 0, 1\n"
+    path = write(tmp_path, "procesos.txt", text)
+    with pytest.raises(ParseError) as slow:
+        load_processes(path)
+    with pytest.raises(ParseError) as bulk:
+        load_processes_table(path, chunk_bytes=chunk_bytes)
+    assert str(bulk.value) == str(slow.value)
+    assert ":2 →" in str(slow.value) and "64 bits" in str(slow.value)
+    path = write(tmp_path, "acciones.txt", "P1, READ, R1, 9223372036854775808\n")
+    with pytest.raises(ParseError) as slow:
+        load_actions(path)
+    with pytest.raises(ParseError) as bulk:
+        load_actions_table(path, chunk_bytes=chunk_bytes)
+    assert str(bulk.value) == str(slow.value)
+
+def test_bulk_actions_overflow_is_parse_error(tmp_path):
+    # Bloques chicos: el bloque que desborda cae a la ruta línea a línea
+    path = write(tmp_path, "acciones.txt", "P1, READ, R1, 0\nP2, READ, R2, 99999999999999999999\n")
+    with pytest.raises(ParseError) as bulk:
+        load_actions_table(path, chunk_bytes=8)
+    assert ":2 →" in str(bulk.value)
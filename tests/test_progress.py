@@ -0,0 +1,97 @@
+import os
+import signal
+
+import pytest
+
+from backend.progress import CancelToken, Cancelled, Watch, cancel_on_sigint
+from backend.scheduling import fifo, sjf, srt, rr, priority_np
+from backend.sincronizacion import simulate_synchronization, simulate_queued, SincronizacionSimulator
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.jobs import SimulationPool
+from backend.columnar import ProcessTable
+from backend.models import Process, Action, Resource
+
+PROCS = [Process(f"P{k}", 1 + k % 7, k // 2, k % 11) for k in range(5000)]
+ACTIONS = [Action(f"P{k}", "READ", f"R{k % 5}", k // 3) for k in range(5000)]
+
+SCHEDULERS = [fifo, sjf, srt, lambda p, **kw: rr(p, 2, **kw), priority_np]
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_progress_is_throttled_monotonic_and_complete(scheduler):
+    seen = []
+    events = scheduler(PROCS, progress=lambda done, total: seen.append((done, total)))
+    assert events == scheduler(PROCS)
+    dones = [d for d, _ in seen]
+    assert dones == sorted(dones)
+    assert seen[-1][0] == seen[-1][1]
+    # Una revisión por cada ~1/1000 del total, no una por iteración
+    assert len(seen) <= 1002
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_cancelled_token_aborts_scheduler(scheduler):
+    token = CancelToken()
+    def progress(done, total):
+        if done > total // 3:
+            token.cancel()
+    with pytest.raises(Cancelled):
+        scheduler(ProcessTable.from_processes(PROCS), token=token, progress=progress)
+
+def test_sync_simulators_report_and_cancel():
+    for simulate in (simulate_synchronization, simulate_queued):
+        seen = []
+        simulate([], ACTIONS, progress=lambda d, t: seen.append(d))
+        assert seen[-1] == len(ACTIONS)
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(Cancelled):
+            simulate([], ACTIONS, token=token)
+
+def test_simulators_are_left_empty_after_cancel():
+    token = CancelToken()
+    sched = CalendarizacionSimulator()
+    sched.processes = PROCS
+    sched.configure("fifo")
+    token.cancel()
+    with pytest.raises(Cancelled):
+        sched.configure("srt", token=token)
+    assert sched.get_events() == [] and sched.get_max_cycle() == 0
+
+    sync = SincronizacionSimulator()
+    sync.resources, sync.actions = [Resource("R0", 1)], ACTIONS
+    sync.configure("mutex")
+    with pytest.raises(Cancelled):
+        sync.configure("mutex", queued=True, token=token)
+    assert sync.get_events() == [] and sync.get_metrics()["acquisitions"] == 0
+
+def test_watch_without_hooks_never_checks():
+    watch = Watch(10 ** 9)
+    assert watch.next > 10 ** 18
+    watch.finish()
+
+def test_sigint_cancels_instead_of_interrupting():
+    def progress(done, total):
+        if done > total // 2:
+            os.kill(os.getpid(), signal.SIGINT)
+    with pytest.raises(Cancelled):
+        with cancel_on_sigint(CancelToken()) as token:
+            srt(PROCS, token=token, progress=progress)
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+def test_pool_cancel_aborts_running_jobs(tmp_path):
+    big = ProcessTable.from_processes(Process(f"P{k}", 1 + k % 9, k, k % 11) for k in range(400_000))
+    pool = SimulationPool(max_workers=1, cache_dir=str(tmp_path))
+    try:
+        future = pool.submit_schedules(big, ["Round Robin"], quantum=1)["Round Robin"]
+        queued = pool.submit_schedules(big, ["SRT"])["SRT"]
+        while pool.progress(future) == 0.0 and not future.done():
+            pass
+        pool.cancel()
+        with pytest.raises(Cancelled):
+            future.result(timeout=30)
+        # Si el executor ya lo había pasado a un worker, aborta en su primera revisión
+        assert queued.cancelled() or isinstance(queued.exception(timeout=30), Cancelled)
+        # El pool sigue sirviendo corridas nuevas
+        small = pool.submit_schedules(PROCS[:10], ["FIFO"])["FIFO"].result(timeout=30)
+        assert small.events == fifo(PROCS[:10])
+    finally:
+        pool.shutdown()
@@ -3,7 +3,12 @@ from backend.sincronizacion import (
     simulate_synchronization,
     SincronizacionSimulator,
     ActionEvent,
+    SyncEngine,
+    simulate_queued,
+    compare_modes,
+    MODES,
 )
+from backend.metrics import SyncStats
 from backend.models import Resource, Action
 
 @pytest.fixture
@@ -93,3 +98,202 @@ def test_sincronizacion_simulator_integration(simple_resources, simple_actions):
     sim.reset()
     assert sim.get_events() == []
     assert sim.get_max_cycle() == 0
+
+# --- Motor por eventos con colas de espera (SyncEngine / simulate_queued) ---
+
+def _timeline(events):
+    return sorted((e.pid, e.start, e.end, e.status) for e in events)
+
+def test_queued_mutex_waiters_are_retried_in_fifo_order():
+    actions = [
+        Action(pid="P1", resource="R1", cycle=0, action="READ"),
+        Action(pid="P2", resource="R1", cycle=0, action="READ"),
+        Action(pid="P3", resource="R1", cycle=1, action="READ"),
+    ]
+    events = simulate_queued([Resource("R1", 5)], actions, mode="mutex", hold=2)
+    assert _timeline(events) == [
+        ("P1", 0, 2, "ACCESED"),
+        ("P2", 0, 2, "WAITING"), ("P2", 2, 4, "ACCESED"),
+        ("P3", 1, 4, "WAITING"), ("P3", 4, 6, "ACCESED"),
+    ]
+
+def test_queued_semaphore_takes_and_releases_counter():
+    actions = [Action(pid=f"P{k}", resource="R2", cycle=0, action="READ") for k in range(3)]
+    actions.append(Action(pid="P9", resource="R2", cycle=3, action="READ"))
+    events = simulate_queued([Resource("R2", 2)], actions, mode="semaphore", hold=3)
+    assert _timeline(events) == [
+        ("P0", 0, 3, "ACCESED"),
+        ("P1", 0, 3, "ACCESED"),
+        ("P2", 0, 3, "WAITING"), ("P2", 3, 6, "ACCESED"),
+        # en t=3 se liberaron dos permisos: P2 toma uno y P9 el otro, sin esperar
+        ("P9", 3, 6, "ACCESED"),
+    ]
+
+def test_queued_hold_per_action_type_and_default_capacity():
+    actions = [
+        Action(pid="W", resource="X", cycle=0, action="WRITE"),
+        Action(pid="R", resource="X", cycle=0, action="READ"),
+    ]
+    events = simulate_queued([], actions, mode="semaphore", hold={"WRITE": 4, "READ": 1})
+    assert _timeline(events) == [
+        ("R", 0, 4, "WAITING"), ("R", 4, 5, "ACCESED"),
+        ("W", 0, 4, "ACCESED"),
+    ]
+
+def test_queued_without_contention_matches_per_cycle():
+    resources = [Resource("A", 1)]
+    actions = [Action(pid=f"P{c}", resource="A", cycle=c, action="READ") for c in (0, 2, 5)]
+    assert simulate_queued(resources, actions) == simulate_synchronization(resources, actions)
+
+def test_queued_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        SyncEngine([], mode="spinlock")
+    with pytest.raises(ValueError):
+        SyncEngine([], hold=0)
+
+def test_simulator_queued_mode(simple_resources, simple_actions):
+    sim = SincronizacionSimulator()
+    sim.resources = simple_resources
+    sim.actions = simple_actions
+    sim.configure(mode="semaphore", queued=True, hold=2)
+    waits = [e for e in sim.get_events() if e.status == "WAITING"]
+    # R1 (counter 1): P2 espera a P1; R2 (counter 2): P5 espera a P3/P4
+    assert [(e.pid, e.start, e.end) for e in waits] == [("P2", 0, 2), ("P5", 1, 3)]
+    assert sim.get_max_cycle() == 5
+
+# --- rwlock: lectores concurrentes, escritores exclusivos ---
+
+def _rw_actions():
+    # R1 y R2 leen en 0, W escribe en 0, R3 lee en 1 (todos sobre "D")
+    return [
+        Action(pid="R1", resource="D", cycle=0, action="READ"),
+        Action(pid="W",  resource="D", cycle=0, action="WRITE"),
+        Action(pid="R2", resource="D", cycle=0, action="READ"),
+        Action(pid="R3", resource="D", cycle=1, action="READ"),
+    ]
+
+def test_rwlock_per_cycle_preferences():
+    readers = simulate_synchronization([], _rw_actions(), mode="rwlock")
+    assert [(e.pid, e.status) for e in readers if e.start == 0] == [
+        ("R1", "ACCESED"), ("W", "WAITING"), ("R2", "ACCESED")]
+    writers = simulate_synchronization([], _rw_actions(), mode="rwlock-writers")
+    assert [(e.pid, e.status) for e in writers if e.start == 0] == [
+        ("R1", "WAITING"), ("W", "ACCESED"), ("R2", "WAITING")]
+    # Sin escrituras en el ciclo, las lecturas siempre comparten
+    assert all(e.status == "ACCESED" for e in writers if e.start == 1)
+
+def test_rwlock_queued_readers_preferred():
+    events = simulate_queued([], _rw_actions(), mode="rwlock", hold=2)
+    # R3 entra junto a los lectores activos aunque W esté esperando
+    assert _timeline(events) == [
+        ("R1", 0, 2, "ACCESED"),
+        ("R2", 0, 2, "ACCESED"),
+        ("R3", 1, 3, "ACCESED"),
+        ("W", 0, 3, "WAITING"), ("W", 3, 5, "ACCESED"),
+    ]
+
+def test_rwlock_queued_writers_preferred():
+    events = simulate_queued([], _rw_actions(), mode="rwlock-writers", hold=2)
+    # Con W en cola ni R2 ni R3 entran: al salir R1 pasa W y después ambos lectores
+    assert _timeline(events) == [
+        ("R1", 0, 2, "ACCESED"),
+        ("R2", 0, 4, "WAITING"), ("R2", 4, 6, "ACCESED"),
+        ("R3", 1, 4, "WAITING"), ("R3", 4, 6, "ACCESED"),
+        ("W", 0, 2, "WAITING"), ("W", 2, 4, "ACCESED"),
+    ]
+
+def test_rwlock_beats_mutex_on_read_heavy_trace():
+    actions = [Action(pid=f"P{k}", resource="D", cycle=k // 4,
+                      action="WRITE" if k % 10 == 0 else "READ") for k in range(200)]
+    rows = {r["modo"]: r for r in compare_modes([Resource("D", 1)], actions, hold=2)}
+    assert rows["mutex"]["accesos"] == rows["rwlock"]["accesos"] == 200
+    assert rows["rwlock"]["throughput"] > 2 * rows["mutex"]["throughput"]
+    assert rows["rwlock"]["avg_wait"] < rows["mutex"]["avg_wait"]
+    assert rows["rwlock-writers"]["avg_wait"] < rows["mutex"]["avg_wait"]
+
+# --- Métricas de contención (SyncStats) ---
+
+def test_sync_stats_queued_mutex():
+    actions = [
+        Action(pid="P1", resource="R1", cycle=0, action="READ"),
+        Action(pid="P2", resource="R1", cycle=0, action="READ"),
+        Action(pid="P3", resource="R1", cycle=1, action="READ"),
+        Action(pid="Q1", resource="R2", cycle=0, action="READ"),
+    ]
+    stats = SyncStats()
+    simulate_queued([Resource("R1", 1), Resource("R2", 1)], actions, hold=2, stats=stats)
+    summary = stats.summary()
+    assert summary["acquisitions"] == summary["arrivals"] == 4
+    # P2 espera 2 ciclos (0→2) y P3 espera 3 (1→4)
+    assert summary["waits"] == 2 and summary["max_wait"] == 3
+    assert summary["avg_wait"] == pytest.approx(5 / 4)
+    assert summary["cycles"] == 6 and summary["peak_acquisitions"] == 2
+
+    r1 = stats.per_resource()["R1"]
+    assert r1["utilization"] == pytest.approx(1.0)
+    assert r1["max_queue"] == 2 and r1["avg_queue"] == pytest.approx(5 / 6)
+    assert stats.queue_length("R1") == [(0, 1), (1, 2), (2, 1), (4, 0)]
+    assert stats.per_resource()["R2"]["utilization"] == pytest.approx(2 / 6)
+    assert [name for name, _ in stats.hot_resources(1)] == ["R1"]
+
+def test_sync_stats_rwlock_readers_do_not_inflate_utilization():
+    stats = SyncStats()
+    simulate_queued([], _rw_actions(), mode="rwlock", hold=2, stats=stats)
+    # D está ocupado de 0 a 5 sin huecos, aunque a ratos lo tengan tres lectores
+    assert stats.per_resource()["D"]["utilization"] == pytest.approx(1.0)
+
+def test_sync_stats_match_events_per_cycle(simple_resources, simple_actions):
+    stats = SyncStats()
+    events = simulate_synchronization(simple_resources, simple_actions, stats=stats)
+    summary = stats.summary()
+    assert summary["acquisitions"] == sum(e.status == "ACCESED" for e in events)
+    assert summary["waits"] == sum(e.status == "WAITING" for e in events)
+
+def test_simulator_exposes_metrics(simple_resources, simple_actions):
+    sim = SincronizacionSimulator()
+    sim.resources = simple_resources
+    sim.actions = simple_actions
+    sim.configure(mode="semaphore", queued=True, hold=2)
+    metrics = sim.get_metrics(top=1)
+    assert metrics["acquisitions"] == 5 and metrics["waits"] == 2
+    # Empate a 2 ciclos de espera: el orden es estable, queda el primero
+    assert metrics["hot_resources"] == ["R1"]
+    assert set(metrics["per_resource"]) == {"R1", "R2"}
+    assert sim.get_queue_length("R2")[-1] == (3, 0)
+    sim.reset()
+    assert sim.get_metrics()["acquisitions"] == 0
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("queued", [False, True])
+def test_sync_stats_utilization_at_most_one(mode, queued):
+    # Contador 3 y diez lectores a la vez: ningún modo puede pasar de 100%
+    resources = [Resource("D", 3)]
+    actions = [Action(pid=f"P{k}", resource="D", cycle=k // 10,
+                      action="WRITE" if k % 7 == 0 else "READ") for k in range(60)]
+    stats = SyncStats()
+    if queued:
+        simulate_queued(resources, actions, mode=mode, hold=3, stats=stats)
+    else:
+        simulate_synchronization(resources, actions, mode=mode, stats=stats)
+    for name in stats.resources:
+        assert 0 < stats.utilization(name) <= 1.0
+
+def test_sync_stats_avg_wait_same_population():
+    actions = [Action(pid=f"P{k}", resource="R", cycle=0, action="READ") for k in range(4)]
+    stats = SyncStats()
+    simulate_queued([Resource("R", 1)], actions, hold=1, stats=stats)
+    # Esperas 0, 1, 2 y 3: la media es sobre las cuatro llegadas
+    r = stats.per_resource()["R"]
+    assert r["avg_wait"] == stats.summary()["avg_wait"] == pytest.approx(6 / 4)
+
+def test_unknown_mode_is_rejected(simple_resources, simple_actions):
+    with pytest.raises(ValueError):
+        simulate_synchronization(simple_resources, simple_actions, mode="semaforo")
+    sim = SincronizacionSimulator()
+    sim.resources, sim.actions = simple_resources, simple_actions
+    sim.configure("mutex")
+    events = sim.get_events()
+    for queued in (False, True):
+        with pytest.raises(ValueError):
+            sim.configure("semaforo", queued=queued)
+    assert sim.get_events() == events
@@ -0,0 +1,29 @@
+from backend.sweep import run_sweep, sweep_configs
+from backend.calendarizacion import CalendarizacionSimulator
+from backend.models import Process
+
+PROCS = [
+    Process(pid='P1', at=0, bt=5, priority=2),
+    Process(pid='P2', at=1, bt=3, priority=1),
+    Process(pid='P3', at=2, bt=8, priority=3),
+]
+
+def test_sweep_configs_expand_quanta():
+    assert sweep_configs([1, 4]) == [
+        ("fifo", None), ("sjf", None), ("srt", None),
+        ("round robin", 1), ("round robin", 4), ("priority", None),
+    ]
+
+def test_sweep_matches_single_runs():
+    rows = run_sweep(PROCS, [2], workers=1)
+    for row in rows:
+        sim = CalendarizacionSimulator()
+        sim.processes = PROCS
+        sim.configure(row["algoritmo"], row["quantum"])
+        m = sim.get_metrics()
+        assert row["avg_waiting_time"] == m["avg_waiting_time"]
+        assert row["eventos"] == len(sim.get_events())
+
+def test_sweep_process_pool_same_results():
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "segundos"} for r in rows]
+    assert strip(run_sweep(PROCS, [1, 3], workers=2)) == strip(run_sweep(PROCS, [1, 3], workers=1))